@@ -0,0 +1,243 @@
+import os
+import tempfile
+
+from typing import Any, Dict, List, Set, Tuple, Callable
+from time import perf_counter
+from argparse import ArgumentParser
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from pycronyms.pycronyms import Pycronyms
+from pycronyms.provider_helper import ProviderHelper
+from pycronyms.providers import Custom
+from pycronyms.providers.wikipedia import COMPUTER_SCIENCE_TITLE, IT_TITLE
+from pycronyms.providers.wikipedia_parser import iter_acronym_pairs
+from pycronyms.page_fixtures import PageFixtures
+from pycronyms.acronym import Acronym
+from pycronyms.language import Language
+from pycronyms.category import Category
+from pycronyms._common import sorted_recursive
+from pycronyms.statistics import PREVIEW_DPI
+from pycronyms.cli.pycronyms_fetch import (
+    EXT_HANDLERS_ACRONYMS,
+    fetch,
+    write_fetch_metadatas,
+    write_markdown_summary,
+)
+
+from benchmarks.wikipedia_parser import generate_list_page, generate_table_page
+
+# The Wikipedia pages, parsed like the provider does
+PAGES: List[Tuple[str, bool, bool]] = [
+    (COMPUTER_SCIENCE_TITLE, True, False),
+    (IT_TITLE, False, True),
+]
+
+
+class StaticProvider(ProviderHelper):
+    """A provider returning already validated acronyms, to measure the merge only."""
+
+    name = "wikipedia"
+
+    def __init__(self, acronyms: Set[Acronym]):
+        super().__init__()
+
+        self.__acronyms = acronyms
+
+    def _fetch_acronyms(self, language: Language, category: Category) -> Set[Acronym]:
+        if language != Language.ENGLISH or category != Category.COMPUTER_SCIENCE:
+            return set()
+
+        return self.__acronyms
+
+
+def record_synthetic_fixtures(fixtures: PageFixtures, amount: int, navbox: int):
+    """Record synthetic Wikipedia pages, when no real page has been recorded.
+
+    Args:
+        fixtures (PageFixtures): The fixtures.
+        amount (int): The amount of acronyms per page.
+        navbox (int): The amount of links in the navigation boxes.
+    """
+
+    fixtures.record(COMPUTER_SCIENCE_TITLE, generate_list_page(amount, navbox), 1)
+    fixtures.record(IT_TITLE, generate_table_page(amount, navbox, seed=1), 1)
+
+
+class Stages:
+    """The best wall time of every pipeline stage."""
+
+    def __init__(self, repeat: int):
+        self.repeat = repeat
+        self.seconds: Dict[str, float] = {}
+
+    def run(self, name: str, f: Callable[[], Any]) -> Any:
+        """Run a stage several times, keeping its best wall time.
+
+        Args:
+            name (str): The stage name.
+            f (Callable[[], Any]): The stage function.
+
+        Returns:
+            Any: The result of the last run.
+        """
+
+        best = float("inf")
+
+        for _ in range(self.repeat):
+            start = perf_counter()
+            result = f()
+            best = min(best, perf_counter() - start)
+
+        self.seconds[name] = best
+
+        return result
+
+
+def run_stages(fixtures: PageFixtures, dir: Path, stages: Stages):
+    """Run the `fetch` pipeline stage by stage, with the same functions.
+
+    Args:
+        fixtures (PageFixtures): The recorded pages.
+        dir (Path): The output directory.
+        stages (Stages): The stage timings.
+    """
+
+    pages = stages.run(
+        "fetch (replay)",
+        lambda: [
+            (fixtures.load(title).html(), lists, tables)
+            for title, lists, tables in PAGES
+        ],
+    )
+
+    pairs = stages.run(
+        "parse",
+        lambda: [
+            pair
+            for html, lists, tables in pages
+            for pair in iter_acronym_pairs((html,), lists, tables)
+        ],
+    )
+
+    def validate() -> Set[Acronym]:
+        acronyms = set()
+
+        for name, meaning in pairs:
+            try:
+                acronyms.add(Acronym(name=name, meaning=meaning, provider="wikipedia"))
+            except ValidationError:
+                continue
+
+        return acronyms
+
+    acronyms = stages.run("validation", validate)
+
+    def merge() -> Pycronyms:
+        pycronyms = Pycronyms()
+        pycronyms.add_provider(Custom())
+        pycronyms.add_provider(StaticProvider(acronyms))
+        pycronyms.fetch_all()
+
+        return pycronyms
+
+    pycronyms = stages.run("merge", merge)
+
+    sorted_acronyms = stages.run("sort", lambda: sorted_recursive(pycronyms.acronyms))
+
+    for ext, handler in EXT_HANDLERS_ACRONYMS.items():
+        filepath = dir / f"acronyms.{ext}"
+        stages.run(f"write {ext}", lambda: handler.write(filepath, sorted_acronyms))
+
+    statistics = pycronyms.statistics
+    statistics.csv_source_path = dir / "statistics.csv"
+    statistics.csv_destination_path = dir / "statistics.csv"
+
+    def write_statistics():
+        write_fetch_metadatas(pycronyms.sources, pycronyms.provider_acronyms, None, dir)
+        statistics.append_to_csv()
+        write_markdown_summary(
+            statistics, dir / "README.md", dir / "acronyms_graph.png"
+        )
+
+    stages.run("statistics", write_statistics)
+    graph_filepath = dir / "acronyms_graph.png"
+
+    stages.run("plot", lambda: statistics.create_plot(graph_filepath))
+    stages.run(
+        "plot (preview)",
+        lambda: statistics.create_plot(
+            dir / "acronyms_graph_preview.png", dpi=PREVIEW_DPI
+        ),
+    )
+    stages.run(
+        "plot (unchanged)",
+        lambda: statistics.create_plot(
+            dir / "acronyms_graph_unchanged.png", graph_filepath
+        ),
+    )
+
+
+def main():
+    """Measure the `pycronyms fetch` pipeline offline, from recorded pages."""
+
+    parser = ArgumentParser(description="End-to-end fetch pipeline benchmark.")
+    parser.add_argument(
+        "--fixtures",
+        type=Path,
+        help="Pages recorded by `pycronyms fetch --record`, synthetic if missing.",
+    )
+    parser.add_argument(
+        "-n",
+        "--amount",
+        default=5_000,
+        type=int,
+        help="Acronyms per synthetic page.",
+    )
+    parser.add_argument("--navbox", default=150, type=int)
+    parser.add_argument("-r", "--repeat", default=3, type=int)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+
+        fixtures = PageFixtures(args.fixtures or tmp_path / "fixtures")
+        if args.fixtures is None:
+            record_synthetic_fixtures(fixtures, args.amount, args.navbox)
+
+        stages_dir = tmp_path / "stages"
+        os.makedirs(stages_dir)
+
+        stages = Stages(args.repeat)
+        run_stages(fixtures, stages_dir, stages)
+
+        replay_dir = fixtures.dirpath.absolute()
+
+        # `fetch` builds in a temporary directory relative to the working directory
+        cwd = os.getcwd()
+        os.chdir(tmp_path)
+        try:
+            stages.run(
+                "fetch() end-to-end",
+                lambda: fetch(Path("output"), replay_dir=replay_dir),
+            )
+        finally:
+            os.chdir(cwd)
+
+    total = sum(
+        seconds
+        for name, seconds in stages.seconds.items()
+        if name != "fetch() end-to-end"
+    )
+
+    print(f"Best of {args.repeat} runs")
+    for name, seconds in stages.seconds.items():
+        share = "" if name == "fetch() end-to-end" else f"{seconds / total:7.1%}"
+        print(f"  {name:20} {seconds:9.4f} s {share}")
+
+    print(f"  {'stages total':20} {total:9.4f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+import random
+
+from typing import Dict, List, Tuple, Iterable, Iterator, Optional
+
+from pycronyms.acronyms import Acronyms, create_acronyms
+from pycronyms.acronym import Acronym
+from pycronyms.language import Language
+from pycronyms.category import Category
+
+SYLLABLES = (
+    "ba co da fi ge ha jo ki lu ma ne po qua ri sa te vi wo xe yu zo tion ware net ser"
+).split()
+
+
+def generate_word(rng: random.Random) -> str:
+    """Returns a pseudo-word made of random syllables.
+
+    Args:
+        rng (random.Random): The random generator.
+
+    Returns:
+        str: The word.
+    """
+
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def generate_meaning(rng: random.Random) -> str:
+    """Returns a pseudo-meaning, every word starting with an uppercase letter.
+
+    Args:
+        rng (random.Random): The random generator.
+
+    Returns:
+        str: The meaning.
+    """
+
+    words = (generate_word(rng) for _ in range(rng.randint(2, 6)))
+
+    return " ".join(word.capitalize() for word in words)
+
+
+# Amount of pseudo-words per initial letter
+WORDS_PER_INITIAL = 256
+
+
+def generate_words_by_initial(seed: int = 0) -> Dict[str, List[str]]:
+    """Returns pseudo-words grouped by their capitalized initial letter, drawing
+    a word from them is much faster than generating one.
+
+    Args:
+        seed (int, optional): The random generator seed. Defaults to 0.
+
+    Returns:
+        Dict[str, List[str]]: The words per initial letter.
+    """
+
+    rng = random.Random(seed)
+    words_by_initial = {}
+
+    for syllable in SYLLABLES:
+        words = words_by_initial.setdefault(syllable[0].upper(), [])
+
+        while len(words) < WORDS_PER_INITIAL:
+            word = syllable + "".join(rng.choices(SYLLABLES, k=rng.randint(1, 3)))
+            words.append(word.capitalize())
+
+    return words_by_initial
+
+
+WORDS_BY_INITIAL = generate_words_by_initial()
+INITIALS = sorted(WORDS_BY_INITIAL)
+
+type Entry = Tuple[Language, Category, str, str, List[str]]
+
+
+def generate_meaning_from_name(rng: random.Random, name: str) -> str:
+    """Returns a pseudo-meaning whose words start with the letters of an acronym name.
+
+    Args:
+        rng (random.Random): The random generator.
+        name (str): The acronym name, made of `INITIALS`.
+
+    Returns:
+        str: The meaning.
+    """
+
+    random_ = rng.random
+
+    return " ".join(
+        WORDS_BY_INITIAL[ch][int(random_() * WORDS_PER_INITIAL)] for ch in name
+    )
+
+
+def spread_weights(amount: int, skew: float) -> List[float]:
+    """Returns Zipf like weights, the first item is the most frequent one.
+
+    Args:
+        amount (int): The amount of weights.
+        skew (float): 0 for a uniform spread, higher values concentrate the weights.
+
+    Returns:
+        List[float]: The weights.
+    """
+
+    return [1 / (i + 1) ** skew for i in range(amount)]
+
+
+def iter_entries(
+    amount: int,
+    seed: int = 0,
+    extras: float = 0.1,
+    languages: Optional[List[Language]] = None,
+    categories: Optional[List[Category]] = None,
+    skew: float = 0.0,
+) -> Iterator[Entry]:
+    """Yields deterministic synthetic entries, without building any object.
+    Every meaning is valid for its acronym name and every name is unique
+    for its language and category.
+
+    Args:
+        amount (int): The amount of acronym names.
+        seed (int, optional): The random generator seed. Defaults to 0.
+        extras (float, optional): The average amount of extra meanings per acronym. Defaults to 0.1.
+        languages (Optional[List[Language]], optional): The languages, every one if None. Defaults to None.
+        categories (Optional[List[Category]], optional): The categories, every one if None. Defaults to None.
+        skew (float, optional): The spread over the languages and categories, 0 is uniform. Defaults to 0.0.
+
+    Yields:
+        Entry: The language, category, name, meaning and extra meanings.
+    """
+
+    rng = random.Random(seed)
+
+    pairs = [
+        (language, category)
+        for language in languages or Language
+        for category in categories or Category
+    ]
+    weights = spread_weights(len(pairs), skew)
+    names = {pair: set() for pair in pairs}
+
+    extras_floor = int(extras)
+    extras_fraction = extras - extras_floor
+
+    # Drawing the pairs by batch is much faster
+    batch = []
+
+    count = 0
+    while count < amount:
+        if not batch:
+            batch = rng.choices(pairs, weights, k=min(amount - count, 10_000))
+
+        pair = batch.pop()
+
+        name = "".join(rng.choices(INITIALS, k=rng.randint(2, 6)))
+        if name in names[pair]:
+            continue
+
+        names[pair].add(name)
+        count += 1
+
+        extras_amount = extras_floor + (rng.random() < extras_fraction)
+
+        yield (
+            *pair,
+            name,
+            generate_meaning_from_name(rng, name),
+            [generate_meaning_from_name(rng, name) for _ in range(extras_amount)],
+        )
+
+
+def generate_acronyms(
+    amount: int,
+    seed: int = 0,
+    extras: float = 0.1,
+    languages: Optional[List[Language]] = None,
+    categories: Optional[List[Category]] = None,
+    skew: float = 0.0,
+) -> Acronyms:
+    """Returns deterministic synthetic acronyms, every entry is valid.
+    See `iter_entries` for the parameters.
+
+    Args:
+        amount (int): The amount of acronym names.
+        seed (int, optional): The random generator seed. Defaults to 0.
+        extras (float, optional): The average amount of extra meanings per acronym. Defaults to 0.1.
+        languages (Optional[List[Language]], optional): The languages, every one if None. Defaults to None.
+        categories (Optional[List[Category]], optional): The categories, every one if None. Defaults to None.
+        skew (float, optional): The spread over the languages and categories, 0 is uniform. Defaults to 0.0.
+
+    Returns:
+        Acronyms: The acronyms.
+    """
+
+    return acronyms_from_entries(
+        iter_entries(amount, seed, extras, languages, categories, skew)
+    )
+
+
+def acronyms_from_entries(entries: Iterable[Entry]) -> Acronyms:
+    """Returns the acronyms of synthetic entries.
+
+    Args:
+        entries (Iterable[Entry]): The entries yielded by `iter_entries`.
+
+    Returns:
+        Acronyms: The acronyms.
+    """
+
+    acronyms = create_acronyms()
+
+    for language, category, name, meaning, extra_meanings in entries:
+        # Generated values are already normalized and valid
+        acronym = Acronym.construct_trusted(name, meaning, "synthetic")
+
+        for extra_meaning in extra_meanings:
+            acronym.add_extra(
+                Acronym.construct_trusted(name, extra_meaning, "synthetic")
+            )
+
+        acronyms[language][category][name] = acronym
+
+    return acronyms
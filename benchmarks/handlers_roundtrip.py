@@ -0,0 +1,82 @@
+import tempfile
+
+from time import perf_counter
+from argparse import ArgumentParser
+from pathlib import Path
+
+from pycronyms.handlers import HandlerJSON, HandlerCSV
+from pycronyms.acronyms import Acronyms, create_acronyms
+from pycronyms.acronym import Acronym
+from pycronyms.language import Language
+from pycronyms.category import Category
+
+from benchmarks.generator import generate_acronyms
+
+import pandas as pd
+
+
+def read_csv_iterrows(filepath: Path) -> Acronyms:
+    """The previous CSV reader, loading a DataFrame then walking it with `iterrows`.
+
+    Args:
+        filepath (Path): The source CSV file path.
+
+    Returns:
+        Acronyms: The acronyms.
+    """
+
+    acronyms = create_acronyms()
+
+    df = pd.read_csv(filepath)
+
+    for _, row in df.iterrows():
+        name, language, category, provider, meaning = list(row)
+
+        acronym = Acronym(name=name, meaning=meaning, provider=provider)
+
+        entry = acronyms[Language(language)][Category(category)]
+
+        if name in entry:
+            entry[name].add_extra(acronym)
+        else:
+            entry[name] = acronym
+
+    return acronyms
+
+
+def main():
+    """Compare a write then read round trip with every handler."""
+
+    parser = ArgumentParser(description="Acronyms handlers round trip benchmark.")
+    parser.add_argument("-n", "--amount", default=100_000, type=int)
+    args = parser.parse_args()
+
+    acronyms = generate_acronyms(args.amount)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        json_filepath = Path(tmp_dir) / "acronyms.json"
+        csv_filepath = Path(tmp_dir) / "acronyms.csv"
+
+        cases = (
+            ("json", json_filepath, HandlerJSON.write, HandlerJSON.read),
+            ("csv", csv_filepath, HandlerCSV.write, HandlerCSV.read),
+            ("csv iterrows", csv_filepath, HandlerCSV.write, read_csv_iterrows),
+        )
+
+        for name, filepath, write, read in cases:
+            start = perf_counter()
+            write(filepath, acronyms)
+            written = perf_counter() - start
+
+            start = perf_counter()
+            read(filepath)
+            read_elapsed = perf_counter() - start
+
+            print(
+                f"{name:14} write {written:8.3f} s   read {read_elapsed:8.3f} s"
+                f"   total {written + read_elapsed:8.3f} s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import sys
+import subprocess
+
+from typing import Dict, List, Tuple
+from argparse import ArgumentParser
+
+# Importing the required dependencies, pydantic is most of the library import time.
+# The budgets are relative to it, so they do not depend on the machine speed.
+REFERENCE = ["-c", "from pydantic import BaseModel, Field, RootModel, model_validator"]
+
+# Commands whose import time is measured, with their budget relative to the reference
+COMMANDS = {
+    "import pycronyms": (["-c", "import pycronyms"], 1.5),
+    "pycronyms guess --help": (
+        ["-m", "pycronyms.cli.pycronyms", "guess", "--help"],
+        2.0,
+    ),
+}
+
+
+def import_times(args: List[str]) -> Tuple[Dict[str, int], int]:
+    """Run a Python process with `-X importtime` and returns the cumulative
+    import time of every imported module and the total import time.
+
+    Args:
+        args (List[str]): The Python arguments.
+
+    Returns:
+        Tuple[Dict[str, int], int]: The cumulative times in microseconds per module and the total.
+    """
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    total = 0
+
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        _, cumulative, module = line.split("|")
+
+        cumulative = cumulative.strip()
+        if not cumulative.isdigit():
+            continue
+
+        times[module.strip()] = int(cumulative)
+
+        # Top level imports are not indented
+        if not module[1:].startswith(" "):
+            total += int(cumulative)
+
+    return times, total
+
+
+def best_import_times(args: List[str], repeat: int) -> Tuple[Dict[str, int], int]:
+    """Returns the import times of the run with the lowest total, see `import_times`.
+
+    Args:
+        args (List[str]): The Python arguments.
+        repeat (int): The amount of runs.
+
+    Returns:
+        Tuple[Dict[str, int], int]: The cumulative times in microseconds per module and the total.
+    """
+
+    runs = [import_times(args) for _ in range(repeat)]
+
+    return min(runs, key=lambda run: run[1])
+
+
+def main():
+    """Measure the import time of the library and of the guess CLI, the best of several runs.
+    It exits with an error if a budget is exceeded."""
+
+    parser = ArgumentParser(description="Import time benchmark.")
+    parser.add_argument("-r", "--repeat", default=5, type=int)
+    parser.add_argument("-t", "--top", default=5, type=int)
+    parser.add_argument(
+        "--scale",
+        default=1.0,
+        type=float,
+        help="Factor applied to the budgets.",
+    )
+    args = parser.parse_args()
+
+    _, reference = best_import_times(REFERENCE, args.repeat)
+    print(f"reference (pydantic): {reference / 1000:.1f} ms")
+
+    exceeded = False
+
+    for name, (command, ratio) in COMMANDS.items():
+        times, total = best_import_times(command, args.repeat)
+
+        budget = int(reference * ratio * args.scale)
+        status = "ok" if total < budget else "over budget"
+        exceeded = exceeded or total >= budget
+
+        print(
+            f"{name}: {total / 1000:.1f} ms, {total / reference:.2f}x the reference"
+            f" (budget {budget / 1000:.0f} ms, {status})"
+        )
+
+        slowest = sorted(times.items(), key=lambda item: item[1], reverse=True)
+        for module, cumulative in slowest[: args.top]:
+            print(f"  {module:40} {cumulative / 1000:8.1f} ms")
+
+    if exceeded:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
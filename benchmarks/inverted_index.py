@@ -0,0 +1,52 @@
+import gc
+import tracemalloc
+
+from time import perf_counter
+from argparse import ArgumentParser
+
+from pycronyms.indexes import IndexInverted
+from pycronyms.language import Language
+
+from benchmarks.generator import generate_acronyms
+
+QUERIES = (("bacoda",), ("serware", "tionnet"), ("maki", "lu", "po"))
+
+
+def main():
+    """Measure the memory and the query time of `IndexInverted`."""
+
+    parser = ArgumentParser(description="Meanings inverted index benchmark.")
+    parser.add_argument("-n", "--amount", default=1_000_000, type=int)
+    args = parser.parse_args()
+
+    acronyms = generate_acronyms(args.amount)
+
+    tracemalloc.start()
+    start = perf_counter()
+    index = IndexInverted(acronyms)
+    build = perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{len(index)} meanings, index built in {build:.3f} s "
+        f"using {peak / 2**20:.1f} MiB"
+    )
+
+    # Avoid a full collection of the freshly built index during the first query
+    gc.collect()
+
+    for terms in QUERIES:
+        for search in (index.search_all, index.search_any):
+            start = perf_counter()
+            results = search(terms, language=Language.ENGLISH)
+            elapsed = perf_counter() - start
+
+            print(
+                f"{search.__name__:10} {' '.join(terms):20} "
+                f"{len(results):8} results in {elapsed * 1e6:10.1f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import tempfile
+
+from time import perf_counter
+from argparse import ArgumentParser
+from pathlib import Path
+
+from pycronyms.handlers.json import HandlerJSON, read_json_file
+from pycronyms.acronyms import GENERATOR_KEY, acronyms_from_dict, dict_from_acronyms
+
+from benchmarks.generator import generate_acronyms
+
+import orjson
+
+
+def main():
+    """Compare the time to load a pycronyms JSON file with and without validation."""
+
+    parser = ArgumentParser(description="JSON acronyms loading benchmark.")
+    parser.add_argument("-n", "--amount", default=100_000, type=int)
+    args = parser.parse_args()
+
+    acronyms = generate_acronyms(args.amount)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filepath = Path(tmp_dir) / "acronyms.json"
+        HandlerJSON.write(filepath, acronyms)
+
+        start = perf_counter()
+        acronyms_dict = read_json_file(filepath)
+        parse = perf_counter() - start
+
+        # Same content, without the generator marker
+        del acronyms_dict[GENERATOR_KEY]
+
+        start = perf_counter()
+        acronyms_from_dict(acronyms_dict)
+        validated = perf_counter() - start
+
+        start = perf_counter()
+        HandlerJSON.read(filepath)
+        trusted = perf_counter() - start
+
+    factor = 100_000 / args.amount
+
+    print(f"Load time per 100k entries ({args.amount} entries generated)")
+    print(f"orjson parse only:  {parse * factor:.3f} s")
+    print(f"validated load:     {(parse + validated) * factor:.3f} s")
+    print(f"trusted load:       {trusted * factor:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
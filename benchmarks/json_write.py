@@ -0,0 +1,69 @@
+import tempfile
+import tracemalloc
+
+from time import perf_counter
+from argparse import ArgumentParser
+from pathlib import Path
+
+from pycronyms.handlers.json import HandlerJSON, write_to_json
+from pycronyms.acronyms import GENERATOR_KEY, GENERATOR_VALUE, dict_from_acronyms
+
+from benchmarks.generator import generate_acronyms
+
+
+def measure(f) -> tuple:
+    """Returns the wall time and the peak of memory allocated by a function.
+    The memory is traced in a second run, tracing slows down every allocation.
+
+    Args:
+        f (Callable[[], Any]): The function.
+
+    Returns:
+        tuple: The seconds and the peak bytes.
+    """
+
+    start = perf_counter()
+    f()
+    elapsed = perf_counter() - start
+
+    tracemalloc.start()
+    f()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak
+
+
+def main():
+    """Compare the streaming JSON writer with serializing the whole dictionnary."""
+
+    parser = ArgumentParser(description="JSON acronyms writing benchmark.")
+    parser.add_argument(
+        "-n", "--amounts", default=[10_000, 100_000], type=int, nargs="+"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filepath = Path(tmp_dir) / "acronyms.json"
+
+        for amount in args.amounts:
+            acronyms = generate_acronyms(amount)
+
+            def whole():
+                d = {GENERATOR_KEY: GENERATOR_VALUE} | dict_from_acronyms(acronyms)
+                write_to_json(d, filepath)
+
+            for name, f in (
+                ("whole dictionnary", whole),
+                ("streaming", lambda: HandlerJSON.write(filepath, acronyms)),
+            ):
+                elapsed, peak = measure(f)
+
+                print(
+                    f"{amount:10} entries  {name:18} {elapsed:8.3f} s"
+                    f"  peak {peak / 2**20:10.2f} MiB"
+                )
+
+
+if __name__ == "__main__":
+    main()
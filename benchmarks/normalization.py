@@ -0,0 +1,160 @@
+import os
+import random
+
+from typing import List, Tuple, Callable
+from time import perf_counter
+from argparse import ArgumentParser
+from collections import deque
+from pathlib import Path
+
+from pycronyms.acronym import Acronym
+from pycronyms.handlers import HandlerJSON
+from pycronyms._common import normalize_meanings, normalize_name
+
+from benchmarks.generator import generate_meaning
+
+OUTPUT_ACRONYMS_FILEPATH = (
+    Path(os.path.dirname(__file__))
+    / ".."
+    / "pycronyms"
+    / "pycronyms_output"
+    / "acronyms.json"
+)
+
+
+def remove_parenthesis_content_deque(value: str) -> str:
+    """The previous implementation, it copies the string for every character."""
+
+    st = deque([""])
+    count = 0
+
+    for ch in value:
+        if ch == "(":
+            count += 1
+            st.append("")
+        elif ch == ")" and count > 0:
+            st.pop()
+            count -= 1
+            continue
+
+        st[-1] += ch
+
+    out = "".join(st)
+    out = " ".join(out.split())
+
+    return out
+
+
+def post_init_previous(name: str, meaning: str, provider: str) -> tuple:
+    """The previous `Acronym.model_post_init` steps."""
+
+    meaning = remove_parenthesis_content_deque(meaning)
+    values = [value.strip() for value in (name, meaning, provider)]
+    values[0] = "".join(values[0].split()).upper()
+
+    return tuple(values)
+
+
+def post_init_pipeline(
+    names: List[str], meanings: List[str], providers: List[str]
+) -> list:
+    """The normalization stage, in batch."""
+
+    return list(
+        zip(
+            [normalize_name(name) for name in names],
+            normalize_meanings(meanings),
+            [provider.strip() for provider in providers],
+        )
+    )
+
+
+def scraped_triples(amount: int, seed: int = 0) -> List[Tuple[str, str, str]]:
+    """Returns (name, meaning, provider) triples like the scraped ones. The meanings of
+    the fetched acronyms are used first, with some parenthesis and whitespaces added.
+
+    Args:
+        amount (int): The amount of triples.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        List[Tuple[str, str, str]]: The triples.
+    """
+
+    rng = random.Random(seed)
+    pairs = []
+
+    if OUTPUT_ACRONYMS_FILEPATH.exists():
+        acronyms = HandlerJSON.read(OUTPUT_ACRONYMS_FILEPATH)
+
+        for lv in acronyms.values():
+            for cv in lv.values():
+                for name, acronym in cv.items():
+                    pairs += [(name, meaning) for meaning in acronym.get_meanings()]
+
+    triples = []
+    for i in range(amount):
+        if pairs:
+            name, meaning = pairs[i % len(pairs)]
+        else:
+            meaning = generate_meaning(rng)
+            name = "".join(word[0] for word in meaning.split())
+
+        if rng.random() < 0.3:
+            meaning += f" ({generate_meaning(rng)}, see also {name})"
+        if rng.random() < 0.2:
+            meaning = f"  {meaning.replace(' ', '   ')} \n"
+
+        triples.append((f" {name} ", meaning, "wikipedia"))
+
+    return triples
+
+
+def measure(f: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+
+    for _ in range(repeat):
+        start = perf_counter()
+        f()
+        best = min(best, perf_counter() - start)
+
+    return best
+
+
+def main():
+    """Compare the previous Acronym normalization with the single pass one."""
+
+    parser = ArgumentParser(description="Acronym normalization benchmark.")
+    parser.add_argument("-n", "--amount", default=100_000, type=int)
+    parser.add_argument("-r", "--repeat", default=5, type=int)
+    args = parser.parse_args()
+
+    triples = scraped_triples(args.amount)
+    names, meanings, providers = map(list, zip(*triples))
+
+    assert [post_init_previous(*triple) for triple in triples] == post_init_pipeline(
+        names, meanings, providers
+    )
+
+    long_meaning = "(a" * 20_000 + "b)" * 20_000
+
+    for label, f in (
+        ("previous", lambda: [post_init_previous(*triple) for triple in triples]),
+        ("pipeline", lambda: post_init_pipeline(names, meanings, providers)),
+        ("previous, 80k chars", lambda: remove_parenthesis_content_deque(long_meaning)),
+        ("pipeline, 80k chars", lambda: normalize_meanings([long_meaning])),
+        (
+            "Acronym objects",
+            lambda: [
+                Acronym(name=name, meaning=meaning, provider=provider)
+                for name, meaning, provider in triples[:10_000]
+            ],
+        ),
+    ):
+        elapsed = measure(f, args.repeat)
+
+        print(f"{label:22} {elapsed:8.4f} s")
+
+
+if __name__ == "__main__":
+    main()
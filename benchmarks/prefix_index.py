@@ -0,0 +1,69 @@
+from time import perf_counter
+from argparse import ArgumentParser
+from itertools import islice
+
+from pycronyms.indexes import IndexPrefix
+
+from benchmarks.generator import generate_acronyms
+
+PREFIXES = ("TC", "BA", "QU", "ZOW", "X", "MAKI")
+
+
+def linear_search(acronyms, prefix: str, limit: int) -> list:
+    """Prefix search by scanning every acronym name, the reference implementation.
+
+    Args:
+        acronyms (Acronyms): The acronyms.
+        prefix (str): The normalized prefix.
+        limit (int): The maximum amount of results.
+
+    Returns:
+        list: The sorted matching entries.
+    """
+
+    matches = sorted(
+        (name, language, category)
+        for language, lv in acronyms.items()
+        for category, cv in lv.items()
+        for name in cv
+        if name.startswith(prefix)
+    )
+
+    return matches[:limit]
+
+
+def main():
+    """Compare prefix queries on `IndexPrefix` with a linear scan."""
+
+    parser = ArgumentParser(description="Acronym names prefix index benchmark.")
+    parser.add_argument("-n", "--amount", default=1_000_000, type=int)
+    parser.add_argument("-l", "--limit", default=10, type=int)
+    args = parser.parse_args()
+
+    acronyms = generate_acronyms(args.amount)
+
+    start = perf_counter()
+    index = IndexPrefix(acronyms)
+    build = perf_counter() - start
+
+    print(f"{len(index)} names, index built in {build:.3f} s")
+
+    for prefix in PREFIXES:
+        start = perf_counter()
+        results = list(index.search(prefix, args.limit))
+        indexed = perf_counter() - start
+
+        start = perf_counter()
+        expected = linear_search(acronyms, prefix, args.limit)
+        linear = perf_counter() - start
+
+        assert [a.name for _, _, a in results] == [name for name, _, _ in expected]
+
+        print(
+            f"prefix {prefix!r:8} index {indexed * 1e6:10.1f} us"
+            f"   linear scan {linear * 1e6:12.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,337 @@
+import sys
+import platform
+import tempfile
+import tracemalloc
+
+from typing import Any, Dict, List, Tuple, Callable, Optional
+from time import perf_counter, strftime
+from argparse import ArgumentParser
+from pathlib import Path
+
+import orjson
+
+from pycronyms.acronyms import Acronyms, dict_from_acronyms, acronyms_from_dict
+from pycronyms.acronym import Acronym
+from pycronyms.language import Language
+from pycronyms.category import Category
+from pycronyms.handlers import HandlerJSON, HandlerCSV, HandlerSnapshot, JSONIndex
+from pycronyms._common import sorted_recursive
+
+from benchmarks.generator import Entry, iter_entries, acronyms_from_entries
+
+BASELINE_VERSION = 1
+
+# A result is slower if its ratio to the baseline is above it
+DEFAULT_THRESHOLD = 1.25
+
+type Results = Dict[str, Dict[str, Dict[str, float]]]
+
+
+class Dataset:
+    """The synthetic data shared by the operations of an amount."""
+
+    def __init__(self, entries: List[Entry], acronyms: Acronyms, dirpath: Path):
+        self.entries = entries
+        self.acronyms = acronyms
+        self.dirpath = dirpath
+
+        self.acronyms_dict = dict_from_acronyms(acronyms)
+
+
+def construct_acronyms(dataset: Dataset) -> Callable[[], Any]:
+    triples = [(name, meaning) for _, _, name, meaning, _ in dataset.entries]
+
+    return lambda: [
+        Acronym(name=name, meaning=meaning, provider="synthetic")
+        for name, meaning in triples
+    ]
+
+
+def construct_acronyms_trusted(dataset: Dataset) -> Callable[[], Any]:
+    triples = [(name, meaning) for _, _, name, meaning, _ in dataset.entries]
+
+    return lambda: [
+        Acronym.construct_trusted(name, meaning, "synthetic")
+        for name, meaning in triples
+    ]
+
+
+def handler_write(handler, filename: str) -> Callable[[Dataset], Callable[[], Any]]:
+    def operation(dataset: Dataset) -> Callable[[], Any]:
+        filepath = dataset.dirpath / filename
+
+        return lambda: handler.write(filepath, dataset.acronyms)
+
+    return operation
+
+
+def handler_read(handler, filename: str) -> Callable[[Dataset], Callable[[], Any]]:
+    def operation(dataset: Dataset) -> Callable[[], Any]:
+        filepath = dataset.dirpath / filename
+        handler.write(filepath, dataset.acronyms)
+
+        return lambda: handler.read(filepath)
+
+    return operation
+
+
+def json_indexed_write(dataset: Dataset) -> Callable[[], Any]:
+    filepath = dataset.dirpath / "acronyms.json"
+    index_filepath = dataset.dirpath / "acronyms.json.idx"
+
+    return lambda: HandlerJSON.write(filepath, dataset.acronyms, index_filepath)
+
+
+def json_index_lookup(dataset: Dataset) -> Callable[[], Any]:
+    filepath = dataset.dirpath / "acronyms.json"
+    HandlerJSON.write(filepath, dataset.acronyms, dataset.dirpath / "acronyms.json.idx")
+
+    # Every thousandth entry, so the amount of lookups grows with the dataset
+    keys = [
+        (name, language, category)
+        for language, category, name, _, _ in dataset.entries[::1000]
+    ]
+
+    def lookup():
+        with JSONIndex(filepath) as index:
+            return [index.get_acronym(*key) for key in keys]
+
+    return lookup
+
+
+# Every operation prepares its inputs from a dataset and returns the measured function
+OPERATIONS: Dict[str, Callable[[Dataset], Callable[[], Any]]] = {
+    "acronym": construct_acronyms,
+    "acronym_trusted": construct_acronyms_trusted,
+    "dict_from_acronyms": lambda dataset: lambda: dict_from_acronyms(dataset.acronyms),
+    "acronyms_from_dict": lambda dataset: (
+        lambda: acronyms_from_dict(dataset.acronyms_dict)
+    ),
+    "acronyms_from_dict_trusted": lambda dataset: (
+        lambda: acronyms_from_dict(dataset.acronyms_dict, trusted=True)
+    ),
+    "sorted_recursive": lambda dataset: lambda: sorted_recursive(dataset.acronyms_dict),
+    "json_write": handler_write(HandlerJSON, "acronyms.json"),
+    "json_read": handler_read(HandlerJSON, "acronyms.json"),
+    "json_indexed_write": json_indexed_write,
+    "json_index_lookup": json_index_lookup,
+    "csv_write": handler_write(HandlerCSV, "acronyms.csv"),
+    "csv_read": handler_read(HandlerCSV, "acronyms.csv"),
+    "snapshot_write": handler_write(HandlerSnapshot, "acronyms.snapshot"),
+    "snapshot_read": handler_read(HandlerSnapshot, "acronyms.snapshot"),
+}
+
+
+def measure(f: Callable[[], Any], repeat: int) -> Tuple[float, int]:
+    """Returns the best wall time of a function over some runs and its peak of
+    allocated memory. The peak is measured by an extra run because tracing
+    the allocations slows the function down.
+
+    Args:
+        f (Callable[[], Any]): The function.
+        repeat (int): The amount of timed runs.
+
+    Returns:
+        Tuple[float, int]: The seconds and the peak bytes.
+    """
+
+    best = float("inf")
+
+    for _ in range(repeat):
+        start = perf_counter()
+        f()
+        best = min(best, perf_counter() - start)
+
+    tracemalloc.start()
+    f()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, peak
+
+
+def run(
+    amounts: List[int],
+    operations: List[str],
+    repeat: int,
+    generator_kwargs: Dict[str, Any],
+) -> Results:
+    """Measure the operations over a synthetic dataset per amount.
+
+    Args:
+        amounts (List[int]): The amounts of acronym names.
+        operations (List[str]): The operation names.
+        repeat (int): The amount of timed runs per operation.
+        generator_kwargs (Dict[str, Any]): The `iter_entries` keyword arguments.
+
+    Returns:
+        Results: The seconds and the peak bytes per operation and amount.
+    """
+
+    results: Results = {operation: {} for operation in operations}
+
+    for amount in amounts:
+        entries = list(iter_entries(amount, **generator_kwargs))
+        acronyms = acronyms_from_entries(entries)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            dataset = Dataset(entries, acronyms, Path(tmp_dir))
+
+            for operation in operations:
+                seconds, peak = measure(OPERATIONS[operation](dataset), repeat)
+                results[operation][str(amount)] = {
+                    "seconds": seconds,
+                    "peak_bytes": peak,
+                }
+
+                print(
+                    f"{amount:10} entries  {operation:28} {seconds:9.4f} s"
+                    f"  peak {peak / 2**20:10.2f} MiB",
+                    flush=True,
+                )
+
+    return results
+
+
+def compare(baseline: Results, results: Results, threshold: float) -> List[str]:
+    """Print the ratios of the results to a baseline.
+
+    Args:
+        baseline (Results): The baseline results.
+        results (Results): The current results.
+        threshold (float): A ratio above it is a regression.
+
+    Returns:
+        List[str]: The regressions.
+    """
+
+    regressions = []
+
+    for operation, amounts in results.items():
+        for amount, current in amounts.items():
+            previous = baseline.get(operation, {}).get(amount)
+            if previous is None:
+                continue
+
+            ratios = []
+            for key in ("seconds", "peak_bytes"):
+                ratio = current[key] / max(previous[key], 1e-9)
+                ratios.append(f"{ratio:6.2f}x")
+
+                if ratio > threshold:
+                    regressions.append(f"{operation} ({amount} entries, {key})")
+
+            print(f"{amount:>10} entries  {operation:28} {'  '.join(ratios)}")
+
+    return regressions
+
+
+def main():
+    """Measure the core operations and compare them with a baseline."""
+
+    parser = ArgumentParser(description="Pycronyms benchmark suite.")
+    parser.add_argument(
+        "-n", "--amounts", default=[1_000, 10_000, 100_000], type=int, nargs="+"
+    )
+    parser.add_argument("-r", "--repeat", default=3, type=int)
+    parser.add_argument(
+        "--operations",
+        default=list(OPERATIONS),
+        choices=list(OPERATIONS),
+        nargs="+",
+        metavar="OPERATION",
+    )
+    parser.add_argument("--seed", default=0, type=int)
+    parser.add_argument(
+        "--extras",
+        default=0.1,
+        type=float,
+        help="Average amount of extra meanings per acronym.",
+    )
+    parser.add_argument(
+        "--languages",
+        default=None,
+        type=Language,
+        nargs="+",
+        help="ISO 639-1 codes, every language by default.",
+    )
+    parser.add_argument(
+        "--categories",
+        default=None,
+        type=Category,
+        nargs="+",
+        help="Every category by default.",
+    )
+    parser.add_argument(
+        "--skew",
+        default=0.0,
+        type=float,
+        help="Spread over the languages and categories, 0 is uniform.",
+    )
+    parser.add_argument(
+        "-o", "--output", type=Path, help="Write the results as a JSON baseline."
+    )
+    parser.add_argument(
+        "-c", "--compare", type=Path, help="Compare the results with a JSON baseline."
+    )
+    parser.add_argument(
+        "--threshold",
+        default=DEFAULT_THRESHOLD,
+        type=float,
+        help="Ratio to the baseline above which a result is a regression.",
+    )
+    args = parser.parse_args()
+
+    generator_kwargs = {
+        "seed": args.seed,
+        "extras": args.extras,
+        "languages": args.languages,
+        "categories": args.categories,
+        "skew": args.skew,
+    }
+
+    # The enums are stored by value
+    generator_metadata = orjson.loads(orjson.dumps(generator_kwargs))
+
+    baseline: Optional[dict] = None
+    if args.compare is not None:
+        baseline = orjson.loads(args.compare.read_bytes())
+
+        if baseline["metadata"]["generator"] != generator_metadata:
+            print("Warning: the baseline has been generated with other parameters")
+
+    results = run(args.amounts, args.operations, args.repeat, generator_kwargs)
+
+    if args.output is not None:
+        metadata = {
+            "version": BASELINE_VERSION,
+            "created_at": strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": sys.version,
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "generator": generator_metadata,
+        }
+
+        args.output.write_bytes(
+            orjson.dumps(
+                {"metadata": metadata, "results": results},
+                option=orjson.OPT_INDENT_2,
+            )
+        )
+
+    if baseline is None:
+        return
+
+    print(f"\nRatios to {args.compare} (seconds, peak memory)")
+
+    regressions = compare(baseline["results"], results, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regressions above {args.threshold}x:")
+        for regression in regressions:
+            print(f"  {regression}")
+
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
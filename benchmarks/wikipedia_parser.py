@@ -0,0 +1,232 @@
+import re
+import random
+
+from typing import List, Tuple, Callable
+from time import perf_counter
+from argparse import ArgumentParser
+from pathlib import Path
+
+from pycronyms.acronym import is_acronym_meaning_valid, are_acronym_meanings_valid
+from pycronyms.providers.wikipedia_parser import iter_acronym_pairs
+from pycronyms._common import remove_html_content
+
+from benchmarks.generator import generate_meaning
+
+# The regexes used by the Wikipedia provider before the HTML parser
+COMPUTER_SCIENCE_RE: re.Pattern = re.compile(r"<li><a href=.*>(.*)<\/a>—(.*)<\/li>")
+IT_RE: re.Pattern = re.compile(r"""<td><a href=.*>(.*)<\/a>
+<\/td>
+<td>(.*)
+<\/td>""")
+
+
+def link(text: str) -> str:
+    return f'<a href="/wiki/{text.replace(" ", "_")}" title="{text}">{text}</a>'
+
+
+def reference(i: int) -> str:
+    return (
+        f'<sup id="cite_ref-{i}" class="reference">'
+        f'<a href="#cite_note-{i}">&#91;{i}&#93;</a></sup>'
+    )
+
+
+def initials(meaning: str) -> str:
+    return "".join(word[0] for word in meaning.split())
+
+
+def generate_navbox(amount: int) -> str:
+    """Returns a navigation box, Wikipedia writes it on a single line.
+
+    Args:
+        amount (int): The amount of links.
+
+    Returns:
+        str: The HTML content.
+    """
+
+    items = "".join(f"<li>{link(f'Topic {i}')}</li>" for i in range(amount))
+
+    return f'<div role="navigation" class="navbox"><ul>{items}</ul></div>'
+
+
+def generate_list_page(amount: int, navbox: int = 0, seed: int = 0) -> str:
+    """Returns a page like the Wikipedia computing abbreviations list.
+
+    Args:
+        amount (int): The amount of list items.
+        navbox (int, optional): The amount of links in the navigation box at the end. Defaults to 0.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        str: The HTML content.
+    """
+
+    rng = random.Random(seed)
+    lines = ['<div class="mw-parser-output">', "<ul>"]
+
+    for i in range(amount):
+        meaning = generate_meaning(rng)
+        words = meaning.split()
+
+        # Some meanings have linked words, parenthesis or references
+        if rng.random() < 0.3:
+            words[-1] = link(words[-1])
+        if rng.random() < 0.2:
+            words.append(f"({generate_meaning(rng)})")
+        if rng.random() < 0.1:
+            words.append(reference(i))
+
+        lines.append(f"<li>{link(initials(meaning))}—{' '.join(words)}</li>")
+
+    lines += ["</ul>", generate_navbox(navbox), "</div>"]
+
+    return "\n".join(lines)
+
+
+def generate_table_page(amount: int, navbox: int = 0, seed: int = 0) -> str:
+    """Returns a page like the Wikipedia information technology initialisms table.
+
+    Args:
+        amount (int): The amount of table rows.
+        navbox (int, optional): The amount of links in the navigation box at the end. Defaults to 0.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        str: The HTML content.
+    """
+
+    rng = random.Random(seed)
+    lines = ['<table class="wikitable sortable">', "<tbody><tr>"]
+    lines += ["<th>Acronym</th>", "<th>Expansion</th>", "<th>Comment</th></tr>"]
+
+    for i in range(amount):
+        meaning = generate_meaning(rng)
+        comment = generate_meaning(rng) if rng.random() < 0.5 else ""
+
+        lines += [
+            "<tr>",
+            f"<td>{link(initials(meaning))}",
+            "</td>",
+            f"<td>{meaning}",
+            "</td>",
+            f"<td>{comment}",
+            "</td></tr>",
+        ]
+
+    lines += ["</tbody></table>", generate_navbox(navbox)]
+
+    return "\n".join(lines)
+
+
+def regex_pairs(html: str, regex: re.Pattern) -> List[Tuple[str, str]]:
+    return [
+        (name, remove_html_content(meaning)) for name, meaning in regex.findall(html)
+    ]
+
+
+def names_and_meanings(pairs: List[Tuple[str, str]]) -> Tuple[List[str], List[str]]:
+    return ["".join(name.split()) for name, _ in pairs], [
+        meaning for _, meaning in pairs
+    ]
+
+
+def valid_amount(pairs: List[Tuple[str, str]]) -> int:
+    return sum(are_acronym_meanings_valid(*names_and_meanings(pairs)))
+
+
+def measure(f: Callable[[], List[Tuple[str, str]]], repeat: int) -> tuple:
+    """Returns the best wall time of a function and its result.
+
+    Args:
+        f (Callable[[], List[Tuple[str, str]]]): The function.
+        repeat (int): The amount of runs.
+
+    Returns:
+        tuple: The seconds and the result.
+    """
+
+    best = float("inf")
+
+    for _ in range(repeat):
+        start = perf_counter()
+        result = f()
+        best = min(best, perf_counter() - start)
+
+    return best, result
+
+
+def main():
+    """Compare the HTML parser with the regexes over Wikipedia pages."""
+
+    parser = ArgumentParser(description="Wikipedia pages parsing benchmark.")
+    parser.add_argument("-n", "--amount", default=20_000, type=int)
+    parser.add_argument("-r", "--repeat", default=3, type=int)
+    parser.add_argument(
+        "--navbox",
+        default=150,
+        type=int,
+        help="Links in the synthetic navigation box, the regex is cubic over such a line.",
+    )
+    parser.add_argument(
+        "--computer-science",
+        type=Path,
+        help="Saved HTML of List_of_computing_and_IT_abbreviations, synthetic if missing.",
+    )
+    parser.add_argument(
+        "--it",
+        type=Path,
+        help="Saved HTML of List_of_information_technology_initialisms, synthetic if missing.",
+    )
+    args = parser.parse_args()
+
+    pages = (
+        (
+            "computer science",
+            args.computer_science,
+            generate_list_page,
+            COMPUTER_SCIENCE_RE,
+            (True, False),
+        ),
+        ("IT", args.it, generate_table_page, IT_RE, (False, True)),
+    )
+
+    for name, filepath, generate_page, regex, (lists, tables) in pages:
+        if filepath is None:
+            html = generate_page(args.amount, args.navbox)
+            name += " (synthetic)"
+        else:
+            html = filepath.read_text(encoding="utf-8")
+
+        print(f"{name}, {len(html) / 2**20:.2f} MiB")
+
+        for method, f in (
+            ("regex", lambda: regex_pairs(html, regex)),
+            ("parser", lambda: list(iter_acronym_pairs((html,), lists, tables))),
+        ):
+            elapsed, pairs = measure(f, args.repeat)
+
+            print(
+                f"  {method:8} {elapsed:8.3f} s  {len(pairs):8} pairs"
+                f"  {valid_amount(pairs):8} valid"
+            )
+
+        names, meanings = names_and_meanings(pairs)
+
+        for method, f in (
+            (
+                "loop",
+                lambda: [
+                    is_acronym_meaning_valid(name, meaning)
+                    for name, meaning in zip(names, meanings)
+                ],
+            ),
+            ("batch", lambda: are_acronym_meanings_valid(names, meanings)),
+        ):
+            elapsed, mask = measure(f, args.repeat)
+
+            print(f"  {method:8} {elapsed:8.3f} s  {sum(mask):8} valid meanings")
+
+
+if __name__ == "__main__":
+    main()
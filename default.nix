@@ -3,7 +3,7 @@
   buildPythonApplication,
   orjson,
   pydantic,
-  wikipedia,
+  requests,
   pytestCheckHook,
   setuptools,
   setuptools-scm,
@@ -26,7 +26,7 @@ buildPythonApplication {
   dependencies = [
     orjson
     pydantic
-    wikipedia
+    requests
     thefuzz
     matplotlib
     pandas
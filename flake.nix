@@ -27,7 +27,7 @@
               buildPythonApplication
               orjson
               pydantic
-              wikipedia
+              requests
               pytestCheckHook
               setuptools
               setuptools-scm
@@ -1,12 +1,25 @@
-from pycronyms.acronym import Acronym, is_acronym_meaning_valid
+from pycronyms.acronym import (
+    Acronym,
+    is_acronym_meaning_valid,
+    are_acronym_meanings_valid,
+)
 from pycronyms.provider import Provider
 from pycronyms.provider_helper import ProviderHelper
+from pycronyms.provider_async import ProviderAsync
 from pycronyms.pycronyms import Pycronyms
+from pycronyms.page_cache import PageCache
+from pycronyms.page_fixtures import PageFixtures
+from pycronyms.metrics import Metrics
 
 __all__ = [
     "Acronym",
     "is_acronym_meaning_valid",
+    "are_acronym_meanings_valid",
     "Provider",
     "ProviderHelper",
+    "ProviderAsync",
     "Pycronyms",
+    "PageCache",
+    "PageFixtures",
+    "Metrics",
 ]
@@ -1,7 +1,12 @@
 import re
-
-from typing import Type, Any, Dict
-from collections import defaultdict, deque
+import gc
+import hashlib
+import functools
+import contextlib
+
+from typing import Type, Any, Dict, Iterable, Iterator, List, Optional
+from types import ModuleType
+from collections import defaultdict
 from datetime import datetime
 
 
@@ -18,6 +23,12 @@ def normalize_str(value: str) -> str:
     return value.strip()
 
 
+# Greedy on purpose, a tag and everything until the last tag on the line
+HTML_CONTENT_RE: re.Pattern = re.compile(r"<.*>.*<.*?>")
+PARENTHESIS_RE: re.Pattern = re.compile(r"[()]")
+HTML_TAG_OR_PARENTHESIS_RE: re.Pattern = re.compile(r"<[^<>]*>|[()]")
+
+
 def remove_html_content(value: str) -> str:
     """Returns a new string without HTML tags and their content.
 
@@ -28,9 +39,86 @@ def remove_html_content(value: str) -> str:
         str: The new string.
     """
 
-    p = re.compile(r"<.*>.*<.*?>")
+    return HTML_CONTENT_RE.sub("", value)
 
-    return p.sub("", value)
+
+def normalize_meaning(value: str, html: bool = False) -> str:
+    """Returns a normalized meaning in a single pass. The valid parenthesis
+    pairs and their content are removed, then the whitespaces are collapsed.
+    Time complexity is O(n) even in the worst case.
+
+    Args:
+        value (str): String object.
+        html (bool, optional): Also remove the HTML tags, their text is kept. Defaults to False.
+
+    Returns:
+        str: The new string.
+    """
+
+    regex = HTML_TAG_OR_PARENTHESIS_RE if html else PARENTHESIS_RE
+
+    if "(" in value or ")" in value or (html and "<" in value):
+        # Positions of the open parenthesis, and the spans to remove
+        opened = []
+        spans = []
+
+        for match in regex.finditer(value):
+            start = match.start()
+            ch = value[start]
+
+            if ch == "(":
+                opened.append(start)
+            elif ch == ")":
+                if opened:
+                    span_start = opened.pop()
+
+                    # Spans nested in this one are already removed by it
+                    while spans and spans[-1][0] > span_start:
+                        spans.pop()
+
+                    spans.append((span_start, start + 1))
+            else:
+                spans.append((start, match.end()))
+
+        slices = []
+        pos = 0
+
+        for span_start, span_end in spans:
+            slices.append(value[pos:span_start])
+            pos = span_end
+
+        slices.append(value[pos:])
+
+        value = "".join(slices)
+
+    return " ".join(value.split())
+
+
+def normalize_meanings(values: Iterable[str], html: bool = False) -> List[str]:
+    """Batch version of `normalize_meaning`.
+
+    Args:
+        values (Iterable[str]): String objects.
+        html (bool, optional): Also remove the HTML tags, their text is kept. Defaults to False.
+
+    Returns:
+        List[str]: The new strings.
+    """
+
+    return [normalize_meaning(value, html) for value in values]
+
+
+def normalize_name(value: str) -> str:
+    """Returns a normalized acronym name, uppercase without any whitespace.
+
+    Args:
+        value (str): String object.
+
+    Returns:
+        str: The new string.
+    """
+
+    return "".join(value.split()).upper()
 
 
 def remove_parenthesis_content(value: str) -> str:
@@ -44,26 +132,41 @@ def remove_parenthesis_content(value: str) -> str:
         str: The new string.
     """
 
-    st = deque([""])
-    count = 0
+    return normalize_meaning(value)
+
+
+def levenshtein_distance(a: str, b: str) -> int:
+    """Returns the Levenshtein distance between two strings, the minimum amount
+    of single character insertions, deletions or substitutions to change one into the other.
+
+    Args:
+        a (str): String object.
+        b (str): String object.
+
+    Returns:
+        int: The distance.
+    """
+
+    if len(a) < len(b):
+        a, b = b, a
 
-    for ch in value:
-        if ch == "(":
-            count += 1
-            st.append("")
-        elif ch == ")" and count > 0:
-            st.pop()
-            count -= 1
-            continue
+    previous = list(range(len(b) + 1))
 
-        st[-1] += ch
+    for i, ca in enumerate(a, 1):
+        current = [i]
 
-    out = "".join(st)
+        for j, cb in enumerate(b, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (ca != cb),
+                )
+            )
 
-    # Remove whitespaces by prevention
-    out = " ".join(out.split())
+        previous = current
 
-    return out
+    return previous[-1]
 
 
 def create_recursive_dict(t: Type, depth: int) -> dict:
@@ -153,3 +256,46 @@ def get_current_date(format: str = "%Y-%m-%d") -> str:
     """
 
     return datetime.today().strftime(format)
+
+
+@functools.cache
+def modules_digest(*modules: ModuleType) -> Optional[str]:
+    """Returns a SHA-256 of the source files of Python modules. It changes with their code,
+    so it can be part of a source revision to invalidate the results computed by this code.
+
+    Args:
+        *modules (ModuleType): The modules.
+
+    Returns:
+        Optional[str]: The hexadecimal digest, None if a source file can not be read.
+    """
+
+    h = hashlib.sha256()
+
+    for module in modules:
+        try:
+            with open(module.__file__, "rb") as f:
+                h.update(f.read())
+        except (OSError, TypeError):
+            return None
+
+    return h.hexdigest()
+
+
+@contextlib.contextmanager
+def gc_paused() -> Iterator[None]:
+    """Pause the cyclic garbage collector, for example while building many long-lived
+    objects, the collections it triggers would only scan them again and again.
+
+    Yields:
+        Iterator[None]: Nothing.
+    """
+
+    enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        yield
+    finally:
+        if enabled is True:
+            gc.enable()
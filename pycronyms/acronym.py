@@ -1,10 +1,22 @@
-from typing import Set, Any, Self, Dict
+import re
+
+from typing import Set, Any, Self, List, Optional, Sequence
+from itertools import accumulate
+from bisect import bisect_right
 from collections import deque
 
-from pycronyms._common import normalize_str, remove_parenthesis_content
+from pycronyms._common import normalize_meaning, normalize_name
 
 from pydantic import BaseModel, model_validator, Field, RootModel
 
+# A digit, or an uppercase letter after a letter, it may extend a sequence of successive uppercase.
+# A single character class keeps the regex engine fast scan.
+NOT_SIMPLE_MEANING_RE: re.Pattern = re.compile(r"[0-9A-Z](?<![^A-Za-z][A-Z])")
+# Cannot be in an ASCII meaning
+MEANINGS_SEPARATOR = "\x80"
+# Everything but the uppercase letters and the meanings separator
+NOT_INITIAL_BYTES = bytes(c for c in range(256) if not (0x41 <= c <= 0x5A or c == 0x80))
+
 
 def is_acronym_meaning_valid(acronym: str, meaning: str) -> bool:
     """Returns if a meaning is valid knowing the acronym.
@@ -54,6 +66,87 @@ def is_acronym_meaning_valid(acronym: str, meaning: str) -> bool:
     return fi >= acronym_len
 
 
+def are_acronym_meanings_valid(
+    acronyms: Sequence[str], meanings: Sequence[str]
+) -> List[bool]:
+    """Batch version of `is_acronym_meaning_valid`, it returns a boolean mask with the same results.
+
+    Most meanings are ASCII words without digits where only the first letter may be uppercase,
+    and most acronyms only have letters and numbers. Then each word matches at most its first letter
+    and the separators never match, so testing an acronym is a subsequence check against the word initials.
+    These initials are extracted at once from the joined meanings, the bytes titlecase
+    uppercases the first letter of every word and only the uppercase letters are kept.
+    The other pairs are tested by the scalar function.
+
+    Args:
+        acronyms (Sequence[str]): The acronyms.
+        meanings (Sequence[str]): The meanings to test, parallel to the acronyms.
+
+    Raises:
+        ValueError: The sequences do not have the same length.
+
+    Returns:
+        List[bool]: For each pair, True if the meaning is valid.
+    """
+
+    if len(acronyms) != len(meanings):
+        raise ValueError("The acronyms and the meanings must have the same length")
+
+    acronyms = [acronym.strip().upper() for acronym in acronyms]
+    candidates = [
+        i
+        for i, (acronym, meaning) in enumerate(zip(acronyms, meanings))
+        if meaning.isascii() is True and acronym.isalnum() is True
+    ]
+
+    # Every meaning is preceded by the separator
+    joined = MEANINGS_SEPARATOR + MEANINGS_SEPARATOR.join(
+        meanings[i] for i in candidates
+    )
+    initials = (
+        joined.encode("latin-1")
+        .title()
+        .translate(None, NOT_INITIAL_BYTES)
+        .decode("latin-1")
+        .split(MEANINGS_SEPARATOR)[1:]
+    )
+
+    # Separator position of every candidate meaning in the joined meanings
+    offsets = list(accumulate((len(meanings[i]) + 1 for i in candidates), initial=0))
+    not_simple = {
+        bisect_right(offsets, match.start()) - 1
+        for match in NOT_SIMPLE_MEANING_RE.finditer(joined)
+    }
+
+    mask: List[Optional[bool]] = [None] * len(acronyms)
+
+    for k, i in enumerate(candidates):
+        if k in not_simple:
+            continue
+
+        acronym = acronyms[i]
+        meaning_initials = initials[k]
+
+        if acronym == meaning_initials:
+            mask[i] = True
+            continue
+
+        # Greedy subsequence check, like the scalar function
+        position = 0
+        for ch in acronym:
+            position = meaning_initials.find(ch, position) + 1
+
+            if position == 0:
+                break
+
+        mask[i] = position > 0
+
+    return [
+        is_acronym_meaning_valid(acronyms[i], meanings[i]) if valid is None else valid
+        for i, valid in enumerate(mask)
+    ]
+
+
 class Acronym(BaseModel):
     """This model represents an acronym."""
 
@@ -87,17 +180,10 @@ class Acronym(BaseModel):
     def model_post_init(self, _context: Any):
         """Post initialization for normalizing strings."""
 
-        self.meaning = remove_parenthesis_content(self.meaning)
-
-        for attr, attr_value in vars(self).items():
-            if isinstance(attr_value, str) is False:
-                continue
-
-            normalized_attr = normalize_str(attr_value)
-            setattr(self, attr, normalized_attr)
-
+        self.meaning = normalize_meaning(self.meaning)
+        self.provider = self.provider.strip()
         # Remove every whitespace character
-        self.name = "".join(self.name.split()).upper()
+        self.name = normalize_name(self.name)
 
     @model_validator(mode="after")
     def check_meaning(self) -> Self:
@@ -151,25 +237,62 @@ class Acronym(BaseModel):
 
         return d
 
+    @classmethod
+    def construct_trusted(cls, name: str, meaning: str, provider: str) -> Self:
+        """Returns an Acronym object without any validation nor normalization.
+        Unlike `model_construct`, it does not run `model_post_init`.
+
+        It must only be used with values that have already been validated by an Acronym object,
+        for example the ones read from files written by pycronyms.
+
+        Args:
+            name (str): The normalized acronym name.
+            meaning (str): The normalized meaning.
+            provider (str): The provider.
+
+        Returns:
+            Self: The Acronym object.
+        """
+
+        # Same attributes as the ones set by `model_construct`, without the post initialization
+        acronym = cls.__new__(cls)
+
+        object.__setattr__(
+            acronym,
+            "__dict__",
+            {"name": name, "meaning": meaning, "provider": provider, "extras": set()},
+        )
+        object.__setattr__(
+            acronym, "__pydantic_fields_set__", {"name", "meaning", "provider"}
+        )
+        object.__setattr__(acronym, "__pydantic_extra__", None)
+        object.__setattr__(acronym, "__pydantic_private__", None)
+
+        return acronym
+
     @staticmethod
-    def from_dict(d: dict) -> Self:
+    def from_dict(d: dict, trusted: bool = False) -> Self:
         """Returns an Acronym object from a dictionnary. We assume
         that the dictionnary is well formed.
 
         Args:
             d (dict): The dictionnary.
+            trusted (bool, optional): True to skip the validation and the normalization,
+                see `construct_trusted`. Defaults to False.
 
         Returns:
             Self: The Acronym object.
         """
 
-        acronym = Acronym(name=d["name"], meaning=d["meaning"], provider=d["provider"])
+        create = Acronym.construct_trusted if trusted is True else Acronym
+
+        acronym = create(name=d["name"], meaning=d["meaning"], provider=d["provider"])
 
         if "extras" in d:
             extras = d["extras"]
 
             for extra in extras:
-                extra_acronym = Acronym(
+                extra_acronym = create(
                     name=d["name"],
                     meaning=extra["meaning"],
                     provider=extra["provider"],
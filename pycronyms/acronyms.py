@@ -1,6 +1,6 @@
 from typing import Dict
 
-from pycronyms._common import create_recursive_dict
+from pycronyms._common import create_recursive_dict, gc_paused
 from pycronyms.language import Language
 from pycronyms.category import Category
 from pycronyms.acronym import Acronym
@@ -9,6 +9,11 @@ type Acronyms = Dict[Language, Dict[Category, Dict[str, Acronym]]]
 
 type AcronymsDict = Dict[str, Dict[str, Dict[str, dict]]]
 
+# Top-level key marking the acronyms files generated by pycronyms,
+# their content has already been validated.
+GENERATOR_KEY = "__generator__"
+GENERATOR_VALUE = "pycronyms"
+
 
 def create_acronyms() -> Acronyms:
     """Create an empty Acronyms data structure.
@@ -43,11 +48,26 @@ def dict_from_acronyms(acronyms: Acronyms) -> AcronymsDict:
     return d
 
 
-def acronyms_from_dict(acronyms_dict: AcronymsDict) -> Acronyms:
+def is_generated_dict(acronyms_dict: AcronymsDict) -> bool:
+    """Returns if an acronyms Python dictionnary carries the pycronyms generator marker.
+
+    Args:
+        acronyms_dict (AcronymsDict): The acronyms Python dictionnary.
+
+    Returns:
+        bool: True if it has been generated by pycronyms.
+    """
+
+    return acronyms_dict.get(GENERATOR_KEY) == GENERATOR_VALUE
+
+
+def acronyms_from_dict(acronyms_dict: AcronymsDict, trusted: bool = False) -> Acronyms:
     """Build a dict of acronyms with language and category.
 
     Args:
         acronyms_dict (AcronymsDict): The acronyms Python dictionnary.
+        trusted (bool, optional): True to skip the acronyms validation, it must only be used
+            with data generated by pycronyms. Defaults to False.
 
     Returns:
         Acronyms: The acronyms.
@@ -55,17 +75,24 @@ def acronyms_from_dict(acronyms_dict: AcronymsDict) -> Acronyms:
 
     acronyms = create_acronyms()
 
-    for lk, lv in acronyms_dict.items():
-        for ck, cv in lv.items():
-            for acronym_name, d in cv.items():
-                # It allows us to not overwrite the acronyms_dict passed to the function
-                d_copy = d | {"name": acronym_name}
+    # The acronyms are long-lived, the temporary objects are freed by reference counting
+    with gc_paused():
+        for lk, lv in acronyms_dict.items():
+            if lk == GENERATOR_KEY:
+                continue
 
-                acronym = Acronym.from_dict(d_copy)
+            l = Language._value2member_map_[lk]
 
-                l = Language._value2member_map_[lk]
+            for ck, cv in lv.items():
                 c = Category._value2member_map_[ck]
+                entry = acronyms[l][c]
+
+                for acronym_name, d in cv.items():
+                    # It allows us to not overwrite the acronyms_dict passed to the function
+                    d_copy = d | {"name": acronym_name}
+
+                    acronym = Acronym.from_dict(d_copy, trusted)
 
-                acronyms[l][c][acronym_name] = acronym
+                    entry[acronym_name] = acronym
 
     return acronyms
@@ -0,0 +1,109 @@
+from typing import List, Tuple, FrozenSet, Iterable, Optional
+
+from pycronyms.acronyms import Acronyms
+from pycronyms.acronym import Acronym
+from pycronyms.language import Language
+from pycronyms.category import Category
+
+type AcronymKey = Tuple[Language, Category, str]
+
+
+def acronym_meanings(acronym: Acronym) -> FrozenSet[Tuple[str, str]]:
+    """Returns every meaning of an acronym with its provider, extras included.
+
+    Args:
+        acronym (Acronym): The acronym object.
+
+    Returns:
+        FrozenSet[Tuple[str, str]]: The (meaning, provider) pairs.
+    """
+
+    d = acronym.to_dict()
+
+    return frozenset(
+        (value["meaning"], value["provider"]) for value in [d, *d.get("extras", [])]
+    )
+
+
+class ChangeSet:
+    """The acronyms added, removed and changed between two fetches."""
+
+    def __init__(self):
+        self.added: List[AcronymKey] = []
+        self.removed: List[AcronymKey] = []
+        self.changed: List[AcronymKey] = []
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+    def __repr__(self) -> str:
+        return (
+            f"{len(self.added)} added, "
+            f"{len(self.removed)} removed and "
+            f"{len(self.changed)} changed acronyms"
+        )
+
+    def to_dict(self) -> dict:
+        """Returns a dictionnary that represent the ChangeSet object.
+
+        Returns:
+            dict: The dictionnary.
+        """
+
+        def keys_to_list(keys: List[AcronymKey]) -> List[dict]:
+            return [
+                {
+                    "language": language.iso_639_1_code,
+                    "category": category.value,
+                    "name": name,
+                }
+                for language, category, name in keys
+            ]
+
+        return {
+            "added": keys_to_list(self.added),
+            "removed": keys_to_list(self.removed),
+            "changed": keys_to_list(self.changed),
+        }
+
+
+def diff_acronyms(
+    old: Acronyms,
+    new: Acronyms,
+    units: Optional[Iterable[Tuple[Language, Category]]] = None,
+) -> ChangeSet:
+    """Compare two acronyms data structures. An acronym has changed
+    if its meanings or their providers are not the same.
+
+    Args:
+        old (Acronyms): The previous acronyms.
+        new (Acronyms): The current acronyms.
+        units (Optional[Iterable[Tuple[Language, Category]]], optional): The languages and categories
+            to compare, the others are known to be the same. Every one of them if None. Defaults to None.
+
+    Returns:
+        ChangeSet: The differences.
+    """
+
+    if units is None:
+        units = [(language, category) for language in Language for category in Category]
+
+    changes = ChangeSet()
+
+    for language, category in sorted(units):
+        old_acronyms = old.get(language, {}).get(category, {})
+        new_acronyms = new.get(language, {}).get(category, {})
+
+        for name in sorted(new_acronyms.keys() - old_acronyms.keys()):
+            changes.added.append((language, category, name))
+
+        for name in sorted(old_acronyms.keys() - new_acronyms.keys()):
+            changes.removed.append((language, category, name))
+
+        for name in sorted(old_acronyms.keys() & new_acronyms.keys()):
+            if acronym_meanings(old_acronyms[name]) != acronym_meanings(
+                new_acronyms[name]
+            ):
+                changes.changed.append((language, category, name))
+
+    return changes
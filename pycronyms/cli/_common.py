@@ -0,0 +1,4 @@
+from pathlib import Path
+
+OUTPUT_DIRNAME = Path("pycronyms_output")
+SHARDS_DIRNAME = Path("shards")
@@ -33,6 +33,18 @@ def main() -> NoReturn:
 
     match subparser_name:
         case "fetch":
-            fetch(args.dir)
+            fetch(
+                args.dir,
+                args.max_workers,
+                None if args.no_cache else args.cache_dir,
+                args.incremental,
+                args.record,
+                args.replay,
+                args.preview,
+            )
         case "guess":
             guess(args.language, args.category, args.name, args.dir)
+
+
+if __name__ == "__main__":
+    main()
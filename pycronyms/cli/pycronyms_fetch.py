@@ -2,23 +2,49 @@ import os
 import logging
 import shutil
 import sys
-
-from typing import NoReturn, Dict, Tuple
+import multiprocessing
+
+from typing import Any, NoReturn, Dict, List, Tuple, Callable, Optional
+from functools import partial
+from time import perf_counter
+from concurrent.futures import (
+    FIRST_EXCEPTION,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from argparse import ArgumentParser, _SubParsersAction
 from pathlib import Path
 
-from pycronyms.pycronyms import Pycronyms
-from pycronyms.providers import Wikipedia
+from pycronyms.pycronyms import Pycronyms, SourcesDict, ProviderAcronymsDict
+from pycronyms.providers import Wikipedia, WikipediaReplay
 from pycronyms.providers import Custom
 from pycronyms._common import sorted_recursive
 from pycronyms.acronyms import Acronyms
-from pycronyms.handlers import HandlerJSON, HandlerCSV
+from pycronyms.handlers import HandlerJSON, HandlerCSV, HandlerSnapshot
+from pycronyms.handlers.json import read_json_file, write_to_json
+from pycronyms.handlers.json_index import default_index_filepath
 from pycronyms.handler_acronyms import HandlerAcronyms
-from pycronyms.statistics import Statistics
+from pycronyms.statistics import (
+    Statistics,
+    PLOT_DPI,
+    PREVIEW_DPI,
+    create_plot_file,
+    plot_digest,
+    read_plot_digest,
+)
+from pycronyms.page_cache import PageCache, default_cache_dirpath
+from pycronyms.page_fixtures import PageFixtures
+from pycronyms.metrics import Metrics
+from pycronyms.changes import ChangeSet, diff_acronyms
+from pycronyms.exceptions import PycronymsError
+
+from pycronyms.cli._common import OUTPUT_DIRNAME, SHARDS_DIRNAME
 
 logger = logging.getLogger(__file__)
 
-OUTPUT_DIRNAME = Path("pycronyms_output")
+ACRONYMS_GRAPH_FILENAME = "acronyms_graph.png"
 
 SUMMARY_MARKDOWN = """# Summary of acronyms
 
@@ -47,6 +73,7 @@ The matrix below shows the number of acronyms fetched by language and category.
 EXT_HANDLERS_ACRONYMS: Dict[str, type[HandlerAcronyms]] = {
     "json": HandlerJSON,
     "csv": HandlerCSV,
+    "snapshot": HandlerSnapshot,
 }
 
 
@@ -107,6 +134,62 @@ def create_subparser_fetch(
         type=Path,
     )
 
+    parser.add_argument(
+        "-w",
+        "--max-workers",
+        required=False,
+        default=None,
+        type=int,
+        help="Fetch the acronyms concurrently with a thread pool of this size.",
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        required=False,
+        default=default_cache_dirpath(),
+        type=Path,
+        help="Directory of the persistent pages cache.",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always download the pages, without the persistent cache.",
+    )
+
+    parser.add_argument(
+        "-i",
+        "--incremental",
+        action="store_true",
+        help="Only fetch again the sources that have changed since the previous fetch in the output directory.",
+    )
+
+    parser.add_argument(
+        "--preview",
+        action="store_true",
+        help="Render the chart with a low resolution, it is much faster.",
+    )
+
+    group = parser.add_mutually_exclusive_group()
+
+    group.add_argument(
+        "--record",
+        required=False,
+        default=None,
+        type=Path,
+        metavar="DIR",
+        help="Record the fetched pages into this fixtures directory.",
+    )
+
+    group.add_argument(
+        "--replay",
+        required=False,
+        default=None,
+        type=Path,
+        metavar="DIR",
+        help="Fetch offline, from the pages recorded in this fixtures directory.",
+    )
+
     return parser
 
 
@@ -192,22 +275,115 @@ def create_summary_markdown(
     return summary
 
 
-def write_acronyms(acronyms: Acronyms, dir: Path) -> NoReturn:
-    """Write acronyms into data files.
+def write_acronyms_file(
+    ext: str, acronyms: Acronyms, dir: Path, metrics: Optional[Metrics] = None
+) -> NoReturn:
+    """Write acronyms into the data file of a handler.
 
     Args:
+        ext (str): The handler extension, see `EXT_HANDLERS_ACRONYMS`.
         acronyms (Acronyms): The acronyms.
         dir (Path): The base directory path.
+        metrics (Optional[Metrics], optional): Record the duration of the handler. Defaults to None.
     """
 
-    basepath = dir / "acronyms"
+    handler_acronyms_class = EXT_HANDLERS_ACRONYMS[ext]
+    filepath = dir / f"acronyms.{ext}"
+    metrics = metrics or Metrics(enabled=False)
 
-    for ext, handler_acronyms_class in EXT_HANDLERS_ACRONYMS.items():
-        filepath = Path(f"{basepath}.{ext}")
+    with metrics.timer(f"write_{ext}"):
+        if handler_acronyms_class is HandlerJSON:
+            # The index is built from the offsets of the streamed acronyms
+            HandlerJSON.write(filepath, acronyms, default_index_filepath(filepath))
+        else:
+            handler_acronyms_class.write(filepath, acronyms)
+
+    logger.info(f"Successfully written acronyms to {filepath.absolute()}")
+
+
+def write_acronyms_shards(
+    acronyms: Acronyms, dir: Path, metrics: Optional[Metrics] = None
+) -> NoReturn:
+    """Write acronyms into a JSON file per language and category.
+
+    Args:
+        acronyms (Acronyms): The acronyms.
+        dir (Path): The base directory path.
+        metrics (Optional[Metrics], optional): Record the duration of the shards. Defaults to None.
+    """
+
+    shards_dirpath = dir / SHARDS_DIRNAME
+    metrics = metrics or Metrics(enabled=False)
+
+    with metrics.timer("write_shards"):
+        HandlerJSON.write_shards(shards_dirpath, acronyms)
+
+    logger.info(f"Successfully written acronyms shards to {shards_dirpath.absolute()}")
+
+
+def read_previous_fetch(
+    dir: Path,
+) -> Optional[Tuple[Acronyms, SourcesDict, ProviderAcronymsDict]]:
+    """Read the acronyms, the source revisions and the acronyms of every provider of a previous fetch.
+
+    Args:
+        dir (Path): The output directory path.
+
+    Returns:
+        Optional[Tuple[Acronyms, SourcesDict, ProviderAcronymsDict]]: The acronyms, the source revisions
+            and the acronyms of every provider, None if there is no previous fetch.
+    """
+
+    sources_filepath = dir / "sources.json"
+    provider_acronyms_filepath = dir / "provider_acronyms.json"
+
+    if not sources_filepath.exists() or not provider_acronyms_filepath.exists():
+        return None
+
+    try:
+        acronyms = HandlerJSON.read(dir / "acronyms.json")
+        sources = read_json_file(sources_filepath)
+        provider_acronyms = read_json_file(provider_acronyms_filepath)
+    except (PycronymsError, OSError, ValueError) as e:
+        logger.warning(f"Unable to read the previous fetch in {dir.absolute()}: {e}")
+
+        return None
+
+    return acronyms, sources, provider_acronyms
+
+
+def write_fetch_metadatas(
+    sources: Optional[SourcesDict],
+    provider_acronyms: ProviderAcronymsDict,
+    changes: Optional[ChangeSet],
+    dir: Path,
+) -> NoReturn:
+    """Write the source revisions, the acronyms of every provider and the changes since the previous fetch.
+
+    Args:
+        sources (Optional[SourcesDict]): The source revisions, not written if None.
+        provider_acronyms (ProviderAcronymsDict): The acronyms of every provider, before being merged.
+        changes (Optional[ChangeSet]): The changes, if there is a previous fetch.
+        dir (Path): The base directory path.
+    """
+
+    if sources is not None:
+        filepath = dir / "sources.json"
+        write_to_json(sources, filepath)
+        logger.info(f"Successfully written the sources to {filepath.absolute()}")
+
+    filepath = dir / "provider_acronyms.json"
+    write_to_json(provider_acronyms, filepath)
+    logger.info(
+        f"Successfully written the acronyms of every provider to {filepath.absolute()}"
+    )
 
-        handler_acronyms_class.write(filepath, acronyms)
+    if changes is None:
+        return
 
-        logger.info(f"Successfully written acronyms to {filepath.absolute()}")
+    filepath = dir / "changes.json"
+    write_to_json(changes.to_dict(), filepath)
+    logger.info(f"Successfully written the changes to {filepath.absolute()}")
 
 
 def write_markdown_summary(
@@ -229,30 +405,161 @@ def write_markdown_summary(
     logger.info(f"Successfully written the markdown summary to {filepath.absolute()}")
 
 
-def write_statistics(statistics: Statistics, acronyms_graph_filepath: Path) -> NoReturn:
+def write_statistics_csv(
+    statistics: Statistics, metrics: Optional[Metrics] = None
+) -> NoReturn:
     """It updates, creates if needed, a CSV file to track acronyms statistics by date.
-    It also create a plot PNG file.
 
     Args:
         statistics (Statistics): The acronyms statistics.
-        acronyms_graph_filepath (Path): The graph file path.
+        metrics (Optional[Metrics], optional): Record the duration of the CSV update. Defaults to None.
     """
 
-    statistics.append_to_csv()
+    metrics = metrics or Metrics(enabled=False)
+
+    with metrics.timer("statistics"):
+        statistics.append_to_csv()
     logger.info(
         f"Successfully wrote the CSV data to {statistics.csv_destination_path.absolute()}"
     )
 
-    statistics.create_plot(acronyms_graph_filepath)
-    logger.info(f"Successfully wrote the chart to {acronyms_graph_filepath.absolute()}")
 
+def get_process_context() -> multiprocessing.context.BaseContext:
+    """Returns the multiprocessing context of the output processes. Forking is
+    much cheaper than starting a new interpreter, but only safe on Linux.
+
+    Returns:
+        multiprocessing.context.BaseContext: The context.
+    """
+
+    if sys.platform.startswith("linux"):
+        return multiprocessing.get_context("fork")
+
+    return multiprocessing.get_context("spawn")
+
+
+def run_output_tasks(
+    tasks: List[Callable[[], Any]],
+    process_tasks: Optional[Dict[str, Callable[[], Any]]] = None,
+    metrics: Optional[Metrics] = None,
+) -> NoReturn:
+    """Run independent output tasks concurrently, in a thread pool, and in a process pool
+    for the CPU bound ones. When a task fails, the pending ones are cancelled and the
+    running ones are awaited, so nothing is written anymore once the error is raised.
+
+    The process tasks must be picklable, they are submitted before any thread is started,
+    so the processes are never forked while a thread holds a lock.
+
+    Args:
+        tasks (List[Callable[[], Any]]): The thread tasks.
+        process_tasks (Optional[Dict[str, Callable[[], Any]]], optional): The process tasks per name. Defaults to None.
+        metrics (Optional[Metrics], optional): Record the duration of every process task with its name. Defaults to None.
+
+    Raises:
+        Exception: The error of the first failed task.
+    """
+
+    process_tasks = process_tasks or {}
+    metrics = metrics or Metrics(enabled=False)
+
+    def record(name: str, start: float) -> Callable[[Future], None]:
+        return lambda _: metrics.add(name, perf_counter() - start)
+
+    with (
+        ProcessPoolExecutor(
+            max_workers=max(len(process_tasks), 1), mp_context=get_process_context()
+        ) as process_executor,
+        ThreadPoolExecutor(
+            max_workers=max(len(tasks), 1), thread_name_prefix="pycronyms_output"
+        ) as thread_executor,
+    ):
+        futures = []
+
+        for name, task in process_tasks.items():
+            future = process_executor.submit(task)
+            future.add_done_callback(record(name, perf_counter()))
+            futures.append(future)
+
+        futures += [thread_executor.submit(task) for task in tasks]
+
+        _, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+
+        for future in not_done:
+            future.cancel()
+
+    for future in futures:
+        if not future.cancelled() and future.exception() is not None:
+            raise future.exception()
+
+
+def write_metrics(metrics: Metrics, filepath: Path) -> NoReturn:
+    """Write the fetch metrics, the durations and the counters per stage and provider.
+
+    Args:
+        metrics (Metrics): The metrics.
+        filepath (Path): The file path.
+    """
+
+    metrics.write(filepath)
+
+    logger.info(f"Successfully written the metrics to {filepath.absolute()}")
 
-def fetch(dir: Path) -> NoReturn:
+
+def update_unchanged_fetch(
+    statistics: Statistics, dir: Path, metrics: Metrics, dpi: int = PLOT_DPI
+) -> NoReturn:
+    """Update the output directory of a previous fetch whose acronyms have not changed.
+    The statistics are appended to its history, the chart is rendered again only
+    if the history has changed, then the metrics are written.
+
+    Args:
+        statistics (Statistics): The acronyms statistics.
+        dir (Path): The output directory path.
+        metrics (Metrics): The metrics.
+        dpi (int, optional): The plot resolution. Defaults to PLOT_DPI.
+    """
+
+    statistics.csv_source_path = dir / "statistics.csv"
+    statistics.csv_destination_path = statistics.csv_source_path
+
+    # Like when every output is written, the history before the statistics are appended
+    series = statistics.series
+
+    write_statistics_csv(statistics, metrics)
+
+    acronyms_graph_filepath = dir / ACRONYMS_GRAPH_FILENAME
+    with metrics.timer("plot"):
+        rendered = create_plot_file(
+            series, acronyms_graph_filepath, acronyms_graph_filepath, dpi
+        )
+    if rendered is True:
+        logger.info(
+            f"Successfully wrote the chart to {acronyms_graph_filepath.absolute()}"
+        )
+
+    write_metrics(metrics, dir / "metrics.json")
+
+
+def fetch(
+    dir: Path,
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[Path] = None,
+    incremental: bool = False,
+    record_dir: Optional[Path] = None,
+    replay_dir: Optional[Path] = None,
+    preview: bool = False,
+) -> NoReturn:
     """It fetchs every acronyms with every available providers. Once it has been fetched,
     the objects representing them are going to be written in JSON files.
 
     Args:
         dir (Path): The output directory path.
+        max_workers (Optional[int], optional): The fetch thread pool size. Defaults to None.
+        cache_dir (Optional[Path], optional): The persistent pages cache directory, no cache if None. Defaults to None.
+        incremental (bool, optional): Reuse the acronyms of the previous fetch whose sources have not changed. Defaults to False.
+        record_dir (Optional[Path], optional): Record the fetched pages into this fixtures directory. Defaults to None.
+        replay_dir (Optional[Path], optional): Fetch from the pages recorded in this fixtures directory, without any request. Defaults to None.
+        preview (bool, optional): Render the plot with a low resolution, it is much faster. Defaults to False.
     """
 
     logging.basicConfig(format="%(asctime)s - %(levelname)s - %(message)s")
@@ -262,13 +569,69 @@ def fetch(dir: Path) -> NoReturn:
 
     logger.setLevel(logging.DEBUG)
 
-    pycronms = Pycronyms()
+    # Nothing is downloaded when replaying
+    page_cache = None
+    if cache_dir is not None and replay_dir is None:
+        page_cache = PageCache(cache_dir)
+
+    wikipedia: Wikipedia
+    if replay_dir is not None:
+        wikipedia = WikipediaReplay(PageFixtures(replay_dir))
+        logger.info(f"Replaying the pages recorded in {replay_dir.absolute()}.")
+    else:
+        recorder = None if record_dir is None else PageFixtures(record_dir)
+        wikipedia = Wikipedia(page_cache, recorder)
+
+    metrics = Metrics()
+
+    # The source revisions are only requested when they are reused by the next fetch
+    pycronms = Pycronyms(
+        max_workers=max_workers, metrics=metrics, track_sources=incremental
+    )
     pycronms.add_provider(Custom())
-    pycronms.add_provider(Wikipedia())
+    pycronms.add_provider(wikipedia)
+
+    previous = read_previous_fetch(dir) if incremental else None
+    if previous is not None:
+        _, sources, provider_acronyms = previous
+        pycronms.reuse(provider_acronyms, sources)
+        logger.info(f"Reusing the previous fetch in {dir.absolute()}.")
 
     pycronms.fetch_all()
     logger.info(f"Fetched {pycronms.amount} acronyms.")
 
+    if page_cache is not None:
+        logger.info(
+            f"Pages cache {page_cache.dirpath.absolute()}: "
+            f"{page_cache.hits} hits, {page_cache.misses} misses."
+        )
+
+        evicted = page_cache.evict()
+        if evicted:
+            logger.info(f"Evicted {evicted} pages from the cache.")
+
+    changes: Optional[ChangeSet] = None
+    if previous is not None:
+        # Only the languages and categories fetched again can have changed
+        changes = diff_acronyms(previous[0], pycronms.acronyms, pycronms.refreshed)
+        logger.info(f"Since the previous fetch, {changes}.")
+
+        if len(changes) == 0:
+            try:
+                update_unchanged_fetch(
+                    pycronms.statistics,
+                    dir,
+                    metrics,
+                    PREVIEW_DPI if preview else PLOT_DPI,
+                )
+            except Exception as e:
+                logger.exception(e)
+
+                sys.exit(1)
+
+            logger.info(f"Nothing has changed, kept the acronyms of {dir.absolute()}.")
+            return
+
     # The following instructions work as a transaction, everything must pass.
     # Otherwise nothing must persist.
 
@@ -283,21 +646,69 @@ def fetch(dir: Path) -> NoReturn:
     os.makedirs(dir, exist_ok=True)
     logger.info(f"Created the directory {dir.absolute()} if needed.")
 
-    acronyms = sorted_recursive(pycronms.acronyms)
+    with metrics.timer("sort"):
+        acronyms = sorted_recursive(pycronms.acronyms)
 
     statistics = pycronms.statistics
     statistics.csv_source_path = dir / "statistics.csv"
     statistics.csv_destination_path = tmp_dir / "statistics.csv"
 
-    acronyms_graph_filename = "acronyms_graph.png"
-    acronyms_graph_filepath = tmp_dir / acronyms_graph_filename
+    acronyms_graph_filepath = tmp_dir / ACRONYMS_GRAPH_FILENAME
+
+    # Every output file is written by its own task, the metrics are written last
+    tasks = [
+        *(
+            partial(write_acronyms_file, ext, acronyms, tmp_dir, metrics)
+            for ext in EXT_HANDLERS_ACRONYMS
+        ),
+        partial(write_acronyms_shards, acronyms, tmp_dir, metrics),
+        partial(
+            write_fetch_metadatas,
+            pycronms.sources if pycronms.track_sources else None,
+            pycronms.provider_acronyms,
+            changes,
+            tmp_dir,
+        ),
+        partial(write_statistics_csv, statistics, metrics),
+        partial(
+            write_markdown_summary,
+            statistics,
+            tmp_dir / "README.md",
+            "/" / dir / ACRONYMS_GRAPH_FILENAME,
+        ),
+    ]
 
     try:
-        write_acronyms(acronyms, tmp_dir)
-        write_statistics(statistics, acronyms_graph_filepath)
-        write_markdown_summary(
-            statistics, tmp_dir / "README.md", "/" / dir / acronyms_graph_filename
+        # matplotlib renders the plot in its own process, from built-in objects.
+        # The previous plot is reused when its digest matches.
+        series = statistics.series
+        dpi = PREVIEW_DPI if preview else PLOT_DPI
+        previous_graph_filepath = dir / ACRONYMS_GRAPH_FILENAME
+
+        process_tasks = {}
+        if read_plot_digest(previous_graph_filepath) == plot_digest(series, dpi):
+            tasks.append(
+                partial(
+                    create_plot_file,
+                    series,
+                    acronyms_graph_filepath,
+                    previous_graph_filepath,
+                    dpi,
+                )
+            )
+            logger.info("The statistics have not changed, reusing the previous chart.")
+        else:
+            process_tasks["plot"] = partial(
+                create_plot_file, series, acronyms_graph_filepath, None, dpi
+            )
+
+        with metrics.timer("output"):
+            run_output_tasks(tasks, process_tasks, metrics)
+        logger.info(
+            f"Successfully wrote the chart to {acronyms_graph_filepath.absolute()}"
         )
+
+        write_metrics(metrics, tmp_dir / "metrics.json")
     except Exception as e:
         logger.exception(e)
 
@@ -12,9 +12,11 @@ from pycronyms.category import Category
 from pycronyms.exceptions import PycronymsError
 from pycronyms.acronyms import Acronyms
 from pycronyms.acronym import Acronym
-from pycronyms.handlers import HandlerJSON
+from pycronyms.handlers import HandlerJSON, HandlerSnapshot
+from pycronyms.handlers.json import MANIFEST_FILENAME
+from pycronyms.indexes import IndexFuzzy
 
-from pycronyms.cli.pycronyms_fetch import OUTPUT_DIRNAME
+from pycronyms.cli._common import OUTPUT_DIRNAME, SHARDS_DIRNAME
 
 from thefuzz import process
 
@@ -23,6 +25,9 @@ logger = logging.getLogger(__file__)
 BASE_DIRPATH = Path(os.path.dirname(__file__))
 EMBEDDED_ACRONYMS_DIR = BASE_DIRPATH / ".." / OUTPUT_DIRNAME
 
+# Amount of close names suggested for an acronym that has not been fetched
+SUGGESTIONS_AMOUNT = 3
+
 
 def create_subparser_guess(
     subparsers: "_SubParsersAction[ArgumentParser]",
@@ -64,21 +69,54 @@ def create_subparser_guess(
     return parser
 
 
+def read_acronyms(
+    dir: Path, language: Optional[Language] = None, category: Optional[Category] = None
+) -> Acronyms:
+    """Read the acronyms of an output directory. With a language and a category,
+    only their shard is read if the directory has been sharded. Otherwise the binary
+    snapshot is memory mapped when it exists, or the JSON file is fully loaded.
+
+    Args:
+        dir (Path): The output directory.
+        language (Optional[Language], optional): The only needed language. Defaults to None.
+        category (Optional[Category], optional): The only needed category. Defaults to None.
+
+    Returns:
+        Acronyms: The acronyms, they may be read on demand.
+    """
+
+    shards_dirpath = dir / SHARDS_DIRNAME
+
+    if language and category and (shards_dirpath / MANIFEST_FILENAME).exists():
+        return HandlerJSON.read_shards(shards_dirpath, language, category)
+
+    snapshot_filepath = dir / "acronyms.snapshot"
+
+    if snapshot_filepath.exists():
+        return HandlerSnapshot.open(snapshot_filepath)
+
+    return HandlerJSON.read(dir / "acronyms.json")
+
+
 def get_metadatas(
     acronyms: Acronyms,
     language: Optional[Language],
     category: Optional[Category],
     name: Optional[str],
+    index: Optional[IndexFuzzy] = None,
 ) -> Tuple[str, Set[str], str, str]:
     """Get the acronym metadatas, it returns an acronym meaning with
     specific given parameters. If there are no language and no category,
     they will be selected randomly, same behavior for the name.
+    For a name that has not been fetched, the closest fetched ones are printed.
 
     Args:
         acronyms (AcronymsDict): Every acronyms dict.
         language (Optional[Language]): The optional acronym language
         category (Optional[Category]): The optional acronym category
         name (Optional[str]): The optional acronym name
+        index (Optional[IndexFuzzy], optional): The index of every acronyms, used to suggest close names.
+            It is only built from the acronyms if a name is missing and it is None. Defaults to None.
 
     Raises:
         PycronymsError: It has found zero acronyms
@@ -89,6 +127,8 @@ def get_metadatas(
         Tuple[str, Set[str], str, str]: A tuple where each element respectively represent, acronym name, meanings, language, category.
     """
 
+    all_acronyms = acronyms
+
     if language and category:
         if not language in acronyms:
             raise PycronymsError(f"The language {language} has zero acronyms.")
@@ -123,6 +163,21 @@ def get_metadatas(
         name = name.upper()
 
         if not name in acronyms:
+            if index is None:
+                index = IndexFuzzy(all_acronyms)
+
+            suggestions = index.search(
+                name, k=SUGGESTIONS_AMOUNT, language=language, category=category
+            )
+
+            if len(suggestions) > 0:
+                print(f"The acronym '{name}' has not been fetched, did you mean:")
+
+                for suggested_name, _ in suggestions:
+                    print("-", suggested_name)
+
+                print()
+
             raise PycronymsError(
                 f"The acronym '{name}' has not been fetched "
                 f"with the language '{language}' "
@@ -219,7 +274,7 @@ def guess(
     )
 
     try:
-        acronyms = HandlerJSON.read(dir / "acronyms.json")
+        acronyms = read_acronyms(dir, user_language, user_category)
 
         print(
             "To leave the guessing game, write 'quit' or 'q', to continue write 'continue' or 'c'."
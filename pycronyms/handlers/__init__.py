@@ -1,7 +1,12 @@
 from pycronyms.handlers.json import HandlerJSON
 from pycronyms.handlers.csv import HandlerCSV
+from pycronyms.handlers.snapshot import HandlerSnapshot, Snapshot
+from pycronyms.handlers.json_index import JSONIndex
 
 __all__ = [
     "HandlerJSON",
     "HandlerCSV",
+    "HandlerSnapshot",
+    "Snapshot",
+    "JSONIndex",
 ]
@@ -1,4 +1,6 @@
-from typing import NoReturn
+import csv
+
+from typing import NoReturn, List
 from pathlib import Path
 
 from pycronyms.handler_acronyms import HandlerAcronyms
@@ -8,8 +10,6 @@ from pycronyms.language import Language
 from pycronyms.category import Category
 from pycronyms.exceptions import HandlerError
 
-import pandas as pd
-
 
 class HandlerCSV(HandlerAcronyms):
     """CSV acronyms handler. It reads and writes CSV files."""
@@ -20,6 +20,7 @@ class HandlerCSV(HandlerAcronyms):
     @classmethod
     def read(cls, filepath: Path) -> Acronyms:
         """Read a CSV file then get a Acronyms Python object with its content.
+        The file is streamed row by row, the raw content is never entirely loaded.
 
         Args:
             filepath (Path): The source CSV file path.
@@ -33,28 +34,47 @@ class HandlerCSV(HandlerAcronyms):
 
         acronyms = create_acronyms()
 
-        df: pd.DataFrame
         try:
-            df = pd.read_csv(filepath)
-        except Exception as e:
+            with open(filepath, newline="", encoding="utf-8") as f:
+                reader = csv.reader(f)
+
+                header = tuple(next(reader, ()))
+                if header != cls.columns:
+                    raise HandlerError(
+                        cls.name, filepath, f"Unexpected CSV header {header}"
+                    )
+
+                for row in reader:
+                    cls.__add_row(acronyms, row)
+        except HandlerError as e:
+            raise e
+        except (OSError, csv.Error, ValueError, KeyError) as e:
             raise HandlerError(cls.name, filepath) from e
 
-        for _, row in df.iterrows():
-            name, language, category, provider, meaning = list(row)
+        return acronyms
 
-            acronym = Acronym(name=name, meaning=meaning, provider=provider)
+    @staticmethod
+    def __add_row(acronyms: Acronyms, row: List[str]):
+        """Add the acronym of a CSV row to the acronyms.
 
-            language = Category._value2member_map_[language]
-            category = Category._value2member_map_[category]
+        Args:
+            acronyms (Acronyms): The acronyms.
+            row (List[str]): The CSV row.
+        """
 
-            entry = acronyms[language][category]
+        name, language, category, provider, meaning = row
 
-            if name in entry:
-                entry[name].add_extra(acronym)
-            else:
-                entry[name] = acronym
+        acronym = Acronym(name=name, meaning=meaning, provider=provider)
 
-        return acronyms
+        language = Language._value2member_map_[language]
+        category = Category._value2member_map_[category]
+
+        entry = acronyms[language][category]
+
+        if acronym.name in entry:
+            entry[acronym.name].add_extra(acronym)
+        else:
+            entry[acronym.name] = acronym
 
     @classmethod
     def write(cls, filepath: Path, data: Acronyms) -> NoReturn:
@@ -68,26 +88,30 @@ class HandlerCSV(HandlerAcronyms):
             HandlerError: An error occured when writting to the CSV file.
         """
 
-        df_data = {col: [] for col in cls.columns}
-
-        def append_acronym(acronym: Acronym, language: Language, category: Category):
-            df_data["name"].append(acronym.name)
-            df_data["language"].append(language.iso_639_1_code)
-            df_data["category"].append(category.value)
-            df_data["provider"].append(acronym.provider)
-            df_data["meaning"].append(acronym.meaning)
+        def write_acronym(
+            writer, acronym: Acronym, language: Language, category: Category
+        ):
+            writer.writerow(
+                (
+                    acronym.name,
+                    language.iso_639_1_code,
+                    category.value,
+                    acronym.provider,
+                    acronym.meaning,
+                )
+            )
 
-        for language, lv in data.items():
-            for category, cv in lv.items():
-                for _, acronym in cv.items():
-                    append_acronym(acronym, language, category)
-
-                    for extra in acronym.extras:
-                        append_acronym(extra, language, category)
+        try:
+            with open(filepath, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f, lineterminator="\n")
+                writer.writerow(cls.columns)
 
-        df = pd.DataFrame(df_data, columns=cls.columns)
+                for language, lv in data.items():
+                    for category, cv in lv.items():
+                        for _, acronym in cv.items():
+                            write_acronym(writer, acronym, language, category)
 
-        try:
-            df.to_csv(filepath, index=False, header=True)
+                            for extra in acronym.extras:
+                                write_acronym(writer, extra, language, category)
         except Exception as e:
             raise HandlerError(cls.name, filepath) from e
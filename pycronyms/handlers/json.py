@@ -1,14 +1,25 @@
-from typing import Any, NoReturn
+import os
+import re
+import hashlib
+
+from typing import Any, NoReturn, Iterator, List, Optional, Tuple
+from itertools import islice
 from pathlib import Path
 
 from pycronyms.handler_acronyms import HandlerAcronyms
 from pycronyms.acronyms import (
     Acronyms,
     AcronymsDict,
-    dict_from_acronyms,
+    GENERATOR_KEY,
+    GENERATOR_VALUE,
     acronyms_from_dict,
+    is_generated_dict,
+    create_acronyms,
 )
+from pycronyms.language import Language
+from pycronyms.category import Category
 from pycronyms.exceptions import HandlerError
+from pycronyms.handlers.json_index import JSONIndexWriter
 
 
 import orjson
@@ -45,6 +56,114 @@ def write_to_json(obj: Any, path: Path) -> NoReturn:
         f.write(obj_bytes.decode())
 
 
+# Acronyms serialized together, a chunk is about 100 KiB
+ACRONYMS_PER_CHUNK = 1024
+# An acronym name in a chunk, followed by its JSON object. The other object keys are more indented.
+ACRONYM_KEY_RE: re.Pattern = re.compile(rb'\n      "(?:[^"\\]|\\.)*": ')
+
+type JSONBatch = Tuple[Language, Category, List[str]]
+
+
+def iter_acronyms_json_batches(
+    acronyms: Acronyms,
+) -> Iterator[Tuple[bytes, Optional[JSONBatch]]]:
+    """Yields the JSON chunks of acronyms, see `iter_acronyms_json`. A chunk of acronyms
+    comes with their language, category and names, see `iter_json_batch_entries`.
+
+    Args:
+        acronyms (Acronyms): The acronyms.
+
+    Yields:
+        Tuple[bytes, Optional[JSONBatch]]: A JSON chunk and its acronyms if any.
+    """
+
+    yield (
+        b"{\n  " + orjson.dumps(GENERATOR_KEY) + b": " + orjson.dumps(GENERATOR_VALUE),
+        None,
+    )
+
+    for language, lv in acronyms.items():
+        language_started = False
+
+        for category, cv in lv.items():
+            if len(cv) == 0:
+                continue
+
+            if language_started is False:
+                language_started = True
+                yield b",\n  " + orjson.dumps(language.iso_639_1_code) + b": {", None
+            else:
+                yield b"\n    },", None
+
+            yield b"\n    " + orjson.dumps(category.value) + b": {", None
+
+            separator = b""
+            items = iter(cv.items())
+
+            while batch := list(islice(items, ACRONYMS_PER_CHUNK)):
+                d = {}
+                for acronym_name, acronym in batch:
+                    d[acronym_name] = acronym.to_dict()
+                    del d[acronym_name]["name"]
+
+                # Without the braces, indented like in the whole acronyms dictionnary
+                value = orjson.dumps(d, option=orjson.OPT_INDENT_2)
+                chunk = separator + value[1:-2].replace(b"\n", b"\n    ")
+
+                yield chunk, (language, category, list(d))
+
+                separator = b","
+
+        if language_started is True:
+            yield b"\n    }\n  }", None
+
+    yield b"\n}", None
+
+
+def iter_json_batch_entries(
+    chunk: bytes, batch: JSONBatch
+) -> Iterator[Tuple[Language, Category, str, int, int]]:
+    """Yields the language, category, name, JSON object length and JSON object end offset
+    in the chunk of every acronym of a chunk.
+
+    Args:
+        chunk (bytes): The JSON chunk.
+        batch (JSONBatch): Its acronyms.
+
+    Yields:
+        Tuple[Language, Category, str, int, int]: An acronym entry.
+    """
+
+    language, category, names = batch
+
+    matches = list(ACRONYM_KEY_RE.finditer(chunk))
+    # An acronym JSON object ends before the separator of the next one
+    ends = [match.start() - 1 for match in matches[1:]] + [len(chunk)]
+
+    for name, match, end in zip(names, matches, ends):
+        yield language, category, name, end - match.end(), end
+
+
+def iter_acronyms_json(acronyms: Acronyms) -> Iterator[bytes]:
+    """Yields the JSON representation of acronyms chunk by chunk, a bounded amount of acronyms per chunk.
+    The concatenated chunks are the same bytes as serializing the generated dictionnary
+    with `orjson.OPT_INDENT_2`, without ever building it.
+
+    Args:
+        acronyms (Acronyms): The acronyms.
+
+    Yields:
+        bytes: A JSON chunk.
+    """
+
+    for chunk, _ in iter_acronyms_json_batches(acronyms):
+        yield chunk
+
+
+# Name of the file describing the shards of a directory
+MANIFEST_FILENAME = "manifest.json"
+
+
 class HandlerJSON(HandlerAcronyms):
     """JSON acronyms handler. It reads and writes JSON files."""
 
@@ -53,6 +172,7 @@ class HandlerJSON(HandlerAcronyms):
     @classmethod
     def read(cls, filepath: Path) -> Acronyms:
         """Read a JSON file then get a Acronyms Python object with its content.
+        If the file has been generated by pycronyms, the acronyms are not validated again.
 
         Args:
             filepath (Path): The source JSON file path.
@@ -70,25 +190,191 @@ class HandlerJSON(HandlerAcronyms):
         except Exception as e:
             raise HandlerError(cls.name, filepath) from e
 
-        acronyms = acronyms_from_dict(acronyms_dict)
+        acronyms = acronyms_from_dict(acronyms_dict, is_generated_dict(acronyms_dict))
 
         return acronyms
 
     @classmethod
-    def write(cls, filepath: Path, data: Acronyms) -> NoReturn:
+    def write(
+        cls, filepath: Path, data: Acronyms, index_filepath: Optional[Path] = None
+    ) -> NoReturn:
         """Write to a JSON file from a Acronyms Python object.
+        The file is streamed by chunks of acronyms, so the memory usage does not depend on the data size.
 
         Args:
             filepath (Path): The destination JSON file path.
             data (Acronyms): Acronyms to override the content to write to the file.
+            index_filepath (Optional[Path], optional): Also write the byte offset index of the acronyms, see `JSONIndex`. Defaults to None.
 
         Raises:
             HandlerError: An error occured when writting to the JSON file.
         """
 
-        d = dict_from_acronyms(data)
+        index_writer = None if index_filepath is None else JSONIndexWriter()
+        h = hashlib.sha256()
+
+        try:
+            with open(filepath, "wb") as f:
+                offset = 0
+
+                for chunk, batch in iter_acronyms_json_batches(data):
+                    f.write(chunk)
+
+                    if index_writer is not None:
+                        h.update(chunk)
+
+                        if batch is not None:
+                            for *entry, end in iter_json_batch_entries(chunk, batch):
+                                index_writer.add(*entry, offset + end)
+
+                    offset += len(chunk)
+        except Exception as e:
+            raise HandlerError(cls.name, filepath) from e
+
+        if index_writer is not None:
+            index_writer.write(index_filepath, filepath, h.digest())
+
+    @classmethod
+    def write_shards(cls, dirpath: Path, data: Acronyms) -> dict:
+        """Write a JSON file per language and category, `<language>/<category>.json`,
+        then a manifest with the amount of acronyms and the SHA-256 of every file.
+        Every shard is a generated acronyms JSON file, it can be read on its own.
+
+        Args:
+            dirpath (Path): The destination directory path.
+            data (Acronyms): The acronyms.
+
+        Raises:
+            HandlerError: An error occured when writting a shard or the manifest.
+
+        Returns:
+            dict: The manifest.
+        """
+
+        shards = {}
+        total = 0
+
+        for language, lv in data.items():
+            for category, cv in lv.items():
+                if len(cv) == 0:
+                    continue
+
+                path = f"{language.iso_639_1_code}/{category.value}.json"
+                filepath = dirpath / path
+                digest = hashlib.sha256()
+
+                try:
+                    os.makedirs(filepath.parent, exist_ok=True)
+
+                    with open(filepath, "wb") as f:
+                        for chunk in iter_acronyms_json({language: {category: cv}}):
+                            digest.update(chunk)
+                            f.write(chunk)
+                except Exception as e:
+                    raise HandlerError(cls.name, filepath) from e
+
+                shards.setdefault(language.iso_639_1_code, {})[category.value] = {
+                    "path": path,
+                    "count": len(cv),
+                    "sha256": digest.hexdigest(),
+                }
+                total += len(cv)
 
+        manifest = {GENERATOR_KEY: GENERATOR_VALUE, "total": total, "shards": shards}
+
+        filepath = dirpath / MANIFEST_FILENAME
         try:
-            write_to_json(d, filepath)
+            # Written last, a directory without manifest is incomplete
+            write_to_json(manifest, filepath)
         except Exception as e:
             raise HandlerError(cls.name, filepath) from e
+
+        return manifest
+
+    @classmethod
+    def read_manifest(cls, dirpath: Path) -> dict:
+        """Read the manifest of a shards directory.
+
+        Args:
+            dirpath (Path): The shards directory path.
+
+        Raises:
+            HandlerError: The manifest is missing or has not been generated by pycronyms.
+
+        Returns:
+            dict: The manifest.
+        """
+
+        filepath = dirpath / MANIFEST_FILENAME
+
+        try:
+            manifest = read_json_file(filepath)
+        except Exception as e:
+            raise HandlerError(cls.name, filepath) from e
+
+        if not is_generated_dict(manifest):
+            raise HandlerError(
+                cls.name, filepath, "The manifest has not been generated by pycronyms"
+            )
+
+        return manifest
+
+    @classmethod
+    def read_shards(
+        cls,
+        dirpath: Path,
+        language: Optional[Language] = None,
+        category: Optional[Category] = None,
+    ) -> Acronyms:
+        """Read the shards of a directory, only the ones matching the language and the
+        category are opened. A shard whose SHA-256 differs from the manifest is refused.
+
+        Args:
+            dirpath (Path): The shards directory path.
+            language (Optional[Language], optional): Only read this language, every one if None. Defaults to None.
+            category (Optional[Category], optional): Only read this category, every one if None. Defaults to None.
+
+        Raises:
+            HandlerError: An error occured when reading the manifest or a shard.
+
+        Returns:
+            Acronyms: The acronyms of the read shards.
+        """
+
+        manifest = cls.read_manifest(dirpath)
+        acronyms = create_acronyms()
+
+        for lk, lv in manifest["shards"].items():
+            if language is not None and lk != language.iso_639_1_code:
+                continue
+
+            for ck, shard in lv.items():
+                if category is not None and ck != category.value:
+                    continue
+
+                filepath = dirpath / shard["path"]
+
+                try:
+                    content = filepath.read_bytes()
+                except Exception as e:
+                    raise HandlerError(cls.name, filepath) from e
+
+                if hashlib.sha256(content).hexdigest() != shard["sha256"]:
+                    raise HandlerError(
+                        cls.name, filepath, "The shard does not match the manifest"
+                    )
+
+                try:
+                    acronyms_dict = orjson.loads(content)
+                except Exception as e:
+                    raise HandlerError(cls.name, filepath) from e
+
+                shard_acronyms = acronyms_from_dict(
+                    acronyms_dict, is_generated_dict(acronyms_dict)
+                )
+
+                for l, scv in shard_acronyms.items():
+                    for c, cv in scv.items():
+                        acronyms[l][c].update(cv)
+
+        return acronyms
@@ -0,0 +1,302 @@
+import os
+import mmap
+import struct
+import hashlib
+
+from typing import List, Tuple, Optional, Self
+from array import array
+from pathlib import Path
+from bisect import bisect_left
+
+import orjson
+
+from pycronyms.acronym import Acronym
+from pycronyms.language import Language
+from pycronyms.category import Category
+from pycronyms.exceptions import HandlerError, MissingAcronymError
+from pycronyms.handlers.snapshot import to_little_endian
+
+# The index file starts with a header, then the entries sorted by key, then the keys blob.
+#
+# header: magic, version, entry count, JSON file size, JSON file modification time in nanoseconds,
+#   JSON file SHA-256, keys blob offset
+# entries: (key start, key end, value start, value end) per acronym, the key offsets are
+#   relative to the keys blob and the value offsets are the byte range in the JSON file
+# keys: "<language>\0<category>\0<name>" UTF-8 keys, their bytes order is the entries order
+MAGIC = b"PYCRJIDX"
+VERSION = 2
+HEADER = struct.Struct("<8sIQQq32sQ")
+ENTRY = struct.Struct("<QQQQ")
+
+# Suffix appended to the JSON file path by default
+INDEX_SUFFIX = ".idx"
+
+NAME = "json_index"
+
+
+def index_key(name: str, language: Language, category: Category) -> bytes:
+    """Returns the index key of an acronym.
+
+    Args:
+        name (str): The acronym name.
+        language (Language): The language.
+        category (Category): The category.
+
+    Returns:
+        bytes: The key.
+    """
+
+    return f"{language.iso_639_1_code}\0{category.value}\0{name}".encode()
+
+
+def file_sha256(filepath: Path) -> bytes:
+    """Returns the SHA-256 of a file, read by blocks.
+
+    Args:
+        filepath (Path): The file path.
+
+    Returns:
+        bytes: The digest.
+    """
+
+    with open(filepath, "rb") as f:
+        return hashlib.file_digest(f, "sha256").digest()
+
+
+def default_index_filepath(json_filepath: Path) -> Path:
+    """Returns the index file path of a JSON file, `acronyms.json.idx` for `acronyms.json`.
+
+    Args:
+        json_filepath (Path): The JSON file path.
+
+    Returns:
+        Path: The index file path.
+    """
+
+    return json_filepath.with_name(json_filepath.name + INDEX_SUFFIX)
+
+
+class JSONIndexWriter:
+    """Collects the byte ranges of the acronyms while a JSON file is streamed,
+    then writes them as a sorted index."""
+
+    def __init__(self):
+        self.__entries: List[Tuple[bytes, int, int]] = []
+
+    def add(
+        self,
+        language: Language,
+        category: Category,
+        name: str,
+        length: int,
+        end: int,
+    ):
+        """Add the byte range of an acronym JSON object.
+
+        Args:
+            language (Language): The language.
+            category (Category): The category.
+            name (str): The acronym name.
+            length (int): The JSON object length.
+            end (int): The JSON object end offset in the file.
+        """
+
+        self.__entries.append((index_key(name, language, category), end - length, end))
+
+    def write(self, filepath: Path, json_filepath: Path, json_sha256: bytes):
+        """Write the index file. The size, the modification time and the SHA-256
+        of the indexed JSON file are stored to detect a stale index.
+
+        Args:
+            filepath (Path): The destination index file path.
+            json_filepath (Path): The indexed JSON file path, it must have been written.
+            json_sha256 (bytes): The indexed JSON file SHA-256.
+
+        Raises:
+            HandlerError: An error occured when writting the index file.
+        """
+
+        self.__entries.sort()
+
+        entries = array("Q")
+        keys = bytearray()
+
+        for key, start, end in self.__entries:
+            entries.extend((len(keys), len(keys) + len(key), start, end))
+            keys += key
+
+        keys_offset = HEADER.size + len(self.__entries) * ENTRY.size
+
+        try:
+            stat = os.stat(json_filepath)
+            header = HEADER.pack(
+                MAGIC,
+                VERSION,
+                len(self.__entries),
+                stat.st_size,
+                stat.st_mtime_ns,
+                json_sha256,
+                keys_offset,
+            )
+
+            with open(filepath, "wb") as f:
+                f.write(header)
+                f.write(to_little_endian(entries))
+                f.write(keys)
+        except Exception as e:
+            raise HandlerError(NAME, filepath) from e
+
+
+class JSONIndex:
+    """Byte offset index of a generated acronyms JSON file. Both files are mapped in memory,
+    an acronym is found with a binary search on the index, then only its JSON object
+    is decoded, the rest of the JSON file is never read.
+
+    The index matches the JSON file if it has the same size and modification time. If only
+    the modification time differs, for example after a copy, the JSON file is hashed once
+    and compared with the SHA-256 stored in the index."""
+
+    def __init__(self, json_filepath: Path, index_filepath: Optional[Path] = None):
+        """Open a JSON file and its index.
+
+        Args:
+            json_filepath (Path): The JSON file path.
+            index_filepath (Optional[Path], optional): The index file path, see `default_index_filepath` if None. Defaults to None.
+
+        Raises:
+            HandlerError: The index is invalid or it does not match the JSON file.
+        """
+
+        if index_filepath is None:
+            index_filepath = default_index_filepath(json_filepath)
+
+        self.__index_mm: Optional[mmap.mmap] = None
+        self.__json_mm: Optional[mmap.mmap] = None
+
+        try:
+            with open(index_filepath, "rb") as f:
+                self.__index_mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            (
+                magic,
+                version,
+                self.__count,
+                json_size,
+                json_mtime_ns,
+                json_sha256,
+                self.__keys_offset,
+            ) = HEADER.unpack_from(self.__index_mm)
+        except (OSError, ValueError, struct.error) as e:
+            self.close()
+            raise HandlerError(NAME, index_filepath) from e
+
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise HandlerError(NAME, index_filepath, "Not a supported index file")
+
+        try:
+            stat = os.stat(json_filepath)
+
+            is_stale = stat.st_size != json_size or (
+                stat.st_mtime_ns != json_mtime_ns
+                and file_sha256(json_filepath) != json_sha256
+            )
+
+            if not is_stale:
+                with open(json_filepath, "rb") as f:
+                    self.__json_mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            self.close()
+            raise HandlerError(NAME, json_filepath) from e
+
+        if is_stale:
+            self.close()
+            raise HandlerError(
+                NAME, index_filepath, "The index does not match the JSON file"
+            )
+
+        self.json_filepath = json_filepath
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Close the memory mapped files."""
+
+        for mm in (self.__index_mm, self.__json_mm):
+            if mm is not None:
+                mm.close()
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def __entry(self, i: int) -> Tuple[int, int, int, int]:
+        return ENTRY.unpack_from(self.__index_mm, HEADER.size + i * ENTRY.size)
+
+    def __key(self, i: int) -> bytes:
+        key_start, key_end, _, _ = self.__entry(i)
+
+        return self.__index_mm[
+            self.__keys_offset + key_start : self.__keys_offset + key_end
+        ]
+
+    def find(
+        self, name: str, language: Language, category: Category
+    ) -> Optional[Tuple[int, int]]:
+        """Returns the byte range of an acronym JSON object in the JSON file.
+
+        Args:
+            name (str): The acronym name.
+            language (Language): The language.
+            category (Category): The category.
+
+        Returns:
+            Optional[Tuple[int, int]]: The start and end offsets, None if the acronym is missing.
+        """
+
+        key = index_key(name, language, category)
+
+        i = bisect_left(range(self.__count), key, key=self.__key)
+
+        if i == self.__count or self.__key(i) != key:
+            return None
+
+        _, _, start, end = self.__entry(i)
+
+        return start, end
+
+    def get_acronym(self, name: str, language: Language, category: Category) -> Acronym:
+        """Retrieve an acronym, only its JSON object is decoded.
+
+        Args:
+            name (str): The acronym name.
+            language (Language): The language.
+            category (Category): The category.
+
+        Raises:
+            MissingAcronymError: The requested acronym is not indexed.
+            HandlerError: The JSON object can not be decoded.
+
+        Returns:
+            Acronym: The correspoding acronym object.
+        """
+
+        offsets = self.find(name, language, category)
+
+        if offsets is None:
+            raise MissingAcronymError(name, language, category)
+
+        start, end = offsets
+
+        try:
+            d = orjson.loads(self.__json_mm[start:end])
+        except orjson.JSONDecodeError as e:
+            raise HandlerError(
+                NAME, self.json_filepath, "The index does not match the JSON file"
+            ) from e
+
+        # The indexed JSON files are written by pycronyms, they have already been validated
+        return Acronym.from_dict(d | {"name": name}, trusted=True)
@@ -0,0 +1,412 @@
+import sys
+import mmap
+import struct
+
+from typing import NoReturn, Dict, List, Tuple, Iterator, Self, Optional
+from collections.abc import Mapping
+from array import array
+from pathlib import Path
+from bisect import bisect_left
+
+from pycronyms.handler_acronyms import HandlerAcronyms
+from pycronyms.acronyms import Acronyms, create_acronyms
+from pycronyms.acronym import Acronym
+from pycronyms.language import Language
+from pycronyms.category import Category
+from pycronyms.exceptions import HandlerError, MissingAcronymError
+
+# The file starts with a header, then every section is a packed array of little-endian integers.
+#
+# header: magic, version, group count, string count, then the sections offsets
+# groups: (language, category, first entry, entry count) per group
+# entries: (name, meaning, provider, first extra, extra count) per acronym, sorted by name in each group
+# extras: (meaning, provider) per extra meaning
+# strings: string count + 1 offsets into the UTF-8 blob that follows, strings are referenced by index
+MAGIC = b"PYCRSNAP"
+VERSION = 1
+HEADER = struct.Struct("<8sIIIQQQQQ")
+GROUP = struct.Struct("<IIII")
+ENTRY = struct.Struct("<IIIII")
+EXTRA = struct.Struct("<II")
+STRING_OFFSETS = struct.Struct("<QQ")
+
+
+def to_little_endian(a: array) -> bytes:
+    """Returns the bytes of an array with a little-endian byte order.
+
+    Args:
+        a (array): The array.
+
+    Returns:
+        bytes: The bytes.
+    """
+
+    if sys.byteorder == "big":
+        a = array(a.typecode, a)
+        a.byteswap()
+
+    return a.tobytes()
+
+
+class SnapshotCategory(Mapping):
+    """Read-only mapping of the acronyms of a language and a category in a snapshot.
+    Names are found with a binary search and acronyms are decoded on demand.
+
+    Deleted names are only hidden, the file is never modified."""
+
+    def __init__(self, snapshot: "Snapshot", first: int, count: int):
+        self.__snapshot = snapshot
+        self.__first = first
+        self.__count = count
+        self.__deleted = set()
+
+    def __index(self, name: str) -> int:
+        """Returns the snapshot entry index of an acronym name, -1 if it is missing.
+
+        Args:
+            name (str): The acronym name.
+
+        Returns:
+            int: The entry index.
+        """
+
+        if name in self.__deleted:
+            return -1
+
+        lo, hi = self.__first, self.__first + self.__count
+        i = bisect_left(range(lo, hi), name, key=self.__snapshot._entry_name) + lo
+
+        if i < hi and self.__snapshot._entry_name(i) == name:
+            return i
+
+        return -1
+
+    def __getitem__(self, name: str) -> Acronym:
+        i = self.__index(name)
+
+        if i == -1:
+            raise KeyError(name)
+
+        return self.__snapshot._entry_acronym(i)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self.__index(name) != -1
+
+    def __delitem__(self, name: str):
+        if self.__index(name) == -1:
+            raise KeyError(name)
+
+        self.__deleted.add(name)
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self.__first, self.__first + self.__count):
+            name = self.__snapshot._entry_name(i)
+
+            if name not in self.__deleted:
+                yield name
+
+    def __len__(self) -> int:
+        return self.__count - len(self.__deleted)
+
+
+class Snapshot(Mapping):
+    """Read-only acronyms of a binary snapshot file, mapped in memory.
+
+    Opening it only reads the header and the groups table,
+    it can be used like `Acronyms` to read the acronyms on demand."""
+
+    def __init__(self, filepath: Path):
+        """Open a snapshot file.
+
+        Args:
+            filepath (Path): The snapshot file path.
+
+        Raises:
+            HandlerError: The file is not a valid snapshot.
+        """
+
+        self.__mm: Optional[mmap.mmap] = None
+
+        try:
+            with open(filepath, "rb") as f:
+                self.__mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            (
+                magic,
+                version,
+                group_count,
+                string_count,
+                groups_offset,
+                self.__entries_offset,
+                self.__extras_offset,
+                self.__strings_offset,
+                self.__blob_offset,
+            ) = HEADER.unpack_from(self.__mm)
+        except (OSError, ValueError, struct.error) as e:
+            self.close()
+            raise HandlerError(HandlerSnapshot.name, filepath) from e
+
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise HandlerError(
+                HandlerSnapshot.name, filepath, "Not a supported snapshot file"
+            )
+
+        self.__languages: Dict[Language, Dict[Category, SnapshotCategory]] = {}
+
+        try:
+            for i in range(group_count):
+                language_id, category_id, first, count = GROUP.unpack_from(
+                    self.__mm, groups_offset + i * GROUP.size
+                )
+
+                language = Language._value2member_map_[self._string(language_id)]
+                category = Category._value2member_map_[self._string(category_id)]
+
+                categories = self.__languages.setdefault(language, {})
+                categories[category] = SnapshotCategory(self, first, count)
+        except (KeyError, ValueError, struct.error) as e:
+            self.close()
+            raise HandlerError(HandlerSnapshot.name, filepath) from e
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Close the memory mapped file."""
+
+        if self.__mm is not None:
+            self.__mm.close()
+
+    def _string(self, i: int) -> str:
+        """Returns a string of the strings table.
+
+        Args:
+            i (int): The string index.
+
+        Returns:
+            str: The string.
+        """
+
+        start, end = STRING_OFFSETS.unpack_from(
+            self.__mm, self.__strings_offset + i * 8
+        )
+
+        return self.__mm[self.__blob_offset + start : self.__blob_offset + end].decode()
+
+    def _entry_name(self, i: int) -> str:
+        """Returns the acronym name of an entry.
+
+        Args:
+            i (int): The entry index.
+
+        Returns:
+            str: The acronym name.
+        """
+
+        (name_id,) = struct.unpack_from(
+            "<I", self.__mm, self.__entries_offset + i * ENTRY.size
+        )
+
+        return self._string(name_id)
+
+    def _entry_acronym(self, i: int) -> Acronym:
+        """Decode the acronym of an entry.
+
+        Args:
+            i (int): The entry index.
+
+        Returns:
+            Acronym: The acronym.
+        """
+
+        name_id, meaning_id, provider_id, first_extra, extra_count = ENTRY.unpack_from(
+            self.__mm, self.__entries_offset + i * ENTRY.size
+        )
+
+        name = self._string(name_id)
+
+        # Snapshots are written by pycronyms, the acronyms have already been validated
+        acronym = Acronym.construct_trusted(
+            name, self._string(meaning_id), self._string(provider_id)
+        )
+
+        for j in range(first_extra, first_extra + extra_count):
+            extra_meaning_id, extra_provider_id = EXTRA.unpack_from(
+                self.__mm, self.__extras_offset + j * EXTRA.size
+            )
+
+            extra = Acronym.construct_trusted(
+                name, self._string(extra_meaning_id), self._string(extra_provider_id)
+            )
+            acronym.add_extra(extra)
+
+        return acronym
+
+    def get_acronym(self, name: str, language: Language, category: Category) -> Acronym:
+        """Retrieve an acronym.
+
+        Args:
+            name (str): The acronym name.
+            language (Language): The language.
+            category (Category): The category.
+
+        Raises:
+            MissingAcronymError: The requested acronym is not in the snapshot.
+
+        Returns:
+            Acronym: The correspoding acronym object.
+        """
+
+        categories = self.__languages.get(language, {})
+
+        if not category in categories or not name in categories[category]:
+            raise MissingAcronymError(name, language, category)
+
+        return categories[category][name]
+
+    def __getitem__(self, language: Language) -> Dict[Category, SnapshotCategory]:
+        return self.__languages[language]
+
+    def __iter__(self) -> Iterator[Language]:
+        return iter(self.__languages)
+
+    def __len__(self) -> int:
+        return len(self.__languages)
+
+
+class HandlerSnapshot(HandlerAcronyms):
+    """Binary snapshot acronyms handler. It reads and writes a compact binary file
+    with a strings table and sorted names, see `Snapshot` to read it on demand."""
+
+    name = "snapshot"
+
+    @classmethod
+    def open(cls, filepath: Path) -> Snapshot:
+        """Open a snapshot file without decoding the acronyms.
+
+        Args:
+            filepath (Path): The source snapshot file path.
+
+        Raises:
+            HandlerError: An error occured when opening the snapshot file.
+
+        Returns:
+            Snapshot: The memory mapped snapshot.
+        """
+
+        return Snapshot(filepath)
+
+    @classmethod
+    def read(cls, filepath: Path) -> Acronyms:
+        """Read a snapshot file then get a Acronyms Python object with its content.
+
+        Args:
+            filepath (Path): The source snapshot file path.
+
+        Raises:
+            HandlerError: An error occured when reading the snapshot file.
+
+        Returns:
+            Acronyms: The acronyms.
+        """
+
+        acronyms = create_acronyms()
+
+        with cls.open(filepath) as snapshot:
+            for language, lv in snapshot.items():
+                for category, cv in lv.items():
+                    acronyms[language][category].update(cv.items())
+
+        return acronyms
+
+    @classmethod
+    def write(cls, filepath: Path, data: Acronyms) -> NoReturn:
+        """Write to a snapshot file from a Acronyms Python object.
+
+        Args:
+            filepath (Path): The destination snapshot file path.
+            data (Acronyms): Acronyms to override the content to write to the file.
+
+        Raises:
+            HandlerError: An error occured when writting to the snapshot file.
+        """
+
+        string_ids: Dict[str, int] = {}
+
+        def string_id(value: str) -> int:
+            if value not in string_ids:
+                string_ids[value] = len(string_ids)
+
+            return string_ids[value]
+
+        groups = array("I")
+        entries = array("I")
+        extras = array("I")
+
+        for language, lv in data.items():
+            for category, cv in lv.items():
+                if len(cv) == 0:
+                    continue
+
+                groups.extend(
+                    (
+                        string_id(language.iso_639_1_code),
+                        string_id(category.value),
+                        len(entries) // 5,
+                        len(cv),
+                    )
+                )
+
+                for name in sorted(cv):
+                    acronym_dict = cv[name].to_dict()
+                    acronym_extras = acronym_dict.get("extras", [])
+
+                    entries.extend(
+                        (
+                            string_id(name),
+                            string_id(acronym_dict["meaning"]),
+                            string_id(acronym_dict["provider"]),
+                            len(extras) // 2,
+                            len(acronym_extras),
+                        )
+                    )
+
+                    for extra in acronym_extras:
+                        extras.extend(
+                            (string_id(extra["meaning"]), string_id(extra["provider"]))
+                        )
+
+        blob = bytearray()
+        string_offsets = array("Q", [0])
+        for value in string_ids:
+            blob += value.encode()
+            string_offsets.append(len(blob))
+
+        sections = [
+            to_little_endian(a) for a in (groups, entries, extras, string_offsets)
+        ]
+
+        offsets = []
+        offset = HEADER.size
+        for section in sections:
+            offsets.append(offset)
+            offset += len(section)
+
+        header = HEADER.pack(
+            MAGIC, VERSION, len(groups) // 4, len(string_ids), *offsets, offset
+        )
+
+        try:
+            with open(filepath, "wb") as f:
+                f.write(header)
+
+                for section in sections:
+                    f.write(section)
+
+                f.write(blob)
+        except Exception as e:
+            raise HandlerError(cls.name, filepath) from e
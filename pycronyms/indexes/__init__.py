@@ -0,0 +1,9 @@
+from pycronyms.indexes.prefix import IndexPrefix
+from pycronyms.indexes.inverted import IndexInverted
+from pycronyms.indexes.fuzzy import IndexFuzzy
+
+__all__ = [
+    "IndexPrefix",
+    "IndexInverted",
+    "IndexFuzzy",
+]
@@ -0,0 +1,140 @@
+from typing import List, Dict, Set, Tuple, Optional
+
+from pycronyms.acronyms import Acronyms
+from pycronyms.language import Language
+from pycronyms.category import Category
+from pycronyms._common import levenshtein_distance
+
+
+class BKNode:
+    """A BK-tree node, its children are indexed by their distance to the node name."""
+
+    __slots__ = ("name", "children")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.children: Dict[int, "BKNode"] = {}
+
+
+class IndexFuzzy:
+    """Typo tolerant index over the acronym names of every language and category.
+
+    The distinct names are stored in a BK-tree, a metric tree for the Levenshtein distance.
+    Thanks to the triangle inequality, a query only computes the distance
+    to a small part of the names."""
+
+    def __init__(self, acronyms: Acronyms):
+        """Build the index.
+
+        Args:
+            acronyms (Acronyms): The indexed acronyms.
+        """
+
+        self.__root: Optional[BKNode] = None
+        self.__keys: Dict[str, Set[Tuple[Language, Category]]] = {}
+
+        for language, lv in acronyms.items():
+            for category, cv in lv.items():
+                for name in cv:
+                    if name not in self.__keys:
+                        self.__keys[name] = set()
+                        self.__insert(name)
+
+                    self.__keys[name].add((language, category))
+
+    def __len__(self) -> int:
+        return len(self.__keys)
+
+    def __insert(self, name: str):
+        """Insert a new name into the BK-tree.
+
+        Args:
+            name (str): The acronym name.
+        """
+
+        if self.__root is None:
+            self.__root = BKNode(name)
+            return
+
+        node = self.__root
+        while True:
+            distance = levenshtein_distance(name, node.name)
+            child = node.children.get(distance)
+
+            if child is None:
+                node.children[distance] = BKNode(name)
+                return
+
+            node = child
+
+    def search(
+        self,
+        name: str,
+        k: int = 5,
+        max_distance: int = 2,
+        language: Optional[Language] = None,
+        category: Optional[Category] = None,
+    ) -> List[Tuple[str, int]]:
+        """Returns the closest acronym names, sorted by distance then by name.
+
+        Args:
+            name (str): The acronym name, normalized like an acronym name.
+            k (int, optional): The maximum amount of results. Defaults to 5.
+            max_distance (int, optional): The maximum Levenshtein distance. Defaults to 2.
+            language (Optional[Language], optional): The language filter. Defaults to None.
+            category (Optional[Category], optional): The category filter. Defaults to None.
+
+        Returns:
+            List[Tuple[str, int]]: The names with their distance.
+        """
+
+        name = "".join(name.split()).upper()
+
+        if self.__root is None or k <= 0:
+            return []
+
+        # The best results so far, sorted by distance then by name
+        best: List[Tuple[int, str]] = []
+        radius = max_distance
+
+        st = [self.__root]
+        while st:
+            node = st.pop()
+            distance = levenshtein_distance(name, node.name)
+
+            if distance <= radius and self.__matches(node.name, language, category):
+                best.append((distance, node.name))
+                best.sort()
+                del best[k:]
+
+                # Once there are k results, only equal or closer names can enter
+                if len(best) == k:
+                    radius = best[-1][0]
+
+            for child_distance, child in node.children.items():
+                if distance - radius <= child_distance <= distance + radius:
+                    st.append(child)
+
+        return [(name, distance) for distance, name in best]
+
+    def __matches(
+        self, name: str, language: Optional[Language], category: Optional[Category]
+    ) -> bool:
+        """Returns if an indexed name exists with the language and category filters.
+
+        Args:
+            name (str): The acronym name.
+            language (Optional[Language]): The language filter.
+            category (Optional[Category]): The category filter.
+
+        Returns:
+            bool: True if it matches.
+        """
+
+        for l, c in self.__keys[name]:
+            if (language is None or l == language) and (
+                category is None or c == category
+            ):
+                return True
+
+        return False
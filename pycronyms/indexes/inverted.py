@@ -0,0 +1,212 @@
+import re
+
+from typing import Iterable, Iterator, List, Dict, Tuple, Optional
+from array import array
+from bisect import bisect_left
+from collections import deque
+
+from pycronyms.acronyms import Acronyms
+from pycronyms.acronym import Acronym
+from pycronyms.language import Language
+from pycronyms.category import Category
+
+TOKEN_RE: re.Pattern = re.compile(r"[^\W_]+")
+
+LANGUAGES: List[Language] = list(Language)
+CATEGORIES: List[Category] = list(Category)
+
+
+def tokenize(value: str) -> List[str]:
+    """Returns the case insensitive words of a string.
+
+    Args:
+        value (str): String object.
+
+    Returns:
+        List[str]: The tokens.
+    """
+
+    return TOKEN_RE.findall(value.casefold())
+
+
+def iter_meanings(acronym: Acronym) -> Iterator[Acronym]:
+    """Yields the acronym itself then every of its extras, nested ones included.
+
+    Args:
+        acronym (Acronym): The acronym.
+
+    Yields:
+        Acronym: An acronym holding one meaning.
+    """
+
+    st = deque([acronym])
+    while st:
+        current = st.pop()
+
+        yield current
+
+        st.extend(current.extras)
+
+
+class IndexInverted:
+    """Inverted index of the meaning words, primary meanings and extras included.
+
+    Each indexed meaning has an integer id, every word maps to a posting list,
+    an array of the sorted ids of the meanings containing it."""
+
+    def __init__(self, acronyms: Acronyms):
+        """Build the index.
+
+        Args:
+            acronyms (Acronyms): The indexed acronyms.
+        """
+
+        self.__acronyms: List[Acronym] = []
+        self.__languages = array("B")
+        self.__categories = array("B")
+        self.__postings: Dict[str, array] = {}
+
+        for language, lv in acronyms.items():
+            for category, cv in lv.items():
+                for acronym in cv.values():
+                    for meaning_acronym in iter_meanings(acronym):
+                        self.__add(meaning_acronym, language, category)
+
+    def __add(self, acronym: Acronym, language: Language, category: Category):
+        """Index an acronym meaning.
+
+        Args:
+            acronym (Acronym): The acronym holding the meaning.
+            language (Language): The language.
+            category (Category): The category.
+        """
+
+        id = len(self.__acronyms)
+
+        self.__acronyms.append(acronym)
+        self.__languages.append(LANGUAGES.index(language))
+        self.__categories.append(CATEGORIES.index(category))
+
+        # Ids are increasing, so posting lists stay sorted
+        for token in dict.fromkeys(tokenize(acronym.meaning)):
+            posting = self.__postings.get(token)
+
+            if posting is None:
+                posting = self.__postings[token] = array("I")
+
+            posting.append(id)
+
+    def __len__(self) -> int:
+        return len(self.__acronyms)
+
+    def __postings_of(self, terms: Iterable[str]) -> List[array]:
+        """Returns the posting list of every term word, an empty one if a word is unknown.
+
+        Args:
+            terms (Iterable[str]): The terms.
+
+        Returns:
+            List[array]: The posting lists.
+        """
+
+        tokens = dict.fromkeys(token for term in terms for token in tokenize(term))
+
+        return [self.__postings.get(token, array("I")) for token in tokens]
+
+    def __results(
+        self,
+        ids: Iterable[int],
+        language: Optional[Language],
+        category: Optional[Category],
+    ) -> List[Tuple[Language, Category, Acronym]]:
+        """Returns the meanings matching the filters.
+
+        Args:
+            ids (Iterable[int]): The meaning ids.
+            language (Optional[Language]): The language filter.
+            category (Optional[Category]): The category filter.
+
+        Returns:
+            List[Tuple[Language, Category, Acronym]]: The meanings with their language and category.
+        """
+
+        language_id = None if language is None else LANGUAGES.index(language)
+        category_id = None if category is None else CATEGORIES.index(category)
+
+        results = []
+        for id in ids:
+            l = self.__languages[id]
+            c = self.__categories[id]
+
+            if language_id is not None and l != language_id:
+                continue
+
+            if category_id is not None and c != category_id:
+                continue
+
+            results.append((LANGUAGES[l], CATEGORIES[c], self.__acronyms[id]))
+
+        return results
+
+    def search_all(
+        self,
+        terms: Iterable[str],
+        language: Optional[Language] = None,
+        category: Optional[Category] = None,
+    ) -> List[Tuple[Language, Category, Acronym]]:
+        """Returns the meanings containing every words of the terms (AND query).
+
+        Args:
+            terms (Iterable[str]): The terms.
+            language (Optional[Language], optional): The language filter. Defaults to None.
+            category (Optional[Category], optional): The category filter. Defaults to None.
+
+        Returns:
+            List[Tuple[Language, Category, Acronym]]: The meanings with their language and category, by id.
+        """
+
+        postings = sorted(self.__postings_of(terms), key=len)
+
+        if len(postings) == 0:
+            return []
+
+        # Starting from the shortest posting list, each id is searched in the others
+        ids = list(postings[0])
+        for posting in postings[1:]:
+            posting_len = len(posting)
+            kept = []
+
+            lo = 0
+            for id in ids:
+                lo = bisect_left(posting, id, lo)
+
+                if lo == posting_len:
+                    break
+
+                if posting[lo] == id:
+                    kept.append(id)
+
+            ids = kept
+
+        return self.__results(ids, language, category)
+
+    def search_any(
+        self,
+        terms: Iterable[str],
+        language: Optional[Language] = None,
+        category: Optional[Category] = None,
+    ) -> List[Tuple[Language, Category, Acronym]]:
+        """Returns the meanings containing at least one word of the terms (OR query).
+
+        Args:
+            terms (Iterable[str]): The terms.
+            language (Optional[Language], optional): The language filter. Defaults to None.
+            category (Optional[Category], optional): The category filter. Defaults to None.
+
+        Returns:
+            List[Tuple[Language, Category, Acronym]]: The meanings with their language and category, by id.
+        """
+
+        ids = sorted(set().union(*self.__postings_of(terms)))
+
+        return self.__results(ids, language, category)
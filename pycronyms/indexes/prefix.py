@@ -0,0 +1,81 @@
+from typing import Iterator, List, Tuple, Optional
+from bisect import bisect_left
+from itertools import islice
+
+from pycronyms.acronyms import Acronyms
+from pycronyms.acronym import Acronym
+from pycronyms.language import Language
+from pycronyms.category import Category
+
+
+class IndexPrefix:
+    """Prefix index over the acronym names of every language and category.
+
+    The names are stored in a sorted array, a prefix query is a binary search
+    followed by a walk over the consecutive matching names."""
+
+    def __init__(self, acronyms: Acronyms):
+        """Build the index.
+
+        Args:
+            acronyms (Acronyms): The indexed acronyms.
+        """
+
+        self.__acronyms = acronyms
+
+        entries = sorted(
+            (name, language, category)
+            for language, lv in acronyms.items()
+            for category, cv in lv.items()
+            for name in cv
+        )
+
+        self.__names: List[str] = [name for name, _, _ in entries]
+        self.__keys: List[Tuple[Language, Category]] = [
+            (language, category) for _, language, category in entries
+        ]
+
+    def __len__(self) -> int:
+        return len(self.__names)
+
+    def __iter_prefix(
+        self, prefix: str
+    ) -> Iterator[Tuple[Language, Category, Acronym]]:
+        """Yields every entry whose name starts with the prefix, in sorted order.
+
+        Args:
+            prefix (str): The normalized prefix.
+
+        Yields:
+            Tuple[Language, Category, Acronym]: The matching entries.
+        """
+
+        names = self.__names
+
+        for i in range(bisect_left(names, prefix), len(names)):
+            name = names[i]
+
+            if name.startswith(prefix) is False:
+                return
+
+            language, category = self.__keys[i]
+
+            yield language, category, self.__acronyms[language][category][name]
+
+    def search(
+        self, prefix: str, limit: Optional[int] = None
+    ) -> Iterator[Tuple[Language, Category, Acronym]]:
+        """Lazily returns the acronyms whose name starts with a prefix.
+        They are sorted by name, then by language and category.
+
+        Args:
+            prefix (str): The prefix, normalized like an acronym name.
+            limit (Optional[int], optional): The maximum amount of results. Defaults to None.
+
+        Returns:
+            Iterator[Tuple[Language, Category, Acronym]]: The matching acronyms with their language and category.
+        """
+
+        prefix = "".join(prefix.split()).upper()
+
+        return islice(self.__iter_prefix(prefix), limit)
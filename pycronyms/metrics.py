@@ -0,0 +1,189 @@
+from typing import Dict, Tuple, Iterator, Optional
+from pathlib import Path
+from threading import Lock
+from time import perf_counter
+from contextlib import contextmanager
+from collections import defaultdict
+
+import orjson
+
+from pycronyms.language import Language
+from pycronyms.category import Category
+
+type MetricsKey = Tuple[Optional[str], Optional[Language], Optional[Category]]
+
+# Metric names
+DURATION = "duration"
+HTTP_BYTES = "http_bytes"
+CANDIDATES = "candidates"
+REJECTIONS = "rejections"
+ACRONYMS = "acronyms"
+REUSED = "reused"
+MERGED = "merged"
+EXTRAS = "extras"
+
+
+class Metrics:
+    """Thread-safe counters and durations of a fetch, like the time spent per provider,
+    the downloaded bytes or the validation rejections. Every value is summed per
+    (provider, language, category) and can be exported as JSON.
+
+    A disabled object records nothing, so it can always be called from the hot paths.
+    """
+
+    def __init__(self, enabled: bool = True):
+        """Create the metrics.
+
+        Args:
+            enabled (bool, optional): Record the values, every call is a no-op if False. Defaults to True.
+        """
+
+        self.enabled = enabled
+
+        self.__lock = Lock()
+        self.__values: Dict[MetricsKey, Dict[str, float]] = {}
+
+    def add(
+        self,
+        metric: str,
+        value: float,
+        provider: Optional[str] = None,
+        language: Optional[Language] = None,
+        category: Optional[Category] = None,
+    ):
+        """Add a value to a metric.
+
+        Args:
+            metric (str): The metric name.
+            value (float): The value.
+            provider (Optional[str], optional): The provider name, None for the whole pipeline. Defaults to None.
+            language (Optional[Language], optional): The language. Defaults to None.
+            category (Optional[Category], optional): The category. Defaults to None.
+        """
+
+        if not self.enabled:
+            return
+
+        key = (provider, language, category)
+
+        with self.__lock:
+            values = self.__values.get(key)
+            if values is None:
+                values = self.__values[key] = defaultdict(int)
+
+            values[metric] += value
+
+    @contextmanager
+    def timer(
+        self,
+        metric: str = DURATION,
+        provider: Optional[str] = None,
+        language: Optional[Language] = None,
+        category: Optional[Category] = None,
+    ) -> Iterator[None]:
+        """Add the wall time of the `with` block to a metric, in seconds.
+
+        Args:
+            metric (str, optional): The metric name. Defaults to DURATION.
+            provider (Optional[str], optional): The provider name, None for the whole pipeline. Defaults to None.
+            language (Optional[Language], optional): The language. Defaults to None.
+            category (Optional[Category], optional): The category. Defaults to None.
+        """
+
+        if not self.enabled:
+            yield
+            return
+
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(metric, perf_counter() - start, provider, language, category)
+
+    def get(
+        self,
+        metric: str,
+        provider: Optional[str] = None,
+        language: Optional[Language] = None,
+        category: Optional[Category] = None,
+    ) -> float:
+        """Returns the value of a metric.
+
+        Args:
+            metric (str): The metric name.
+            provider (Optional[str], optional): The provider name, None for the whole pipeline. Defaults to None.
+            language (Optional[Language], optional): The language. Defaults to None.
+            category (Optional[Category], optional): The category. Defaults to None.
+
+        Returns:
+            float: The value, 0 if never recorded.
+        """
+
+        with self.__lock:
+            return self.__values.get((provider, language, category), {}).get(metric, 0)
+
+    def to_dict(self) -> dict:
+        """Returns a dictionnary that represent the Metrics object. The values are
+        given for the whole pipeline, summed per provider, summed per language
+        and category, and per provider, language and category.
+
+        Returns:
+            dict: The dictionnary.
+        """
+
+        def add_values(d: dict, values: Dict[str, float]):
+            for metric, value in values.items():
+                d[metric] = d.get(metric, 0) + value
+
+        pipeline = {}
+        providers = {}
+        languages = {}
+        units = {}
+
+        with self.__lock:
+            items = [(key, dict(values)) for key, values in self.__values.items()]
+
+        for (provider, language, category), values in items:
+            if provider is None and language is None and category is None:
+                add_values(pipeline, values)
+                continue
+
+            if provider is not None:
+                add_values(providers.setdefault(provider, {}), values)
+
+            if language is None or category is None:
+                continue
+
+            code, category_value = language.iso_639_1_code, category.value
+
+            add_values(
+                languages.setdefault(code, {}).setdefault(category_value, {}), values
+            )
+
+            if provider is not None:
+                add_values(
+                    units.setdefault(provider, {})
+                    .setdefault(code, {})
+                    .setdefault(category_value, {}),
+                    values,
+                )
+
+        return {
+            "pipeline": pipeline,
+            "providers": providers,
+            "languages": languages,
+            "units": units,
+        }
+
+    def write(self, filepath: Path):
+        """Write the metrics to a JSON file.
+
+        Args:
+            filepath (Path): The file path.
+        """
+
+        filepath.write_bytes(
+            orjson.dumps(
+                self.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+            )
+        )
@@ -0,0 +1,218 @@
+import os
+import logging
+import hashlib
+
+from typing import Optional, List, Tuple
+from pathlib import Path
+from threading import Lock
+from time import time
+
+import orjson
+
+logger = logging.getLogger("pycronyms.page_cache")
+logger.disabled = True  # Should be read-only
+
+# 30 days
+DEFAULT_MAX_AGE = 30 * 24 * 60 * 60
+# 256 MiB
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+
+def default_cache_dirpath() -> Path:
+    """Returns the default pages cache directory, following the XDG specification.
+
+    Returns:
+        Path: The directory path.
+    """
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+
+    return Path(cache_home) / "pycronyms" / "pages"
+
+
+class PageCache:
+    """Persistent on-disk cache of fetched pages. Every entry is stored as
+    a content file and a JSON metadata file with the page revision, so an
+    entry is only used if the upstream page has not changed since.
+
+    Entries not accessed since `max_age` seconds are evicted, then the
+    least recently accessed ones until the cache is smaller than `max_size` bytes.
+    """
+
+    def __init__(
+        self,
+        dirpath: Optional[Path] = None,
+        max_age: Optional[float] = DEFAULT_MAX_AGE,
+        max_size: Optional[int] = DEFAULT_MAX_SIZE,
+    ):
+        self.dirpath = dirpath or default_cache_dirpath()
+        self.max_age = max_age
+        self.max_size = max_size
+
+        self.hits = 0
+        self.misses = 0
+
+        self.__lock = Lock()
+
+    def __paths(self, key: str) -> Tuple[Path, Path]:
+        """Returns the content and the metadata file paths of a key.
+
+        Args:
+            key (str): The key, for instance a page title.
+
+        Returns:
+            Tuple[Path, Path]: The content and the metadata file paths.
+        """
+
+        digest = hashlib.sha256(key.encode()).hexdigest()
+
+        return self.dirpath / f"{digest}.html", self.dirpath / f"{digest}.json"
+
+    def __count(self, hit: bool):
+        with self.__lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    @staticmethod
+    def __write_atomic(filepath: Path, content: bytes):
+        """Write a file through a temporary file, a concurrent reader never sees
+        a partially written file.
+
+        Args:
+            filepath (Path): The file path.
+            content (bytes): The file content.
+        """
+
+        tmp_filepath = filepath.with_name(f"{filepath.name}.{os.getpid()}.tmp")
+        tmp_filepath.write_bytes(content)
+
+        os.replace(tmp_filepath, filepath)
+
+    def get(self, key: str, revision: Optional[int] = None) -> Optional[str]:
+        """Returns the cached content of a key if it matches the given revision.
+
+        Args:
+            key (str): The key, for instance a page title.
+            revision (Optional[int], optional): The current upstream revision, any revision matches if None. Defaults to None.
+
+        Returns:
+            Optional[str]: The cached content, None if missing or outdated.
+        """
+
+        content_filepath, metadata_filepath = self.__paths(key)
+
+        try:
+            metadata = orjson.loads(metadata_filepath.read_bytes())
+
+            if revision is not None and metadata["revision"] != revision:
+                raise KeyError(key)
+
+            content = content_filepath.read_text(encoding="utf-8")
+        except (OSError, ValueError, KeyError):
+            self.__count(False)
+            logger.info(f"Cache miss for '{key}'")
+
+            return None
+
+        metadata["accessed_at"] = time()
+        try:
+            self.__write_atomic(metadata_filepath, orjson.dumps(metadata))
+        except OSError:
+            pass
+
+        self.__count(True)
+        logger.info(f"Cache hit for '{key}' at revision {metadata['revision']}")
+
+        return content
+
+    def put(self, key: str, content: str, revision: Optional[int] = None):
+        """Store the content of a key with its upstream revision.
+
+        Args:
+            key (str): The key, for instance a page title.
+            content (str): The content.
+            revision (Optional[int], optional): The upstream revision. Defaults to None.
+        """
+
+        content_filepath, metadata_filepath = self.__paths(key)
+        data = content.encode("utf-8")
+        now = time()
+
+        metadata = {
+            "key": key,
+            "revision": revision,
+            "fetched_at": now,
+            "accessed_at": now,
+            "size": len(data),
+        }
+
+        try:
+            os.makedirs(self.dirpath, exist_ok=True)
+
+            # The metadata is written last, an entry without it is ignored
+            self.__write_atomic(content_filepath, data)
+            self.__write_atomic(metadata_filepath, orjson.dumps(metadata))
+        except OSError as e:
+            logger.warning(f"Unable to cache '{key}': {e}")
+
+    def __entries(self) -> List[Tuple[float, int, Path]]:
+        """Returns every cache entry with its last access time and size.
+
+        Returns:
+            List[Tuple[float, int, Path]]: The access time, size and metadata file path per entry.
+        """
+
+        entries = []
+
+        for metadata_filepath in self.dirpath.glob("*.json"):
+            try:
+                metadata = orjson.loads(metadata_filepath.read_bytes())
+                entries.append(
+                    (metadata["accessed_at"], metadata["size"], metadata_filepath)
+                )
+            except (OSError, ValueError, KeyError):
+                entries.append((0.0, 0, metadata_filepath))
+
+        return entries
+
+    def evict(self) -> int:
+        """Remove the entries that are too old, then the least recently
+        accessed ones while the cache is too large.
+
+        Returns:
+            int: The amount of removed entries.
+        """
+
+        if not self.dirpath.exists():
+            return 0
+
+        entries = sorted(self.__entries())
+        size = sum(entry[1] for entry in entries)
+        now = time()
+
+        removed = 0
+        for accessed_at, entry_size, metadata_filepath in entries:
+            too_old = self.max_age is not None and now - accessed_at > self.max_age
+            too_large = self.max_size is not None and size > self.max_size
+
+            if not too_old and not too_large:
+                break
+
+            metadata_filepath.unlink(missing_ok=True)
+            metadata_filepath.with_suffix(".html").unlink(missing_ok=True)
+
+            size -= entry_size
+            removed += 1
+
+        if removed:
+            logger.info(f"Evicted {removed} cache entries")
+
+        return removed
+
+    def clear(self):
+        """Remove every cache entry."""
+
+        for filepath in self.dirpath.glob("*"):
+            filepath.unlink(missing_ok=True)
@@ -0,0 +1,114 @@
+import os
+import logging
+
+from typing import Optional, List, Tuple
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+import orjson
+
+from pycronyms.exceptions import FetchAcronymsError
+
+logger = logging.getLogger("pycronyms.page_fixtures")
+logger.disabled = True  # Should be read-only
+
+
+class FixturePage:
+    """A recorded page, it has the same interface as
+    a `ClientPage` object for the providers."""
+
+    def __init__(self, title: str, content: str, revision_id: Optional[int] = None):
+        self.title = title
+        self.content = content
+        self.revision_id = revision_id
+
+    def html(self) -> str:
+        return self.content
+
+
+class PageFixtures:
+    """A directory of raw provider inputs. The pages are recorded during
+    a real fetch, then served back to fetch offline with the same results.
+
+    Every page is stored as a `<title>.html` content file and
+    a `<title>.json` metadata file with its revision.
+    """
+
+    def __init__(self, dirpath: Path):
+        self.dirpath = dirpath
+
+    def __paths(self, title: str) -> Tuple[Path, Path]:
+        """Returns the content and the metadata file paths of a page.
+
+        Args:
+            title (str): The page title.
+
+        Returns:
+            Tuple[Path, Path]: The content and the metadata file paths.
+        """
+
+        filename = quote(title, safe="")
+
+        return self.dirpath / f"{filename}.html", self.dirpath / f"{filename}.json"
+
+    def record(self, title: str, content: str, revision_id: Optional[int] = None):
+        """Store a page, an existing one is replaced.
+
+        Args:
+            title (str): The page title.
+            content (str): The page content.
+            revision_id (Optional[int], optional): The page revision. Defaults to None.
+        """
+
+        content_filepath, metadata_filepath = self.__paths(title)
+
+        os.makedirs(self.dirpath, exist_ok=True)
+
+        content_filepath.write_text(content, encoding="utf-8")
+        metadata_filepath.write_bytes(
+            orjson.dumps(
+                {"title": title, "revision_id": revision_id},
+                option=orjson.OPT_INDENT_2,
+            )
+        )
+
+        logger.info(f"Recorded the page '{title}' to {content_filepath.absolute()}")
+
+    def load(self, title: str) -> FixturePage:
+        """Returns a recorded page.
+
+        Args:
+            title (str): The page title.
+
+        Raises:
+            FetchAcronymsError: The page has not been recorded.
+
+        Returns:
+            FixturePage: The page.
+        """
+
+        content_filepath, metadata_filepath = self.__paths(title)
+
+        try:
+            metadata = orjson.loads(metadata_filepath.read_bytes())
+            content = content_filepath.read_text(encoding="utf-8")
+        except (OSError, ValueError) as e:
+            raise FetchAcronymsError(
+                f"The page with title {title} has not been recorded in {self.dirpath}"
+            ) from e
+
+        logger.info(f"Replayed the page '{title}' from {content_filepath.absolute()}")
+
+        return FixturePage(title, content, metadata.get("revision_id"))
+
+    @property
+    def titles(self) -> List[str]:
+        """Returns the recorded page titles.
+
+        Returns:
+            List[str]: The titles.
+        """
+
+        return sorted(
+            unquote(filepath.stem) for filepath in self.dirpath.glob("*.json")
+        )
@@ -1,4 +1,4 @@
-from typing import Set, Any
+from typing import Set, Any, Optional
 from abc import ABC, abstractmethod
 
 from pycronyms.language import Language
@@ -23,6 +23,21 @@ class Provider(ABC):
             Set[Acronym]: The set of acronyms found.
         """
 
+    def source_revision(self, language: Language, category: Category) -> Optional[str]:
+        """It should returns an identifier of the upstream source version used to fetch the
+        acronyms of a given language and category, for instance a page revision.
+        The same identifier means the same fetched acronyms.
+
+        Args:
+            language (Language): The language.
+            category (Category): The category.
+
+        Returns:
+            Optional[str]: The source revision, None if it is unknown.
+        """
+
+        return None
+
     @abstractmethod
     def get_acronym(self, name: str, language: Language, category: Category) -> Acronym:
         """It should returns the associated acronym object.
@@ -0,0 +1,45 @@
+from typing import Set
+from abc import abstractmethod
+
+from pycronyms.language import Language
+from pycronyms.category import Category
+from pycronyms.acronym import Acronym
+from pycronyms.provider_helper import ProviderHelper
+
+
+class ProviderAsync(ProviderHelper):
+    """This is the helper class for asyncio native providers. They only have to implement
+    `_fetch_acronyms_async`, so they can share an event loop with other services.
+
+    They stay usable synchronously, `_fetch_acronyms` runs the coroutine in a new event loop.
+    """
+
+    @abstractmethod
+    async def _fetch_acronyms_async(
+        self, language: Language, category: Category
+    ) -> Set[Acronym]:
+        """This method fetch the data without blocking the event loop, then
+        `fetch_acronyms_async` is going to automatically manage the datas.
+
+        Args:
+            language (Language): The language.
+            category (Category): The category.
+
+        Returns:
+            Set[Acronym]: The set of acronyms found."""
+
+    def _fetch_acronyms(self, language: Language, category: Category) -> Set[Acronym]:
+        """Synchronous adapter of `_fetch_acronyms_async`. It must not be called
+        from a running event loop.
+
+        Args:
+            language (Language): The language.
+            category (Category): The category.
+
+        Returns:
+            Set[Acronym]: The set of acronyms found."""
+
+        # asyncio is slow to import, it is only imported when fetching
+        import asyncio
+
+        return asyncio.run(self._fetch_acronyms_async(language, category))
@@ -1,6 +1,5 @@
-from typing import Set
+from typing import Set, Dict, NoReturn, Optional
 from abc import abstractmethod
-from functools import cache
 
 from pycronyms._common import create_recursive_dict
 from pycronyms.language import Language
@@ -10,6 +9,12 @@ from pycronyms.exceptions import MissingAcronymError, FetchAcronymsError
 from pycronyms.provider import Provider
 from pycronyms.acronyms import Acronyms, AcronymsDict, dict_from_acronyms
 from pycronyms.statistics import Statistics
+from pycronyms.metrics import Metrics, MERGED, EXTRAS
+from pycronyms.result_cache import (
+    cached_method,
+    get_result_caches,
+    cache_key_arguments,
+)
 
 
 class ProviderHelper(Provider):
@@ -18,9 +23,16 @@ class ProviderHelper(Provider):
     The internal data structure has been thought to represents the datas
     in an intuitive and friendly way and to have an efficient time complexity."""
 
+    # Bounds of the per instance results cache of every cached method,
+    # they can be overridden by a subclass or an instance before the first fetch
+    cache_max_size: Optional[int] = 128
+    cache_ttl: Optional[float] = None
+
     def __init__(self):
         self._acronyms: Acronyms = create_recursive_dict(Acronym, depth=3)
         self.statistics = Statistics()
+        # Disabled by default, an aggregator shares its own with its providers
+        self.metrics = Metrics(enabled=False)
 
     def __repr__(self) -> str:
         return f"Acronyms provider '{self.name}'"
@@ -43,6 +55,62 @@ class ProviderHelper(Provider):
 
         return dict_from_acronyms(self._acronyms)
 
+    @property
+    def cache_info(self) -> Dict[str, Dict[str, int]]:
+        """Returns the hits, the misses and the size of the results cache of every cached method.
+
+        Returns:
+            Dict[str, Dict[str, int]]: The counters per method.
+        """
+
+        return {name: cache.info() for name, cache in get_result_caches(self).items()}
+
+    def invalidate(
+        self, language: Optional[Language] = None, category: Optional[Category] = None
+    ) -> int:
+        """Drop the cached results and the stored acronyms of a language and a category,
+        they are fetched again on the next call.
+
+        Args:
+            language (Optional[Language], optional): The language, every language if None. Defaults to None.
+            category (Optional[Category], optional): The category, every category if None. Defaults to None.
+
+        Returns:
+            int: The amount of dropped cached results.
+        """
+
+        def matches(key: tuple) -> bool:
+            arguments = cache_key_arguments(key)
+
+            return (language is None or arguments.get("language") == language) and (
+                category is None or arguments.get("category") == category
+            )
+
+        removed = sum(
+            cache.invalidate(matches) for cache in get_result_caches(self).values()
+        )
+
+        for l in Language if language is None else [language]:
+            for c in Category if category is None else [category]:
+                self.__reset_acronyms(l, c)
+
+        return removed
+
+    def __reset_acronyms(self, language: Language, category: Category):
+        """Remove the stored acronyms of a language and a category, with their statistics.
+
+        Args:
+            language (Language): The language.
+            category (Category): The category.
+        """
+
+        if language in self._acronyms:
+            self._acronyms[language].pop(category, None)
+
+        amount = self.statistics.language_and_category.get(language, {}).get(category)
+        if amount:
+            self.statistics.increase(language, category, -amount)
+
     @abstractmethod
     def _fetch_acronyms(self, language: Language, category: Category) -> Set[Acronym]:
         """This mehod fetch the data, then `fetch_acronyms` is going
@@ -58,6 +126,51 @@ class ProviderHelper(Provider):
         Returns:
             Set[Acronym]: The set of acronyms found."""
 
+    async def _fetch_acronyms_async(
+        self, language: Language, category: Category
+    ) -> Set[Acronym]:
+        """Asynchronous counterpart of `_fetch_acronyms`, used by `fetch_acronyms_async`.
+
+        By default, it adapts the synchronous `_fetch_acronyms` by running it in a worker thread,
+        so a synchronous provider never blocks the event loop. Asyncio native providers should override it.
+
+        Args:
+            language (Language): The language.
+            category (Category): The category.
+
+        Returns:
+            Set[Acronym]: The set of acronyms found."""
+
+        # asyncio is slow to import, it is only imported when fetching asynchronously
+        import asyncio
+
+        return await asyncio.to_thread(self._fetch_acronyms, language, category)
+
+    def __store_acronyms(
+        self, language: Language, category: Category, acronyms: Set[Acronym]
+    ) -> NoReturn:
+        """Merge fetched acronyms into the internal data structure.
+
+        Args:
+            language (Language): The language.
+            category (Category): The category.
+            acronyms (Set[Acronym]): The fetched acronyms.
+        """
+
+        d = self._acronyms[language][category]
+        merged = len(d)
+
+        for acronym in acronyms:
+            if acronym.name in d:
+                d[acronym.name].add_extra(acronym)
+            else:
+                d[acronym.name] = acronym
+
+        merged = len(d) - merged
+
+        self.metrics.add(MERGED, merged, self.name, language, category)
+        self.metrics.add(EXTRAS, len(acronyms) - merged, self.name, language, category)
+
     def __fetch_acronyms_wrapper(
         self, language: Language, category: Category
     ) -> Set[Acronym]:
@@ -73,11 +186,15 @@ class ProviderHelper(Provider):
 
         acronyms = self._fetch_acronyms(language, category)
 
+        # The result may have been evicted from the cache, it replaces the previous one.
+        # It is only removed once the fetch has succeeded, a failed fetch keeps it.
+        self.__reset_acronyms(language, category)
+
         self.statistics.increase(language, category, len(acronyms))
 
         return acronyms
 
-    @cache
+    @cached_method
     def fetch_acronyms(self, language: Language, category: Category) -> Set[Acronym]:
         """_summary_
 
@@ -99,13 +216,40 @@ class ProviderHelper(Provider):
         except Exception as e:
             raise FetchAcronymsError(language=language, category=category) from e
 
-        d = self._acronyms[language][category]
+        self.__store_acronyms(language, category, acronyms)
 
-        for acronym in acronyms:
-            if acronym.name in d:
-                d[acronym.name].add_extra(acronym)
-            else:
-                d[acronym.name] = acronym
+        return acronyms
+
+    async def fetch_acronyms_async(
+        self, language: Language, category: Category
+    ) -> Set[Acronym]:
+        """Asynchronous counterpart of `fetch_acronyms`. Unlike it,
+        the result is not cached, so every call fetches the acronyms again
+        and they replace the stored ones.
+
+        Args:
+            language (Language): The language corresponds to the language of the words in each letter of the acronym.
+            category (Category): The category.
+
+        Raises:
+            FetchAcronymsError: An error occured during acronyms fetching.
+
+        Returns:
+            Set[Acronym]: The set of acronyms found.
+        """
+
+        acronyms: Set[Acronym]
+
+        try:
+            acronyms = await self._fetch_acronyms_async(language, category)
+        except Exception as e:
+            raise FetchAcronymsError(language=language, category=category) from e
+
+        # Merged again, the previous result would be counted twice
+        self.__reset_acronyms(language, category)
+
+        self.statistics.increase(language, category, len(acronyms))
+        self.__store_acronyms(language, category, acronyms)
 
         return acronyms
 
@@ -1,7 +1,8 @@
-from pycronyms.providers.wikipedia import Wikipedia
+from pycronyms.providers.wikipedia import Wikipedia, WikipediaReplay
 from pycronyms.providers.custom import Custom
 
 __all__ = [
     "Wikipedia",
+    "WikipediaReplay",
     "Custom",
 ]
@@ -1,10 +1,18 @@
-from typing import Set, Dict, List
-from functools import cache
+import sys
+import hashlib
+
+from typing import Set, Dict, List, Optional
 
 from pycronyms.provider_helper import ProviderHelper
 from pycronyms.language import Language
 from pycronyms.category import Category
+from pycronyms import _common, acronym as acronym_module
 from pycronyms.acronym import Acronym
+from pycronyms.metrics import CANDIDATES, REJECTIONS
+from pycronyms.result_cache import cached_method
+from pycronyms._common import modules_digest
+
+import orjson
 
 from pydantic import ValidationError
 
@@ -33,7 +41,28 @@ class Custom(ProviderHelper):
     def __init__(self):
         super().__init__()
 
-    @cache
+    def source_revision(self, language: Language, category: Category) -> Optional[str]:
+        """Returns a hash of the custom acronyms with a specific language and category,
+        and of the code validating and normalizing them.
+
+        Args:
+            language (Language): The language.
+            category (Category): The category.
+
+        Returns:
+            Optional[str]: The source revision, None if the code can not be hashed.
+        """
+
+        code = modules_digest(_common, acronym_module, sys.modules[__name__])
+        if code is None:
+            return None
+
+        acronyms_dict = CUSTOM_ACRONYMS.get(language, {}).get(category, {})
+        data = orjson.dumps(acronyms_dict, option=orjson.OPT_SORT_KEYS)
+
+        return hashlib.sha256(data + code.encode()).hexdigest()
+
+    @cached_method
     def _fetch_acronyms(self, language: Language, category: Category) -> Set[Acronym]:
         """Returns acronyms with a specific language and category.
 
@@ -55,12 +84,18 @@ class Custom(ProviderHelper):
 
         acronyms_dict = CUSTOM_ACRONYMS[language][category]
 
+        candidates = 0
+        rejections = 0
+
         for name, raw in acronyms_dict.items():
             acronym: Acronym
 
+            candidates += 1 + len(raw.get("extras", []))
+
             try:
                 acronym = Acronym(name=name, meaning=raw["meaning"], provider=self.name)
             except ValidationError as e:
+                rejections += 1 + len(raw.get("extras", []))
                 continue
 
             acronyms.add(acronym)
@@ -75,6 +110,10 @@ class Custom(ProviderHelper):
                         Acronym(name=name, meaning=extra, provider=acronym.provider)
                     )
                 except ValidationError as e:
+                    rejections += 1
                     continue
 
+        self.metrics.add(CANDIDATES, candidates, self.name, language, category)
+        self.metrics.add(REJECTIONS, rejections, self.name, language, category)
+
         return acronyms
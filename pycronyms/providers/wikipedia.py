@@ -1,24 +1,31 @@
-import re
+import sys
 
-from typing import Set
-from functools import cache
+from typing import Set, Optional, Any
+from threading import Lock
 
 from pycronyms.provider_helper import ProviderHelper
 from pycronyms.language import Language
 from pycronyms.category import Category
+from pycronyms import _common, acronym as acronym_module
 from pycronyms.acronym import Acronym
 from pycronyms.exceptions import FetchAcronymsError
-from pycronyms._common import remove_html_content
-
-import wikipedia
+from pycronyms.page_cache import PageCache
+from pycronyms.page_fixtures import PageFixtures, FixturePage
+from pycronyms.metrics import HTTP_BYTES, CANDIDATES, REJECTIONS
+from pycronyms.result_cache import cached_method, get_result_caches
+from pycronyms._common import modules_digest
+from pycronyms.providers import wikipedia_parser
+from pycronyms.providers.wikipedia_parser import iter_acronym_pairs
+from pycronyms.providers.wikipedia_client import WikipediaClient
 
 from pydantic import ValidationError
 
-COMPUTER_SCIENCE_RE: re.Pattern = re.compile(r"<li><a href=.*>(.*)<\/a>—(.*)<\/li>")
-IT_RE: re.Pattern = re.compile(r"""<td><a href=.*>(.*)<\/a>
-<\/td>
-<td>(.*)
-<\/td>""")
+COMPUTER_SCIENCE_TITLE = "List_of_computing_and_IT_abbreviations"
+IT_TITLE = "List_of_information_technology_initialisms"
+
+# The only language and category of the Wikipedia pages
+PAGES_LANGUAGE = Language.ENGLISH
+PAGES_CATEGORY = Category.COMPUTER_SCIENCE
 
 
 class Wikipedia(ProviderHelper):
@@ -32,12 +39,159 @@ class Wikipedia(ProviderHelper):
 
     name = "wikipedia"
 
-    def __init__(self):
+    def __init__(
+        self,
+        page_cache: Optional[PageCache] = None,
+        recorder: Optional[PageFixtures] = None,
+        client: Optional[WikipediaClient] = None,
+    ):
+        """Create the Wikipedia provider.
+
+        Args:
+            page_cache (Optional[PageCache], optional): A persistent cache for the HTML pages,
+                a page is downloaded again only if its revision has changed. Defaults to None.
+            recorder (Optional[PageFixtures], optional): Record every HTML page used,
+                to be replayed later by `WikipediaReplay`. Defaults to None.
+            client (Optional[WikipediaClient], optional): The Wikipedia API client, its connection pool,
+                concurrency, rate limit and retries are configurable. A default one is created
+                on the first request if None. Defaults to None.
+        """
+
         super().__init__()
 
-    @cache
+        self.page_cache = page_cache
+        self.recorder = recorder
+
+        self.__client = client
+        self.__client_lock = Lock()
+
+    @property
+    def client(self) -> WikipediaClient:
+        """Returns the Wikipedia API client, created on the first call if needed.
+
+        Returns:
+            WikipediaClient: The client.
+        """
+
+        with self.__client_lock:
+            if self.__client is None:
+                self.__client = WikipediaClient()
+
+            return self.__client
+
+    def _fetch_page(self, title: str) -> Any:
+        """Request the Wikipedia API for a page. Its revision and its HTML
+        content are only requested when they are read.
+
+        Args:
+            title (str): The Wikipedia page title.
+
+        Returns:
+            Any: The `ClientPage` object.
+        """
+
+        return self.client.page(title)
+
+    @cached_method
+    def __page(self, title: str) -> Any:
+        """Request the Wikipedia API for a page once.
+
+        Args:
+            title (str): The Wikipedia page title.
+
+        Returns:
+            Any: The page object, with a `revision_id` attribute and an `html` method.
+        """
+
+        return self._fetch_page(title)
+
+    def invalidate(
+        self, language: Optional[Language] = None, category: Optional[Category] = None
+    ) -> int:
+        """Drop the cached results and the stored acronyms of a language and a category.
+        The pages are requested again if they are used by this language and category.
+
+        Args:
+            language (Optional[Language], optional): The language, every language if None. Defaults to None.
+            category (Optional[Category], optional): The category, every category if None. Defaults to None.
+
+        Returns:
+            int: The amount of dropped cached results.
+        """
+
+        removed = super().invalidate(language, category)
+
+        if language not in (None, PAGES_LANGUAGE) or category not in (
+            None,
+            PAGES_CATEGORY,
+        ):
+            return removed
+
+        # The pages results are not keyed by language and category
+        for cache in get_result_caches(self).values():
+            removed += len(cache)
+            cache.clear()
+
+        return removed
+
+    def source_revision(self, language: Language, category: Category) -> Optional[str]:
+        """Returns the revisions of the Wikipedia pages used for a specific language and category,
+        with a hash of the code parsing, validating and normalizing their acronyms.
+
+        Args:
+            language (Language): The language.
+            category (Category): The category.
+
+        Returns:
+            Optional[str]: The source revision, None if the code can not be hashed.
+        """
+
+        if language != PAGES_LANGUAGE or category != PAGES_CATEGORY:
+            return ""
+
+        code = modules_digest(
+            _common, acronym_module, wikipedia_parser, sys.modules[__name__]
+        )
+        if code is None:
+            return None
+
+        return ":".join(
+            [
+                *(
+                    str(self.__page(title).revision_id)
+                    for title in (COMPUTER_SCIENCE_TITLE, IT_TITLE)
+                ),
+                code,
+            ]
+        )
+
+    def __download_html(self, page: Any) -> str:
+        """Download the HTML content of a page.
+
+        Args:
+            page (Any): The page object.
+
+        Returns:
+            str: The HTML content.
+        """
+
+        html = page.html()
+
+        if self.metrics.enabled:
+            self.metrics.add(
+                HTTP_BYTES,
+                len(html.encode("utf-8")),
+                self.name,
+                PAGES_LANGUAGE,
+                PAGES_CATEGORY,
+            )
+
+        return html
+
+    @cached_method
     def __fetch_html(self, title: str) -> str:
-        """Fetch a Wikipedia HTML page.
+        """Fetch a Wikipedia HTML page. With a page cache, only the page
+        revision is requested when the cached page is up to date.
 
         Args:
             title (str): The Wikipedia page title.
@@ -52,8 +206,20 @@ class Wikipedia(ProviderHelper):
         html: str
 
         try:
-            page = wikipedia.page(title=title)
-            html = page.html()
+            page = self.__page(title)
+
+            if self.page_cache is None:
+                html = self.__download_html(page)
+            else:
+                revision = page.revision_id
+
+                html = self.page_cache.get(title, revision)
+                if html is None:
+                    html = self.__download_html(page)
+                    self.page_cache.put(title, html, revision)
+
+            if self.recorder is not None:
+                self.recorder.record(title, html, page.revision_id)
         except Exception as e:
             raise FetchAcronymsError(
                 f"Unable to get the wikipedia page with title {title}"
@@ -61,12 +227,13 @@ class Wikipedia(ProviderHelper):
 
         return html
 
-    def __fetch_acronyms(self, title: str, regex: re.Pattern) -> Set[Acronym]:
+    def __fetch_acronyms(self, title: str, lists: bool, tables: bool) -> Set[Acronym]:
         """Fetch Wikipedia acronyms helper function.
 
         Args:
             title (str): The Wikipedia page title.
-            regex (re.Pattern): The regex that must match an acronym and its meaning.
+            lists (bool): The acronyms are in list items like `<li><a>name</a>—meaning</li>`.
+            tables (bool): The acronyms are in table rows like `<td><a>name</a></td><td>meaning</td>`.
 
         Raises:
             FetchAcronymsError: An error occured when requesting the Wikipedia API.
@@ -80,23 +247,29 @@ class Wikipedia(ProviderHelper):
         except FetchAcronymsError as e:
             raise e
 
-        matches = regex.findall(html)
+        candidates = 0
+        rejections = 0
 
         acronyms: Set[Acronym] = set()
-        for name, meaning in matches:
-            meaning = remove_html_content(meaning)
+        for name, meaning in iter_acronym_pairs((html,), lists, tables):
+            candidates += 1
 
             acronym: Acronym
             try:
                 acronym = Acronym(name=name, meaning=meaning, provider=self.name)
             except ValidationError as e:
+                rejections += 1
                 continue
 
             acronyms.add(acronym)
 
+        unit = (self.name, PAGES_LANGUAGE, PAGES_CATEGORY)
+        self.metrics.add(CANDIDATES, candidates, *unit)
+        self.metrics.add(REJECTIONS, rejections, *unit)
+
         return acronyms
 
-    @cache
+    @cached_method
     def _fetch_acronyms_information_technology(self) -> Set[Acronym]:
         """_summary_
 
@@ -104,11 +277,9 @@ class Wikipedia(ProviderHelper):
             Set[Acronym]: The fetched acronyms.
         """
 
-        return self.__fetch_acronyms(
-            "List_of_information_technology_initialisms", IT_RE
-        )
+        return self.__fetch_acronyms(IT_TITLE, lists=False, tables=True)
 
-    @cache
+    @cached_method
     def _fetch_acronyms_computer_science(self) -> Set[Acronym]:
         """Fetch the Wikipedia acronyms about computer science.
 
@@ -119,11 +290,9 @@ class Wikipedia(ProviderHelper):
             Set[Acronym]: The fetched acronyms.
         """
 
-        return self.__fetch_acronyms(
-            "List_of_computing_and_IT_abbreviations", COMPUTER_SCIENCE_RE
-        )
+        return self.__fetch_acronyms(COMPUTER_SCIENCE_TITLE, lists=True, tables=False)
 
-    @cache
+    @cached_method
     def _fetch_acronyms(self, language: Language, category: Category) -> Set[Acronym]:
         """Fetch the Wikipedia acronyms with a specific language and category.
 
@@ -141,7 +310,7 @@ class Wikipedia(ProviderHelper):
         acronyms = set()
 
         # Wikipedia seems to not have other language acronyms
-        if language != Language.ENGLISH:
+        if language != PAGES_LANGUAGE:
             return acronyms
 
         match category:
@@ -152,3 +321,35 @@ class Wikipedia(ProviderHelper):
                 pass
 
         return acronyms
+
+
+class WikipediaReplay(Wikipedia):
+    """The Wikipedia provider, serving the pages recorded by a previous fetch
+    instead of requesting the Wikipedia API. It fetches the same acronyms offline.
+    """
+
+    def __init__(self, fixtures: PageFixtures):
+        """Create the replaying Wikipedia provider.
+
+        Args:
+            fixtures (PageFixtures): The recorded pages.
+        """
+
+        super().__init__()
+
+        self.fixtures = fixtures
+
+    def _fetch_page(self, title: str) -> FixturePage:
+        """Returns a recorded page.
+
+        Args:
+            title (str): The Wikipedia page title.
+
+        Raises:
+            FetchAcronymsError: The page has not been recorded.
+
+        Returns:
+            FixturePage: The recorded page.
+        """
+
+        return self.fixtures.load(title)
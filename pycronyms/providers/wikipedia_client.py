@@ -0,0 +1,367 @@
+import time
+import random
+import logging
+
+from typing import TYPE_CHECKING, Any, Dict, Callable, Optional
+from threading import Lock, BoundedSemaphore
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+from pycronyms.exceptions import FetchAcronymsError
+
+# requests is slow to import, it is only imported when a client is created
+if TYPE_CHECKING:
+    import requests
+
+logger = logging.getLogger("pycronyms.wikipedia_client")
+logger.disabled = True  # Should be read-only
+
+API_URL = "https://en.wikipedia.org/w/api.php"
+USER_AGENT = "pycronyms (https://github.com/theobori/pycronyms)"
+
+# Responses worth retrying, the others are returned or raised as is
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Wikipedia etiquette, the API refuses the request when its replication lag is higher
+MAXLAG = 5
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter. Tokens are added at a constant rate,
+    up to `burst` tokens, and every request takes one.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Create the bucket, initially full.
+
+        Args:
+            rate (float): The amount of tokens added per second.
+            burst (int, optional): The maximum amount of tokens. Defaults to 1.
+            clock (Callable[[], float], optional): The time source. Defaults to time.monotonic.
+            sleep (Callable[[float], None], optional): The sleep function. Defaults to time.sleep.
+        """
+
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.sleep = sleep
+
+        self.__lock = Lock()
+        self.__tokens = float(burst)
+        self.__updated_at = clock()
+
+    def __refill(self):
+        now = self.clock()
+
+        self.__tokens = min(
+            self.burst, self.__tokens + (now - self.__updated_at) * self.rate
+        )
+        self.__updated_at = now
+
+    def acquire(self) -> float:
+        """Take a token, waiting until one is available.
+
+        Returns:
+            float: The waited seconds.
+        """
+
+        waited = 0.0
+
+        while True:
+            with self.__lock:
+                self.__refill()
+
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return waited
+
+                delay = (1 - self.__tokens) / self.rate
+
+            self.sleep(delay)
+            waited += delay
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Returns the delay of a Retry-After header, given in seconds or as an HTTP date.
+
+    Args:
+        value (Optional[str]): The header value.
+
+    Returns:
+        Optional[float]: The seconds to wait, None if missing or invalid.
+    """
+
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class WikipediaClient:
+    """Wikipedia API client. Its connections are pooled and kept alive, the concurrent
+    requests are bounded, the request rate is limited by a token bucket and the
+    throttled or failed requests (429 and 5xx) are retried with an exponential backoff,
+    honoring the Retry-After header.
+    """
+
+    def __init__(
+        self,
+        api_url: str = API_URL,
+        user_agent: str = USER_AGENT,
+        max_connections: int = 4,
+        max_concurrency: int = 2,
+        rate: float = 2.0,
+        burst: int = 4,
+        max_retries: int = 5,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 60.0,
+        timeout: float = 30.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Create the client.
+
+        Args:
+            api_url (str, optional): The MediaWiki API endpoint. Defaults to API_URL.
+            user_agent (str, optional): The User-Agent header, Wikipedia requires a descriptive one. Defaults to USER_AGENT.
+            max_connections (int, optional): The connection pool size. Defaults to 4.
+            max_concurrency (int, optional): The maximum amount of requests in flight. Defaults to 2.
+            rate (float, optional): The maximum average amount of requests per second. Defaults to 2.0.
+            burst (int, optional): The amount of requests that can be sent at once before being limited by `rate`. Defaults to 4.
+            max_retries (int, optional): The amount of retries of a request. Defaults to 5.
+            backoff_factor (float, optional): The first retry delay in seconds, it doubles for every retry. Defaults to 0.5.
+            max_backoff (float, optional): The maximum delay between two attempts, Retry-After included. Defaults to 60.0.
+            timeout (float, optional): The connect and read timeout in seconds. Defaults to 30.0.
+            sleep (Callable[[float], None], optional): The sleep function. Defaults to time.sleep.
+        """
+
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.api_url = api_url
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.sleep = sleep
+
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = user_agent
+
+        # The retries are done by the client, to share the rate limit and the backoff
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.rate_limiter = TokenBucket(rate, burst, sleep=sleep)
+
+        self.__semaphore = BoundedSemaphore(max_concurrency)
+
+        self.requests = 0
+        self.retries = 0
+
+    def close(self):
+        """Close the pooled connections."""
+
+        self.session.close()
+
+    def __backoff(self, attempt: int, retry_after: Optional[float]) -> float:
+        """Returns the delay before a retry.
+
+        Args:
+            attempt (int): The failed attempts amount, from 1.
+            retry_after (Optional[float]): The delay asked by the server.
+
+        Returns:
+            float: The seconds to wait.
+        """
+
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+
+        delay = self.backoff_factor * 2 ** (attempt - 1)
+
+        # Jitter, the retries of concurrent requests are spread out
+        return min(delay * random.uniform(0.5, 1.0), self.max_backoff)
+
+    def __send(self, params: Dict[str, Any]) -> "requests.Response":
+        self.rate_limiter.acquire()
+
+        with self.__semaphore:
+            self.requests += 1
+
+            return self.session.get(self.api_url, params=params, timeout=self.timeout)
+
+    def request(self, params: Dict[str, Any]) -> dict:
+        """Request the API, retrying the throttled or failed requests.
+
+        Args:
+            params (Dict[str, Any]): The query parameters, the format is always JSON.
+
+        Raises:
+            FetchAcronymsError: The request failed after every retry or the API returned an error.
+
+        Returns:
+            dict: The JSON response.
+        """
+
+        import requests
+
+        params = params | {"format": "json", "formatversion": 2, "maxlag": MAXLAG}
+
+        attempt = 0
+        while True:
+            attempt += 1
+            retry_after = None
+
+            try:
+                response = self.__send(params)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = f"{type(e).__name__}: {e}"
+            else:
+                retry_after = retry_after_seconds(response.headers.get("Retry-After"))
+
+                if response.status_code in RETRY_STATUSES:
+                    error = f"HTTP {response.status_code}"
+                elif response.status_code >= 400:
+                    raise FetchAcronymsError(
+                        f"The Wikipedia API answered HTTP {response.status_code}"
+                    )
+                else:
+                    data = response.json()
+                    code = data.get("error", {}).get("code")
+
+                    if code is None:
+                        return data
+
+                    if code != "maxlag":
+                        raise FetchAcronymsError(
+                            f"The Wikipedia API answered the error '{code}'"
+                        )
+
+                    error = "maxlag"
+
+            if attempt > self.max_retries:
+                raise FetchAcronymsError(
+                    f"The Wikipedia API request failed {attempt} times, the last error is {error}"
+                )
+
+            delay = self.__backoff(attempt, retry_after)
+            self.retries += 1
+
+            logger.warning(
+                f"Retrying a Wikipedia API request in {delay:.2f}s ({error})"
+            )
+
+            self.sleep(delay)
+
+    def revision_id(self, title: str) -> int:
+        """Returns the current revision of a page.
+
+        Args:
+            title (str): The page title.
+
+        Raises:
+            FetchAcronymsError: The page does not exist or the request failed.
+
+        Returns:
+            int: The revision id.
+        """
+
+        data = self.request(
+            {
+                "action": "query",
+                "prop": "revisions",
+                "rvprop": "ids",
+                "titles": title,
+                "redirects": 1,
+            }
+        )
+
+        try:
+            page = data["query"]["pages"][0]
+
+            return page["revisions"][0]["revid"]
+        except (KeyError, IndexError) as e:
+            raise FetchAcronymsError(f"The Wikipedia page {title} is missing") from e
+
+    def html(self, title: str, revision_id: Optional[int] = None) -> str:
+        """Returns the HTML content of a page.
+
+        Args:
+            title (str): The page title.
+            revision_id (Optional[int], optional): A specific revision, the current one if None. Defaults to None.
+
+        Raises:
+            FetchAcronymsError: The page does not exist or the request failed.
+
+        Returns:
+            str: The HTML content.
+        """
+
+        params = {"action": "parse", "prop": "text"}
+
+        if revision_id is None:
+            params |= {"page": title, "redirects": 1}
+        else:
+            params["oldid"] = revision_id
+
+        data = self.request(params)
+
+        try:
+            return data["parse"]["text"]
+        except KeyError as e:
+            raise FetchAcronymsError(f"The Wikipedia page {title} is missing") from e
+
+    def page(self, title: str) -> "ClientPage":
+        """Returns a page, nothing is requested until its revision or its content is read.
+
+        Args:
+            title (str): The page title.
+
+        Returns:
+            ClientPage: The page.
+        """
+
+        return ClientPage(self, title)
+
+
+class ClientPage:
+    """A Wikipedia page requested by a `WikipediaClient`. Like a `wikipedia.WikipediaPage`
+    object, it has a `revision_id` attribute and an `html` method.
+    """
+
+    def __init__(self, client: WikipediaClient, title: str):
+        self.client = client
+        self.title = title
+
+        self.__revision_id: Optional[int] = None
+
+    @property
+    def revision_id(self) -> int:
+        if self.__revision_id is None:
+            self.__revision_id = self.client.revision_id(self.title)
+
+        return self.__revision_id
+
+    def html(self) -> str:
+        # The content matches the revision, if it has been requested
+        return self.client.html(self.title, self.__revision_id)
@@ -0,0 +1,441 @@
+import re
+
+from typing import List, Tuple, Iterable, Iterator, Optional
+from html import unescape
+from operator import itemgetter
+
+# A single pass tokenizer, a token is a comment, a tag or some text
+TOKEN_RE: re.Pattern = re.compile(
+    r"<!--.*?-->|<(/?)([a-zA-Z][^\s/>]*)[^>]*>|([^<]+)|<", re.DOTALL
+)
+
+# Tags whose content is never a part of an acronym name or meaning,
+# for instance the references like "[1]" are in a <sup> tag
+SKIPPED_TAGS = {"sup", "style", "script"}
+
+# The content of a table cell, up to its end tag (unrolled to avoid backtracking)
+CELL_CONTENT = r"[^<]*(?:<(?!/t[dh][\s/>])[^<]*)*+"
+# The end of a row start tag, after "<tr", and the start tag of its first cell
+ROW_START = r"(?:\s[^>]*)?>\s*<td(?:\s[^>]*)?>"
+CELLS_BOUNDARY = r"</t[dh]\s*>\s*<t[dh](?:\s[^>]*)?>"
+CELL_END = r"</t[dh]\s*>"
+# The text before the link is made of whitespaces, comments and tags
+STARTS_WITH_LINK = r"(?=(?:\s+|<!--.*?-->|</?(?!a[\s/>])[a-zA-Z][^>]*>)*<a[\s/>])"
+# Every whitespace except the space, see `str.isspace`
+OTHER_WHITESPACES = (
+    r"\t-\r\x1c-\x1f\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+
+# The two first cells of a table row, the first one is a <td> starting with a link
+TABLE_ROW_RE: re.Pattern = re.compile(
+    "<tr"
+    + ROW_START
+    + STARTS_WITH_LINK
+    + f"({CELL_CONTENT}){CELLS_BOUNDARY}({CELL_CONTENT}){CELL_END}",
+    re.DOTALL,
+)
+
+# Wikipedia renders most of the rows like `<tr>\n<td><a ...>name</a>\n</td>\n<td>meaning\n</td>`,
+# without any markup in the meaning, their pairs are captured as is. The other rows of
+# `TABLE_ROW_RE` are matched with empty groups.
+SIMPLE_TABLE_ROW_RE: re.Pattern = re.compile(
+    r"<tr(?:>\n<td><a\s[^>]*>([^\s<&]+)</a>\n</td>\n<td>"
+    + rf"([^\s<&][^<&{OTHER_WHITESPACES}]*(?<! ))\n</td>"
+    + f"|{ROW_START}{STARTS_WITH_LINK}{CELL_CONTENT}{CELLS_BOUNDARY}{CELL_CONTENT}{CELL_END})",
+    re.DOTALL,
+)
+
+# Wikipedia always renders the end of a table like this
+TABLE_END = "</table>"
+
+# Separates the cells contents joined to be handled at once, HTML never has it
+CELLS_SEPARATOR = "\x00"
+
+# The markup removed from the joined cells, like the tokenizer the content of the skipped tags is removed
+CELLS_MARKUP_RE: re.Pattern = re.compile(
+    r"<!--[^\x00]*?-->|<(sup|style|script)(?=[\s/>])[^>]*>[^\x00]*?</\1[^>]*>|</?[a-zA-Z][^>]*>|<",
+    re.IGNORECASE,
+)
+
+# The dash between the name and the meaning in a list item
+LIST_ITEM_SEPARATOR = "—"
+
+# List item states
+ITEM_EXPECTING_NAME = 0
+ITEM_NAME = 1
+ITEM_MEANING = 2
+ITEM_INVALID = 3
+
+
+class ListItem:
+    """A <li> element being parsed."""
+
+    __slots__ = ("state", "name", "meaning")
+
+    def __init__(self):
+        self.state = ITEM_EXPECTING_NAME
+        self.name: List[str] = []
+        self.meaning: List[str] = []
+
+
+class TableCell:
+    """A <td> element being parsed."""
+
+    __slots__ = ("starts_with_link", "has_content", "text")
+
+    def __init__(self):
+        self.starts_with_link = False
+        self.has_content = False
+        self.text: List[str] = []
+
+
+class WikipediaAcronymsParser:
+    """Event driven HTML parser extracting (name, meaning) pairs from a Wikipedia page,
+    the pairs are available as soon as their element has been fed.
+
+    It is fed chunk by chunk like `html.parser.HTMLParser`, but the tokenizer is a single
+    precompiled regex, tag attributes are never parsed because they are never needed.
+
+    It reads the list items like `<li><a>name</a>—meaning</li>` and the table rows
+    like `<tr><td><a>name</a></td><td>meaning</td></tr>`. The text of the nested tags,
+    links included, is kept and the HTML entities are converted.
+    """
+
+    def __init__(self, lists: bool = True, tables: bool = True):
+        """Create the parser.
+
+        Args:
+            lists (bool, optional): Extract the pairs from the list items. Defaults to True.
+            tables (bool, optional): Extract the pairs from the table rows. Defaults to True.
+        """
+
+        self.lists = lists
+        self.tables = tables
+
+        # Not tokenized yet, it may be an incomplete tag
+        self.__rest = ""
+
+        self.__pairs: List[Tuple[str, str]] = []
+
+        self.__skipped_depth = 0
+        # Nested lists have nested items
+        self.__items: List[ListItem] = []
+        self.__row: Optional[List[TableCell]] = None
+        self.__cell: Optional[TableCell] = None
+
+    def __tokenize(self, data: str):
+        """Call the event handlers for every token.
+
+        Args:
+            data (str): Complete tokens.
+        """
+
+        handle_data = self.handle_data
+        handle_starttag = self.handle_starttag
+        handle_endtag = self.handle_endtag
+
+        for closing, tag, text in TOKEN_RE.findall(data):
+            if text:
+                handle_data(unescape(text) if "&" in text else text)
+            elif not tag:
+                # A comment or a lonely "<"
+                continue
+            elif closing:
+                handle_endtag(tag.lower())
+            else:
+                handle_starttag(tag.lower())
+
+    def feed(self, data: str):
+        """Feed some HTML content, the extracted pairs are returned by `pop_pairs`.
+
+        Args:
+            data (str): The HTML content.
+        """
+
+        data = self.__rest + data
+
+        # The last tag and the text following it may continue in the next chunk
+        cut = data.rfind("<")
+
+        comment_start = data.rfind("<!--")
+        if comment_start != -1:
+            comment_end = data.find("-->", comment_start)
+
+            if comment_end == -1:
+                cut = comment_start
+            elif cut < comment_end:
+                # The last "<" is in a complete comment
+                cut = comment_end + len("-->")
+
+        if cut == -1:
+            self.__rest = data
+            return
+
+        self.__rest = data[cut:]
+        self.__tokenize(data[:cut])
+
+    def close(self):
+        """Handle the remaining content and the unclosed list items."""
+
+        self.__tokenize(self.__rest)
+        self.__rest = ""
+
+        while self.__items:
+            self.__end_item(self.__items.pop())
+
+    def pop_pairs(self) -> List[Tuple[str, str]]:
+        """Returns the pairs extracted since the last call.
+
+        Returns:
+            List[Tuple[str, str]]: The (name, meaning) pairs.
+        """
+
+        pairs = self.__pairs
+        self.__pairs = []
+
+        return pairs
+
+    def __add_pair(self, name: List[str], meaning: List[str]):
+        name_str = "".join(name).strip()
+        meaning_str = " ".join("".join(meaning).split())
+
+        if name_str and meaning_str:
+            self.__pairs.append((name_str, meaning_str))
+
+    def __end_item(self, item: ListItem):
+        """Extract the pair of a list item, the meaning must follow the separator.
+
+        Args:
+            item (ListItem): The list item.
+        """
+
+        if item.state != ITEM_MEANING:
+            return
+
+        item.state = ITEM_INVALID
+
+        meaning = "".join(item.meaning).lstrip()
+        if not meaning.startswith(LIST_ITEM_SEPARATOR):
+            return
+
+        self.__add_pair(item.name, [meaning[len(LIST_ITEM_SEPARATOR) :]])
+
+    def __end_row(self, row: List[TableCell]):
+        """Extract the pair of a table row, its first cell must be a link.
+
+        Args:
+            row (List[TableCell]): The row cells.
+        """
+
+        if len(row) < 2 or not row[0].starts_with_link:
+            return
+
+        self.__add_pair(row[0].text, row[1].text)
+
+    def handle_starttag(self, tag: str):
+        if tag in SKIPPED_TAGS:
+            self.__skipped_depth += 1
+            return
+
+        if self.__skipped_depth > 0:
+            return
+
+        match tag:
+            case "li" if self.lists:
+                self.__items.append(ListItem())
+            case "ul" | "ol" if self.__items:
+                # The meaning ends before a nested list
+                self.__end_item(self.__items[-1])
+                self.__items[-1].state = ITEM_INVALID
+            case "tr" if self.tables:
+                self.__row = []
+                self.__cell = None
+            case "td" if self.__row is not None:
+                self.__cell = TableCell()
+            case "th" if self.__row is not None:
+                # A header cell is never a pair member
+                self.__cell = TableCell()
+                self.__cell.has_content = True
+            case "a":
+                if self.__items and self.__items[-1].state == ITEM_EXPECTING_NAME:
+                    self.__items[-1].state = ITEM_NAME
+
+                if self.__cell is not None and not self.__cell.has_content:
+                    self.__cell.starts_with_link = True
+                    self.__cell.has_content = True
+
+    def handle_endtag(self, tag: str):
+        if tag in SKIPPED_TAGS:
+            self.__skipped_depth = max(self.__skipped_depth - 1, 0)
+            return
+
+        if self.__skipped_depth > 0:
+            return
+
+        match tag:
+            case "li" if self.__items:
+                self.__end_item(self.__items.pop())
+            case "a" if self.__items and self.__items[-1].state == ITEM_NAME:
+                self.__items[-1].state = ITEM_MEANING
+            case "td" | "th" if self.__row is not None and self.__cell is not None:
+                self.__row.append(self.__cell)
+                self.__cell = None
+            case "tr" if self.__row is not None:
+                self.__end_row(self.__row)
+                self.__row = None
+
+    def handle_data(self, data: str):
+        if self.__skipped_depth > 0:
+            return
+
+        if self.__items:
+            item = self.__items[-1]
+
+            if item.state == ITEM_EXPECTING_NAME and data.strip():
+                # Some text before the link
+                item.state = ITEM_INVALID
+            elif item.state == ITEM_NAME:
+                item.name.append(data)
+            elif item.state == ITEM_MEANING:
+                item.meaning.append(data)
+
+        if self.__cell is not None:
+            if data.strip():
+                self.__cell.has_content = True
+
+            self.__cell.text.append(data)
+
+
+def cells_text(cells: List[str], collapse: bool = False) -> List[str]:
+    """Returns the stripped text of table cells contents. The cells are joined,
+    so the markup and the HTML entities are handled once for all of them.
+
+    Args:
+        cells (List[str]): The cells HTML contents.
+        collapse (bool, optional): Collapse the whitespaces of the texts. Defaults to False.
+
+    Returns:
+        List[str]: The texts.
+    """
+
+    if not cells:
+        return []
+
+    text = CELLS_SEPARATOR.join(cells)
+
+    if "<" in text:
+        text = CELLS_MARKUP_RE.sub("", text)
+    if "&" in text:
+        text = unescape(text)
+
+    if collapse:
+        return [" ".join(cell.split()) for cell in text.split(CELLS_SEPARATOR)]
+
+    return [cell.strip() for cell in text.split(CELLS_SEPARATOR)]
+
+
+def table_pairs(html: str) -> List[Tuple[str, str]]:
+    """Returns the (name, meaning) pairs of the table rows.
+
+    Args:
+        html (str): The HTML content, its tables are complete.
+
+    Returns:
+        List[Tuple[str, str]]: The (name, meaning) pairs.
+    """
+
+    pairs = SIMPLE_TABLE_ROW_RE.findall(html)
+
+    meanings = CELLS_SEPARATOR.join(map(itemgetter(1), pairs))
+    if all(map(itemgetter(0), pairs)) and "  " not in meanings:
+        return pairs
+
+    # Both regexes match the same rows, only the ones that are not simple are extracted again
+    others = [
+        row for row, (name, _) in zip(TABLE_ROW_RE.findall(html), pairs) if not name
+    ]
+    names = iter(cells_text([name for name, _ in others]))
+    meanings = iter(cells_text([meaning for _, meaning in others], collapse=True))
+
+    result = []
+
+    for name, meaning in pairs:
+        if not name:
+            name, meaning = next(names), next(meanings)
+        elif "  " in meaning:
+            meaning = " ".join(meaning.split())
+
+        if name and meaning:
+            result.append((name, meaning))
+
+    return result
+
+
+def iter_table_pairs(chunks: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """Yields the (name, meaning) pairs of the table rows of a Wikipedia page, see `iter_acronym_pairs`.
+
+    The rows are matched by a regex once their table is complete, it is much faster than
+    the tokenizer because the tags outside of the rows first cells are never visited.
+    The table tags must be lowercase, like in the pages rendered by Wikipedia.
+
+    Args:
+        chunks (Iterable[str]): The HTML content, chunk by chunk.
+
+    Yields:
+        Tuple[str, str]: A (name, meaning) pair.
+    """
+
+    pending: List[str] = []
+    # The end of the previous chunk, the end of a table may be split between two chunks
+    tail = ""
+
+    for chunk in chunks:
+        pending.append(chunk)
+
+        window = tail + chunk[: len(TABLE_END)]
+        tail = (tail + chunk[-len(TABLE_END) :])[-len(TABLE_END) :]
+
+        if TABLE_END not in window and TABLE_END not in chunk:
+            continue
+
+        html = "".join(pending)
+        cut = html.rfind(TABLE_END) + len(TABLE_END)
+
+        pending = [html[cut:]]
+        tail = pending[0][-len(TABLE_END) :]
+
+        yield from table_pairs(html[:cut])
+
+    yield from table_pairs("".join(pending))
+
+
+def iter_acronym_pairs(
+    chunks: Iterable[str], lists: bool = True, tables: bool = True
+) -> Iterator[Tuple[str, str]]:
+    """Yields the (name, meaning) pairs of a Wikipedia page while it is being read.
+    If only the table rows are extracted, they are matched by regexes instead of
+    the tokenizer, see `iter_table_pairs`.
+
+    Args:
+        chunks (Iterable[str]): The HTML content, chunk by chunk.
+        lists (bool, optional): Extract the pairs from the list items. Defaults to True.
+        tables (bool, optional): Extract the pairs from the table rows. Defaults to True.
+
+    Yields:
+        Tuple[str, str]: A (name, meaning) pair.
+    """
+
+    if tables and not lists:
+        yield from iter_table_pairs(chunks)
+        return
+
+    parser = WikipediaAcronymsParser(lists, tables)
+
+    for chunk in chunks:
+        parser.feed(chunk)
+
+        yield from parser.pop_pairs()
+
+    parser.close()
+
+    yield from parser.pop_pairs()
@@ -1,18 +1,42 @@
 import logging
 
 from time import time
-from typing import Set, Self, List, Callable
+from typing import Set, Self, List, Callable, Optional, Dict, Tuple, Awaitable
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
 
 from pycronyms.provider_helper import ProviderHelper, Provider
 from pycronyms.acronym import Acronym
 from pycronyms.exceptions import FetchAcronymsError
 from pycronyms.language import Language
 from pycronyms.category import Category
+from pycronyms.metrics import Metrics, DURATION, ACRONYMS, REUSED
 
 logger = logging.getLogger("pycronyms.aggregator")
 logger.disabled = True  # Should be read-only
 
+type SourcesDict = Dict[str, Dict[str, Dict[str, Optional[str]]]]
+# The meanings of every acronym name per provider, language code and category
+type ProviderAcronymsDict = Dict[str, Dict[str, Dict[str, Dict[str, List[str]]]]]
+
+
+def own_meanings(acronyms: Set[Acronym]) -> Dict[str, List[str]]:
+    """Returns the meanings of acronyms per name, with the meanings of their extras.
+
+    Args:
+        acronyms (Set[Acronym]): The acronyms.
+
+    Returns:
+        Dict[str, List[str]]: The sorted meanings per sorted acronym name.
+    """
+
+    meanings: Dict[str, Set[str]] = {}
+
+    for acronym in acronyms:
+        meanings.setdefault(acronym.name, set()).update(acronym.get_meanings())
+
+    return {name: sorted(meanings[name]) for name in sorted(meanings)}
+
 
 class Pycronyms(ProviderHelper):
     """This is a special provider. It depends of Provider object instances passed to this class.
@@ -22,10 +46,49 @@ class Pycronyms(ProviderHelper):
 
     name = "aggregator"
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        metrics: Optional[Metrics] = None,
+        track_sources: bool = False,
+    ):
+        """Create the aggregator.
+
+        Args:
+            max_workers (Optional[int], optional): The thread pool size used by `fetch_all`
+                to fetch every (provider, language, category) work unit concurrently.
+                If it is None or lower than 2, the fetch is done serially. Defaults to None.
+            metrics (Optional[Metrics], optional): Record the durations and the counters of the fetch,
+                it is shared with the added providers. Nothing is recorded if None. Defaults to None.
+            track_sources (bool, optional): Request the source revision of every provider, see `sources`.
+                It costs an extra request per work unit, it is enabled by `reuse`. Defaults to False.
+        """
+
         super().__init__()
 
+        self.max_workers = max_workers
+        self.track_sources = track_sources
+
+        if metrics is not None:
+            self.metrics = metrics
+
         self.__providers: OrderedDict[str, Provider] = OrderedDict()
+        # Acronyms fetched ahead of time by the thread pool, waiting to be merged
+        self.__prefetched: Dict[
+            Tuple[str, Language, Category], Future[Set[Acronym]]
+        ] = {}
+
+        # Previous fetch, the acronyms of a provider are reused when its source has not changed
+        self.__previous_provider_acronyms: ProviderAcronymsDict = {}
+        self.__previous_sources: SourcesDict = {}
+        # Source revision per (provider, language, category) work unit successfully fetched or reused
+        self.__sources: Dict[Tuple[str, Language, Category], Optional[str]] = {}
+        # Meanings per acronym name of the provider itself per work unit, copied
+        # before being merged because the merge adds extras to the acronym objects
+        self.__provider_acronyms: Dict[
+            Tuple[str, Language, Category], Dict[str, List[str]]
+        ] = {}
+        self.__reused: Set[Tuple[str, Language, Category]] = set()
 
     def add_provider(self, provider: Provider) -> Self:
         """Add a provider that will fetch acronyms
@@ -39,39 +102,321 @@ class Pycronyms(ProviderHelper):
 
         self.__providers[provider.name] = provider
 
+        # A provider with its own metrics keeps them
+        if isinstance(provider, ProviderHelper) and not provider.metrics.enabled:
+            provider.metrics = self.metrics
+
+        return self
+
+    def invalidate(
+        self,
+        language: Optional[Language] = None,
+        category: Optional[Category] = None,
+        provider_name: Optional[str] = None,
+    ) -> int:
+        """Drop the cached results of the providers for a language and a category, with the
+        aggregated acronyms. They are fetched again by the next `fetch_acronyms` or `fetch_all`.
+
+        Args:
+            language (Optional[Language], optional): The language, every language if None. Defaults to None.
+            category (Optional[Category], optional): The category, every category if None. Defaults to None.
+            provider_name (Optional[str], optional): Only this provider, every provider if None. The other providers
+                keep their cached results, they are only merged again. Defaults to None.
+
+        Returns:
+            int: The amount of dropped cached results.
+        """
+
+        providers = list(self.__providers.values())
+        if provider_name is not None:
+            providers = [self.__providers[provider_name]]
+
+        removed = 0
+        for provider in providers:
+            if isinstance(provider, ProviderHelper):
+                removed += provider.invalidate(language, category)
+
+        # The work units fetched again are neither reused nor fetched yet
+        for key in list(self.__sources):
+            if (
+                (provider_name is None or key[0] == provider_name)
+                and (language is None or key[1] == language)
+                and (category is None or key[2] == category)
+            ):
+                self.__sources.pop(key)
+                self.__provider_acronyms.pop(key, None)
+                self.__reused.discard(key)
+
+        return removed + super().invalidate(language, category)
+
+    def reuse(
+        self, provider_acronyms: ProviderAcronymsDict, sources: SourcesDict
+    ) -> Self:
+        """Reuse the acronyms of a previous fetch. A provider is only requested
+        for a language and a category if its source revision has changed since.
+        It enables the sources tracking.
+
+        Args:
+            provider_acronyms (ProviderAcronymsDict): The previous acronyms of every provider, see `provider_acronyms`.
+            sources (SourcesDict): The previous source revisions, see `sources`.
+
+        Returns:
+            Self: The object instance itself.
+        """
+
+        self.__previous_provider_acronyms = provider_acronyms
+        self.__previous_sources = sources
+        self.track_sources = True
+
         return self
 
+    def __reusable_acronyms(
+        self, provider: Provider, language: Language, category: Category
+    ) -> Tuple[Optional[str], Optional[Set[Acronym]]]:
+        """Returns the current source revision of a provider and its previous acronyms
+        if this revision has not changed.
+
+        Args:
+            provider (Provider): The provider.
+            language (Language): The language.
+            category (Category): The category.
+
+        Returns:
+            Tuple[Optional[str], Optional[Set[Acronym]]]: The source revision and the previous acronyms, None if they must be fetched.
+        """
+
+        # The revision is an extra request, it is not worth it if it is not used
+        if not self.track_sources:
+            return None, None
+
+        try:
+            revision = provider.source_revision(language, category)
+        except Exception:
+            return None, None
+
+        if revision is None:
+            return revision, None
+
+        previous_revision = (
+            self.__previous_sources.get(provider.name, {})
+            .get(language.iso_639_1_code, {})
+            .get(category.value)
+        )
+
+        previous_acronyms = (
+            self.__previous_provider_acronyms.get(provider.name, {})
+            .get(language.iso_639_1_code, {})
+            .get(category.value)
+        )
+
+        if previous_revision != revision or previous_acronyms is None:
+            return revision, None
+
+        # The acronyms have been validated by the previous fetch
+        acronyms = {
+            Acronym.construct_trusted(name, meaning, provider.name)
+            for name, meanings in previous_acronyms.items()
+            for meaning in meanings
+        }
+
+        if len(acronyms) > 0:
+            logger.info(
+                f"The provider '{provider.name}' source has not changed, "
+                f"reused {len(acronyms)} acronyms "
+                f"for the language '{language.iso_639_1_code}' "
+                f"and the category '{category.fancy_value()}'"
+            )
+
+        return revision, acronyms
+
+    def __fetch_provider_acronyms(
+        self, provider: Provider, language: Language, category: Category
+    ) -> Set[Acronym]:
+        """Fetch the acronyms of a single provider. A provider failing to fetch
+        its acronyms is ignored.
+
+        Args:
+            provider (Provider): The provider.
+            language (Language): The language.
+            category (Category): The category.
+
+        Returns:
+            Set[Acronym]: The fetched acronyms.
+        """
+
+        key = (provider.name, language, category)
+
+        revision, previous_acronyms = self.__reusable_acronyms(
+            provider, language, category
+        )
+        if previous_acronyms is not None:
+            self.__sources[key] = revision
+            self.__provider_acronyms[key] = own_meanings(previous_acronyms)
+            self.__reused.add(key)
+            self.metrics.add(REUSED, len(previous_acronyms), *key)
+
+            return previous_acronyms
+
+        f: Callable[[Language, Category], Set[Acronym]]
+
+        if isinstance(provider, ProviderHelper):
+            # Using the `_fetch_acronyms` to avoid storing acronyms data in each providers.
+            # Data should be store in this class instance only.
+            f = provider._fetch_acronyms
+        else:
+            f = provider.fetch_acronyms
+
+        try:
+            with self.metrics.timer(DURATION, *key):
+                fetched_acronyms = f(language, category)
+        except FetchAcronymsError as e:
+            return set()
+
+        self.__sources[key] = revision
+        self.__provider_acronyms[key] = own_meanings(fetched_acronyms)
+        self.metrics.add(ACRONYMS, len(fetched_acronyms), *key)
+
+        self.__log_fetched(provider, language, category, fetched_acronyms)
+
+        return fetched_acronyms
+
+    async def __fetch_provider_acronyms_async(
+        self, provider: Provider, language: Language, category: Category
+    ) -> Set[Acronym]:
+        """Asynchronous counterpart of `__fetch_provider_acronyms`.
+        A provider that is not a `ProviderHelper` is adapted by running it in a worker thread.
+
+        Args:
+            provider (Provider): The provider.
+            language (Language): The language.
+            category (Category): The category.
+
+        Returns:
+            Set[Acronym]: The fetched acronyms.
+        """
+
+        # asyncio is slow to import, it is only imported when fetching asynchronously
+        import asyncio
+
+        key = (provider.name, language, category)
+
+        revision, previous_acronyms = await asyncio.to_thread(
+            self.__reusable_acronyms, provider, language, category
+        )
+        if previous_acronyms is not None:
+            self.__sources[key] = revision
+            self.__provider_acronyms[key] = own_meanings(previous_acronyms)
+            self.__reused.add(key)
+            self.metrics.add(REUSED, len(previous_acronyms), *key)
+
+            return previous_acronyms
+
+        coroutine: Awaitable[Set[Acronym]]
+
+        if isinstance(provider, ProviderHelper):
+            coroutine = provider._fetch_acronyms_async(language, category)
+        else:
+            coroutine = asyncio.to_thread(provider.fetch_acronyms, language, category)
+
+        try:
+            with self.metrics.timer(DURATION, *key):
+                fetched_acronyms = await coroutine
+        except FetchAcronymsError as e:
+            return set()
+
+        self.__sources[key] = revision
+        self.__provider_acronyms[key] = own_meanings(fetched_acronyms)
+        self.metrics.add(ACRONYMS, len(fetched_acronyms), *key)
+
+        self.__log_fetched(provider, language, category, fetched_acronyms)
+
+        return fetched_acronyms
+
+    def __log_fetched(
+        self,
+        provider: Provider,
+        language: Language,
+        category: Category,
+        fetched_acronyms: Set[Acronym],
+    ):
+        """Log the amount of acronyms fetched by a provider.
+
+        Args:
+            provider (Provider): The provider.
+            language (Language): The language.
+            category (Category): The category.
+            fetched_acronyms (Set[Acronym]): The fetched acronyms.
+        """
+
+        amount = len(fetched_acronyms)
+
+        if amount > 0:
+            logger.info(
+                f"The provider '{provider.name}' fetched {amount} acronyms "
+                f"for the language '{language.iso_639_1_code}' "
+                f"and the category '{category.fancy_value()}'"
+            )
+
     def _fetch_acronyms(self, language: Language, category: Category) -> Set[Acronym]:
         acronyms = set()
 
         for provider in self.__providers.values():
-            try:
-                f: Callable[[Language, Category], Set[Acronym]]
+            fetched_acronyms: Set[Acronym]
 
-                if isinstance(provider, ProviderHelper):
-                    # Using the `_fetch_acronyms` to avoid storing acronyms data in each providers.
-                    # Data should be store in this class instance only.
-                    f = provider._fetch_acronyms
-                else:
-                    f = provider.fetch_acronyms
+            key = (provider.name, language, category)
+            if key in self.__prefetched:
+                # Errors raised in the thread pool are raised here, like in a serial fetch
+                fetched_acronyms = self.__prefetched.pop(key).result()
+            else:
+                fetched_acronyms = self.__fetch_provider_acronyms(
+                    provider, language, category
+                )
 
-                fetched_acronyms = f(language, category)
+            acronyms = acronyms.union(fetched_acronyms)
+
+        return acronyms
+
+    async def _fetch_acronyms_async(
+        self, language: Language, category: Category
+    ) -> Set[Acronym]:
+        import asyncio
 
-                amount = len(fetched_acronyms)
+        results = await asyncio.gather(
+            *(
+                self.__fetch_provider_acronyms_async(provider, language, category)
+                for provider in self.__providers.values()
+            )
+        )
 
-                if amount > 0:
-                    logger.info(
-                        f"The provider '{provider.name}' fetched {amount} acronyms "
-                        f"for the language '{language.iso_639_1_code}' "
-                        f"and the category '{category.fancy_value()}'"
-                    )
+        acronyms = set()
 
-                acronyms = acronyms.union(fetched_acronyms)
-            except FetchAcronymsError as e:
-                continue
+        # Results are ordered like the providers, the merge is the same as a serial fetch
+        for fetched_acronyms in results:
+            acronyms = acronyms.union(fetched_acronyms)
 
         return acronyms
 
+    def __prefetch_all(self):
+        """Fetch every (provider, language, category) work unit in a thread pool.
+        The results are only stored, they are merged later by `fetch_acronyms`
+        in the same order as a serial fetch, so the output stays deterministic.
+        """
+
+        units = [
+            (provider, language, category)
+            for language in Language
+            for category in Category
+            for provider in self.__providers.values()
+        ]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for provider, language, category in units:
+                future = executor.submit(
+                    self.__fetch_provider_acronyms, provider, language, category
+                )
+
+                self.__prefetched[(provider.name, language, category)] = future
+
     def fetch_all(self) -> Set[Acronym]:
         """It will fetch every acronyms for every possible pair of language and category.
 
@@ -85,11 +430,52 @@ class Pycronyms(ProviderHelper):
 
         start = time()
 
-        for language in Language:
-            for category in Category:
-                acronyms = acronyms.union(self.fetch_acronyms(language, category))
+        try:
+            if self.max_workers is not None and self.max_workers > 1:
+                self.__prefetch_all()
+
+            for language in Language:
+                for category in Category:
+                    acronyms = acronyms.union(self.fetch_acronyms(language, category))
+        finally:
+            # The remaining prefetched results must not be merged by a later fetch
+            self.__prefetched.clear()
+
+        end = time() - start
+        self.metrics.add("fetch_all", end)
+
+        logger.info(f"Finished to fetch all acronyms in {end:.2f} seconds")
+
+        return acronyms
+
+    async def fetch_all_async(self) -> Set[Acronym]:
+        """Asynchronous counterpart of `fetch_all`. Every provider is awaited concurrently
+        for every possible pair of language and category.
+
+        Returns:
+            Set[Acronym]: The fetched acronyms.
+        """
+
+        import asyncio
+
+        logger.info("Started to fetch all acronyms asynchronously")
+
+        start = time()
+
+        results = await asyncio.gather(
+            *(
+                self.fetch_acronyms_async(language, category)
+                for language in Language
+                for category in Category
+            )
+        )
+
+        acronyms = set()
+        for fetched_acronyms in results:
+            acronyms = acronyms.union(fetched_acronyms)
 
         end = time() - start
+        self.metrics.add("fetch_all", end)
 
         logger.info(f"Finished to fetch all acronyms in {end:.2f} seconds")
 
@@ -98,3 +484,60 @@ class Pycronyms(ProviderHelper):
     @property
     def provider_names(self) -> List[str]:
         return list(self.__providers)
+
+    @property
+    def sources(self) -> SourcesDict:
+        """Returns the source revision of every provider, language and category
+        successfully fetched, to be given to `reuse` on the next fetch.
+        The revisions are None if the sources are not tracked.
+
+        Returns:
+            SourcesDict: The source revisions.
+        """
+
+        d = {}
+
+        for (provider_name, language, category), revision in self.__sources.items():
+            languages = d.setdefault(provider_name, {})
+            languages.setdefault(language.iso_639_1_code, {})[category.value] = revision
+
+        return d
+
+    @property
+    def provider_acronyms(self) -> ProviderAcronymsDict:
+        """Returns the acronyms of every provider, language and category successfully fetched,
+        before being merged, to be given to `reuse` on the next fetch. Unlike the merged acronyms,
+        a meaning shared by several providers is kept for each of them.
+
+        Returns:
+            ProviderAcronymsDict: The sorted meanings per acronym name.
+        """
+
+        d = {}
+
+        for (provider_name, language, category), meanings in sorted(
+            self.__provider_acronyms.items(),
+            key=lambda item: (item[0][0], item[0][1].iso_639_1_code, item[0][2].value),
+        ):
+            languages = d.setdefault(provider_name, {})
+            languages.setdefault(language.iso_639_1_code, {})[category.value] = meanings
+
+        return d
+
+    @property
+    def reused(self) -> Set[Tuple[str, Language, Category]]:
+        """Returns the (provider, language, category) work units reused from the previous fetch."""
+
+        return set(self.__reused)
+
+    @property
+    def refreshed(self) -> Set[Tuple[Language, Category]]:
+        """Returns the languages and categories with at least one provider not reused from the previous fetch."""
+
+        return {
+            (language, category)
+            for provider_name in self.__providers
+            for language in Language
+            for category in Category
+            if (provider_name, language, category) not in self.__reused
+        }
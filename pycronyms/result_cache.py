@@ -0,0 +1,197 @@
+import inspect
+import functools
+
+from typing import Any, Dict, Tuple, Callable, Optional
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+
+# Instance attribute holding the caches of the decorated methods
+RESULT_CACHES_ATTRIBUTE = "_result_caches"
+
+
+class ResultCache:
+    """Bounded in-memory cache of function results. The least recently used entry is
+    evicted when the cache is full, and an entry older than `ttl` seconds is never returned.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = monotonic,
+    ):
+        """Create the cache.
+
+        Args:
+            max_size (Optional[int], optional): The maximum amount of entries, unbounded if None. Defaults to None.
+            ttl (Optional[float], optional): The entries lifetime in seconds, infinite if None. Defaults to None.
+            clock (Callable[[], float], optional): The time source. Defaults to monotonic.
+        """
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+
+        self.hits = 0
+        self.misses = 0
+
+        self.__lock = Lock()
+        # Key to (insertion time, value), the least recently used first
+        self.__entries: OrderedDict[Any, Tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, key: Any) -> Tuple[bool, Any]:
+        """Returns the value of a key, if it is cached and not expired.
+
+        Args:
+            key (Any): The key.
+
+        Returns:
+            Tuple[bool, Any]: True with the value if found, False with None otherwise.
+        """
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+            if entry is not None and (
+                self.ttl is None or self.clock() - entry[0] < self.ttl
+            ):
+                self.__entries.move_to_end(key)
+                self.hits += 1
+
+                return True, entry[1]
+
+            if entry is not None:
+                del self.__entries[key]
+
+            self.misses += 1
+
+            return False, None
+
+    def put(self, key: Any, value: Any):
+        """Cache the value of a key, evicting the least recently used entry if needed.
+
+        Args:
+            key (Any): The key.
+            value (Any): The value.
+        """
+
+        with self.__lock:
+            self.__entries[key] = (self.clock(), value)
+            self.__entries.move_to_end(key)
+
+            if self.max_size is not None:
+                while len(self.__entries) > self.max_size:
+                    self.__entries.popitem(last=False)
+
+    def invalidate(self, predicate: Callable[[Any], bool]) -> int:
+        """Remove the entries whose key matches a predicate.
+
+        Args:
+            predicate (Callable[[Any], bool]): Returns True for a key to remove.
+
+        Returns:
+            int: The amount of removed entries.
+        """
+
+        with self.__lock:
+            keys = [key for key in self.__entries if predicate(key)]
+
+            for key in keys:
+                del self.__entries[key]
+
+        return len(keys)
+
+    def clear(self):
+        """Remove every entry."""
+
+        with self.__lock:
+            self.__entries.clear()
+
+    def info(self) -> Dict[str, int]:
+        """Returns the hits, the misses and the size of the cache.
+
+        Returns:
+            Dict[str, int]: The counters.
+        """
+
+        return {"hits": self.hits, "misses": self.misses, "size": len(self)}
+
+
+def get_result_caches(obj: Any) -> Dict[str, ResultCache]:
+    """Returns the caches of the `cached_method` methods of an object.
+
+    Args:
+        obj (Any): The object.
+
+    Returns:
+        Dict[str, ResultCache]: The caches per method qualified name.
+    """
+
+    return obj.__dict__.setdefault(RESULT_CACHES_ATTRIBUTE, {})
+
+
+def cache_key_arguments(key: Tuple[Tuple[str, Any], ...]) -> Dict[str, Any]:
+    """Returns the arguments of a `cached_method` cache key.
+
+    Args:
+        key (Tuple[Tuple[str, Any], ...]): The cache key.
+
+    Returns:
+        Dict[str, Any]: The argument values per parameter name.
+    """
+
+    return dict(key)
+
+
+def cached_method(f: Callable) -> Callable:
+    """Cache the results of a method per instance, by arguments. The arguments are bound
+    to the method parameters with their defaults applied, so the same call given with
+    positional or keyword arguments has the same cache key, see `cache_key_arguments`.
+    Unlike `functools.cache`, the cache belongs to the instance, so it never keeps
+    it alive, and it is bounded by the `cache_max_size` and `cache_ttl` attributes
+    of the instance, read when the cache is created.
+
+    Args:
+        f (Callable): The method.
+
+    Returns:
+        Callable: The cached method.
+    """
+
+    name = f.__qualname__
+    signature = inspect.signature(f)
+
+    @functools.wraps(f)
+    def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+
+        # The instance is not part of the key, the cache belongs to it
+        key = tuple(bound.arguments.items())[1:]
+
+        caches = get_result_caches(self)
+
+        cache = caches.get(name)
+        if cache is None:
+            cache = caches.setdefault(
+                name,
+                ResultCache(
+                    getattr(self, "cache_max_size", None),
+                    getattr(self, "cache_ttl", None),
+                ),
+            )
+
+        found, value = cache.get(key)
+        if found:
+            return value
+
+        value = f(*bound.args, **bound.kwargs)
+        cache.put(key, value)
+
+        return value
+
+    return wrapper
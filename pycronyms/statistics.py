@@ -1,14 +1,168 @@
-from typing import Dict, NoReturn, Optional
+import shutil
+import hashlib
+
+from typing import TYPE_CHECKING, Any, Dict, NoReturn, Optional
 
-import pandas as pd
 from pathlib import Path
 from collections import defaultdict
-import matplotlib.pyplot as plt
+
+import orjson
 
 from pycronyms._common import create_recursive_dict
 from pycronyms.language import Language
 from pycronyms.category import Category
 from pycronyms._common import get_current_date
+from pycronyms.statistics_history import (
+    StatisticsHistory,
+    StatisticsSeries,
+    select_series,
+)
+
+# pandas and matplotlib are slow to import, they are only imported
+# when a dataframe is built or a plot is drawn
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Plot resolutions, the preview is much faster to render
+PLOT_DPI = 300
+PREVIEW_DPI = 72
+
+# Must be increased when the plot rendering changes, so the previous plots are not reused
+PLOT_VERSION = 1
+
+
+def plot_digest(series: StatisticsSeries, dpi: int) -> str:
+    """Returns the SHA-256 of the content of a plot, two plots with
+    the same digest are rendered the same.
+
+    Args:
+        series (StatisticsSeries): The statistics columns.
+        dpi (int): The plot resolution.
+
+    Returns:
+        str: The hexadecimal digest.
+    """
+
+    content = orjson.dumps(
+        {"version": PLOT_VERSION, "dpi": dpi, "series": series},
+        option=orjson.OPT_SORT_KEYS,
+    )
+
+    return hashlib.sha256(content).hexdigest()
+
+
+def plot_digest_filepath(filepath: Path) -> Path:
+    """Returns the path of the file holding the digest of a plot, next to it.
+
+    Args:
+        filepath (Path): The plot file path.
+
+    Returns:
+        Path: The digest file path.
+    """
+
+    return filepath.with_name(filepath.name + ".sha256")
+
+
+def read_plot_digest(filepath: Path) -> Optional[str]:
+    """Returns the digest of a plot, if the plot and its digest file exist.
+
+    Args:
+        filepath (Path): The plot file path.
+
+    Returns:
+        Optional[str]: The hexadecimal digest.
+    """
+
+    try:
+        digest = plot_digest_filepath(filepath).read_text().strip()
+    except OSError:
+        return None
+
+    return digest if filepath.exists() else None
+
+
+def plot_series(
+    series: StatisticsSeries, filepath: Path, dpi: int = PLOT_DPI
+) -> NoReturn:
+    """Create and write to a PNG file a plot. The data is the statistics
+    per language and total. It only takes built-in objects, so it can be
+    called in another process.
+
+    Args:
+        series (StatisticsSeries): The statistics columns, see `Statistics.series`.
+        filepath (Path): The file path.
+        dpi (int, optional): The plot resolution. Defaults to PLOT_DPI.
+    """
+
+    import matplotlib.pyplot as plt
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+
+    x = series["date"]
+
+    ax1.set_title("Evolution of the amount of acronyms per language")
+
+    for l in Language:
+        y = series[l.value]
+        ax1.plot(x, y, label=l.value, marker="o")
+
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+    ax1.set_xlabel("Date")
+    ax1.set_ylabel("Number of acronyms")
+
+    ax2.set_title("Evolution of the total amount of acronyms")
+
+    y = series["total"]
+    ax2.plot(x, y, label="total", marker="o")
+
+    ax2.legend()
+    ax2.grid(True, alpha=0.3)
+    ax2.set_xlabel("Date")
+    ax2.set_ylabel("Total number of acronyms")
+
+    plt.tight_layout()
+
+    fig.savefig(filepath, dpi=dpi, bbox_inches="tight")
+    plt.close()
+
+
+def create_plot_file(
+    series: StatisticsSeries,
+    filepath: Path,
+    previous_filepath: Optional[Path] = None,
+    dpi: int = PLOT_DPI,
+) -> bool:
+    """Write a plot and its digest file. The previous plot is copied
+    instead of being rendered again if its digest is the same.
+    It only takes built-in objects, so it can be called in another process.
+
+    Args:
+        series (StatisticsSeries): The statistics columns, see `Statistics.series`.
+        filepath (Path): The file path.
+        previous_filepath (Optional[Path], optional): The previous plot file path. Defaults to None.
+        dpi (int, optional): The plot resolution. Defaults to PLOT_DPI.
+
+    Returns:
+        bool: True if the plot has been rendered, False if the previous one has been reused.
+    """
+
+    digest = plot_digest(series, dpi)
+
+    rendered = True
+    if previous_filepath is not None and read_plot_digest(previous_filepath) == digest:
+        if previous_filepath.resolve() != filepath.resolve():
+            shutil.copyfile(previous_filepath, filepath)
+
+        rendered = False
+    else:
+        plot_series(series, filepath, dpi)
+
+    # Written after the plot, a plot without a digest file is never reused
+    plot_digest_filepath(filepath).write_text(digest)
+
+    return rendered
 
 
 class Statistics:
@@ -33,6 +187,8 @@ class Statistics:
         self.csv_source_path = csv_source_path
         self.csv_destination_path = csv_destination_path
 
+        self.__history: Optional[StatisticsHistory] = None
+
     def increase(self, language: Language, category: Category, amount: int):
         """Increase the amount of acronyms.
 
@@ -48,80 +204,140 @@ class Statistics:
         self.total += amount
 
     @property
-    def dataframe(self) -> pd.DataFrame:
-        """Returns a pandas dataframe representing the acronyms statistics.
-        It implies the CSV filepath if there is one.
+    def row(self) -> Dict[str, Any]:
+        """Returns the statistics as a row of the history.
 
         Returns:
-            pd.DataFrame: A pandas dataframe.
+            Dict[str, Any]: The date, the total and the amount per language.
         """
 
-        data = {}
-        data["date"] = [get_current_date()]
-        data["total"] = [self.total]
+        row = {"date": get_current_date(), "total": self.total}
 
         for language in Language:
-            data[language.value] = [self.language[language]]
+            row[language.value] = self.language[language]
 
-        df = pd.DataFrame(data)
+        return row
 
-        if self.csv_source_path and self.csv_source_path.exists():
-            df_csv = pd.read_csv(self.csv_source_path)
+    @property
+    def history(self) -> Optional[StatisticsHistory]:
+        """Returns the history of the CSV source file. It is kept for the lifetime
+        of the object, so the file is parsed at most once.
+
+        Returns:
+            Optional[StatisticsHistory]: The history, None without CSV source file.
+        """
 
-            row = df.loc[0]
+        if self.csv_source_path is None:
+            return None
 
-            if list(df_csv.loc[len(df_csv) - 1]) != list(row):
-                df_csv.loc[-1] = row
+        if self.__history is None or self.__history.filepath != self.csv_source_path:
+            self.__history = StatisticsHistory(self.csv_source_path)
 
-            df = df_csv
+        return self.__history
 
-        return df
+    def get_series(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        max_points: Optional[int] = None,
+    ) -> StatisticsSeries:
+        """Returns the history of the CSV source file as built-in lists, followed by
+        the statistics unless they are the same as the last row.
 
-    def append_to_csv(self) -> NoReturn:
-        """Append a row to a CSV file with a given file location.
-        The row represents the statistics.
+        Args:
+            start (Optional[str], optional): The first date included, from the first row if None. Defaults to None.
+            end (Optional[str], optional): The last date included, until the last row if None. Defaults to None.
+            max_points (Optional[int], optional): Downsample to evenly spaced rows, the first and the last ones included. Defaults to None.
+
+        Returns:
+            StatisticsSeries: The values per column name.
         """
 
-        df = self.dataframe
+        history = self.history
+        series = {} if history is None else history.read()
 
-        if self.csv_destination_path:
-            df.to_csv(self.csv_destination_path, index=False, header=True)
+        row = self.row
+        length = len(series.get("date", []))
 
-    def create_plot(self, filepath: Path) -> NoReturn:
-        """Create and write to a PNG file a plot. The data is the statistics
-        per language and total.
+        last_row = None
+        if length > 0:
+            last_row = {column: values[-1] for column, values in series.items()}
 
-        Args:
-            filepath (Path): The file path.
+        if last_row != row:
+            for column in row:
+                series.setdefault(column, [0] * length)
+
+            for column, values in series.items():
+                values.append(row.get(column, 0))
+
+        return select_series(series, start, end, max_points)
+
+    @property
+    def series(self) -> StatisticsSeries:
+        """Returns the whole history with the statistics, see `get_series`.
+
+        Returns:
+            StatisticsSeries: The values per column name.
         """
 
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+        return self.get_series()
 
-        df = self.dataframe
-        x = df["date"]
+    @property
+    def dataframe(self) -> "pd.DataFrame":
+        """Returns a pandas dataframe representing the acronyms statistics.
+        It implies the CSV filepath if there is one.
+
+        Returns:
+            pd.DataFrame: A pandas dataframe.
+        """
+
+        import pandas as pd
+
+        return pd.DataFrame(self.series)
+
+    def append_to_csv(self) -> NoReturn:
+        """Append a row to a CSV file with a given file location.
+        The row represents the statistics.
+
+        The source file is copied to the destination, then only the row is written,
+        the history is never parsed.
+        """
 
-        ax1.set_title("Evolution of the amount of acronyms per language")
+        if not self.csv_destination_path:
+            return
 
-        for l in Language:
-            y = df[l.value]
-            ax1.plot(x, y, label=l.value, marker="o")
+        history = self.history
+        if history is None or self.csv_source_path != self.csv_destination_path:
+            if self.csv_source_path and self.csv_source_path.exists():
+                shutil.copyfile(self.csv_source_path, self.csv_destination_path)
 
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
-        ax1.set_xlabel("Date")
-        ax1.set_ylabel("Number of acronyms")
+            history = StatisticsHistory(self.csv_destination_path)
 
-        ax2.set_title("Evolution of the total amount of acronyms")
+        history.append(self.row)
 
-        y = df["total"]
-        ax2.plot(x, y, label="total", marker="o")
+    def create_plot(
+        self,
+        filepath: Path,
+        previous_filepath: Optional[Path] = None,
+        dpi: int = PLOT_DPI,
+        start: Optional[str] = None,
+        max_points: Optional[int] = None,
+    ) -> bool:
+        """Create and write to a PNG file a plot. The data is the statistics
+        per language and total. The previous plot is reused if the data has not changed,
+        see `create_plot_file`.
 
-        ax2.legend()
-        ax2.grid(True, alpha=0.3)
-        ax2.set_xlabel("Date")
-        ax2.set_ylabel("Total number of acronyms")
+        Args:
+            filepath (Path): The file path.
+            previous_filepath (Optional[Path], optional): The previous plot file path. Defaults to None.
+            dpi (int, optional): The plot resolution. Defaults to PLOT_DPI.
+            start (Optional[str], optional): Only plot from this date. Defaults to None.
+            max_points (Optional[int], optional): Downsample the plotted history to this amount of dates. Defaults to None.
+
+        Returns:
+            bool: True if the plot has been rendered, False if the previous one has been reused.
+        """
 
-        plt.tight_layout()
+        series = self.get_series(start, max_points=max_points)
 
-        fig.savefig(filepath, dpi=300, bbox_inches="tight")
-        plt.close()
+        return create_plot_file(series, filepath, previous_filepath, dpi)
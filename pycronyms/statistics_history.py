@@ -0,0 +1,284 @@
+import os
+import csv
+import io
+
+from typing import Any, Dict, List, Optional
+from pathlib import Path
+from threading import Lock
+from bisect import bisect_left, bisect_right
+
+# The last line is searched from the end of the file by blocks of this size
+TAIL_BLOCK_SIZE = 4096
+
+type StatisticsSeries = Dict[str, List[Any]]
+
+
+def read_last_line(filepath: Path) -> Optional[bytes]:
+    """Returns the last non-empty line of a file, without reading the lines before it.
+
+    Args:
+        filepath (Path): The file path.
+
+    Returns:
+        Optional[bytes]: The line without its line ending, None if the file is empty.
+    """
+
+    with open(filepath, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        tail = b""
+
+        while end > 0:
+            start = max(end - TAIL_BLOCK_SIZE, 0)
+            f.seek(start)
+            tail = f.read(end - start) + tail
+            end = start
+
+            stripped = tail.rstrip(b"\r\n")
+            if b"\n" in stripped:
+                return stripped.rsplit(b"\n", 1)[1]
+
+        stripped = tail.rstrip(b"\r\n")
+
+        return stripped or None
+
+
+def format_row(values: List[Any]) -> str:
+    """Returns a CSV line.
+
+    Args:
+        values (List[Any]): The values.
+
+    Returns:
+        str: The line, with its line ending.
+    """
+
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerow(values)
+
+    return buffer.getvalue()
+
+
+def parse_value(column: str, value: str) -> Any:
+    """Returns the Python value of a CSV field, the date is kept as a string
+    and the counts are integers, a missing count is 0.
+
+    Args:
+        column (str): The column name.
+        value (str): The field.
+
+    Returns:
+        Any: The value.
+    """
+
+    if column == "date":
+        return value
+
+    return int(float(value)) if value else 0
+
+
+def select_series(
+    series: StatisticsSeries,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    max_points: Optional[int] = None,
+) -> StatisticsSeries:
+    """Returns the rows of the history columns within a time window, downsampled if needed.
+
+    Args:
+        series (StatisticsSeries): The values per column name, with a `date` column sorted by date.
+        start (Optional[str], optional): The first date included, from the first row if None. Defaults to None.
+        end (Optional[str], optional): The last date included, until the last row if None. Defaults to None.
+        max_points (Optional[int], optional): Downsample to evenly spaced rows, the first and the last ones included. Defaults to None.
+
+    Returns:
+        StatisticsSeries: The selected values per column name, new lists.
+    """
+
+    dates = series.get("date", [])
+
+    # The rows are appended by date, and the ISO dates are sorted like strings
+    lo = 0 if start is None else bisect_left(dates, start)
+    hi = len(dates) if end is None else bisect_right(dates, end)
+    indexes = range(lo, hi)
+
+    if max_points is not None and len(indexes) > max_points:
+        if max_points <= 1:
+            indexes = indexes[len(indexes) - max_points :]
+        else:
+            step = (len(indexes) - 1) / (max_points - 1)
+            indexes = [indexes[round(i * step)] for i in range(max_points)]
+
+    return {column: [values[i] for i in indexes] for column, values in series.items()}
+
+
+class StatisticsHistory:
+    """Append-only CSV history of the statistics, one row per fetch, with a `date` column.
+
+    Appending a row only reads the header and the last line of the file, so it does not
+    depend on the history size. The parsed history is cached in memory for the lifetime
+    of the object and kept up to date by the appends.
+    """
+
+    def __init__(self, filepath: Path):
+        """Create the history.
+
+        Args:
+            filepath (Path): The CSV file path, it is created by the first append.
+        """
+
+        self.filepath = filepath
+
+        self.__lock = Lock()
+        self.__series: Optional[StatisticsSeries] = None
+
+    @property
+    def columns(self) -> List[str]:
+        """Returns the column names, from the file header.
+
+        Returns:
+            List[str]: The columns, empty if the file does not exist.
+        """
+
+        try:
+            with open(self.filepath, newline="") as f:
+                return next(csv.reader(f), [])
+        except FileNotFoundError:
+            return []
+
+    @property
+    def last_row(self) -> Optional[List[str]]:
+        """Returns the last row of the history, as written.
+
+        Returns:
+            Optional[List[str]]: The fields, None if there is no row.
+        """
+
+        try:
+            line = read_last_line(self.filepath)
+        except FileNotFoundError:
+            return None
+
+        if line is None:
+            return None
+
+        row = next(csv.reader([line.decode()]))
+
+        # The header is the only line
+        return None if row == self.columns else row
+
+    def __load(self) -> StatisticsSeries:
+        """Parse the whole file, the columns per name.
+
+        Returns:
+            StatisticsSeries: The values per column name.
+        """
+
+        try:
+            with open(self.filepath, newline="") as f:
+                reader = csv.reader(f)
+                columns = next(reader, [])
+                rows = [row for row in reader if row]
+        except FileNotFoundError:
+            return {}
+
+        return {
+            column: [parse_value(column, row[i]) for row in rows]
+            for i, column in enumerate(columns)
+        }
+
+    def __rewrite(self, columns: List[str]):
+        """Rewrite the whole file with other columns, the missing counts are 0.
+
+        Args:
+            columns (List[str]): The new columns.
+        """
+
+        series = self.__load()
+        length = len(series.get("date", []))
+
+        with open(self.filepath, "w", newline="") as f:
+            f.write(format_row(columns))
+
+            for i in range(length):
+                row = [
+                    series[column][i] if column in series else 0 for column in columns
+                ]
+                f.write(format_row(row))
+
+        self.__series = None
+
+    def append(self, row: Dict[str, Any]) -> bool:
+        """Append a row, unless it is the same as the last one. The file is only
+        rewritten when the row has a column that it does not have.
+
+        Args:
+            row (Dict[str, Any]): The values per column name, with a `date`.
+
+        Returns:
+            bool: True if the row has been appended.
+        """
+
+        with self.__lock:
+            columns = self.columns
+
+            if not columns:
+                columns = list(row)
+
+                os.makedirs(self.filepath.parent, exist_ok=True)
+                self.filepath.write_text(format_row(columns))
+            elif any(column not in columns for column in row):
+                columns += [column for column in row if column not in columns]
+
+                self.__rewrite(columns)
+
+            values = [row.get(column, 0) for column in columns]
+            line = format_row(values)
+
+            if self.last_row == next(csv.reader([line])):
+                return False
+
+            with open(self.filepath, "rb+") as f:
+                # A file written by another tool may not end with a line ending
+                if f.seek(0, os.SEEK_END) > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        f.write(b"\n")
+
+                f.write(line.encode())
+
+            if self.__series is not None:
+                for column, value in zip(columns, values):
+                    self.__series.setdefault(column, []).append(
+                        parse_value(column, str(value))
+                    )
+
+            return True
+
+    def read(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        max_points: Optional[int] = None,
+    ) -> StatisticsSeries:
+        """Returns the history columns, the file is only parsed once.
+
+        Args:
+            start (Optional[str], optional): The first date included, from the first row if None. Defaults to None.
+            end (Optional[str], optional): The last date included, until the last row if None. Defaults to None.
+            max_points (Optional[int], optional): Downsample to evenly spaced rows, the first and the last ones included. Defaults to None.
+
+        Returns:
+            StatisticsSeries: The values per column name.
+        """
+
+        with self.__lock:
+            if self.__series is None:
+                self.__series = self.__load()
+
+            return select_series(self.__series, start, end, max_points)
+
+    def clear_cache(self):
+        """Forget the parsed history, the next read parses the file again."""
+
+        with self.__lock:
+            self.__series = None
@@ -1,6 +1,16 @@
+import random
 import unittest
 
-from pycronyms.acronym import is_acronym_meaning_valid, Acronym
+from unittest import mock
+
+from pycronyms import acronym as acronym_module
+from pycronyms.acronym import (
+    is_acronym_meaning_valid,
+    are_acronym_meanings_valid,
+    Acronym,
+)
+
+from pycronyms._common import normalize_meaning, normalize_meanings
 
 from pydantic import ValidationError
 
@@ -40,6 +50,44 @@ class TestAcronym(unittest.TestCase):
         for acronym, meaning in ACRONYM_MEANING_INVALID.items():
             self.assertFalse(is_acronym_meaning_valid(acronym, meaning))
 
+    def test_batch_meaning_validation(self):
+        """Test that the batch validation gives the same results as the scalar one"""
+
+        for cases in (ACRONYM_MEANING_VALID, ACRONYM_MEANING_INVALID):
+            acronyms, meanings = list(cases), list(cases.values())
+
+            self.assertEqual(
+                are_acronym_meanings_valid(acronyms, meanings),
+                [is_acronym_meaning_valid(a, m) for a, m in zip(acronyms, meanings)],
+            )
+
+        rng = random.Random(0)
+        acronyms = [
+            "".join(
+                rng.choices("AB1/ Ⓐ", weights=(8, 8, 2, 1, 1, 1), k=rng.randint(0, 4))
+            )
+            for _ in range(5000)
+        ]
+        meanings = [
+            "".join(
+                rng.choices(
+                    "abAB1/ -\nⓐé",
+                    weights=(8, 8, 3, 3, 2, 1, 6, 1, 1, 1, 1),
+                    k=rng.randint(0, 16),
+                )
+            )
+            for _ in range(5000)
+        ]
+
+        self.assertEqual(
+            are_acronym_meanings_valid(acronyms, meanings),
+            [is_acronym_meaning_valid(a, m) for a, m in zip(acronyms, meanings)],
+        )
+        self.assertEqual(are_acronym_meanings_valid([], []), [])
+
+        with self.assertRaises(ValueError):
+            are_acronym_meanings_valid(["SD"], [])
+
     def test_acronym(self):
         """Tests with the acronym object model"""
 
@@ -52,6 +100,66 @@ class TestAcronym(unittest.TestCase):
         with self.assertRaises(ValidationError):
             Acronym(name=" H W ", meaning="Hello zorld")
 
+    def test_construct_trusted(self):
+        """Test that a trusted acronym is neither validated nor normalized again"""
+
+        with mock.patch.object(
+            acronym_module, "normalize_meaning", wraps=normalize_meaning
+        ) as normalize:
+            acronym = Acronym.construct_trusted("SD", "Secure Digital", "test")
+
+        normalize.assert_not_called()
+        self.assertEqual(acronym, Acronym(name="SD", meaning="Secure Digital"))
+        self.assertEqual(acronym.model_fields_set, {"name", "meaning", "provider"})
+        self.assertEqual(acronym.extras, set())
+
+        acronym.add_extra(Acronym.construct_trusted("SD", "Single Density", "test"))
+        self.assertEqual(acronym.get_meanings(), {"Secure Digital", "Single Density"})
+        self.assertEqual(
+            Acronym.from_dict(acronym.to_dict(), trusted=True).to_dict(),
+            acronym.to_dict(),
+        )
+
+    def test_normalize_meaning(self):
+        """Test the meaning normalization, parenthesis, whitespaces and HTML tags"""
+
+        def remove_parenthesis_content(value: str) -> str:
+            # The previous implementation, one character at a time
+            st = [""]
+
+            for ch in value:
+                if ch == "(":
+                    st.append("")
+                elif ch == ")" and len(st) > 1:
+                    st.pop()
+                    continue
+
+                st[-1] += ch
+
+            return " ".join("".join(st).split())
+
+        rng = random.Random(0)
+        values = [
+            "".join(rng.choices("ab ()\t", k=rng.randint(0, 20))) for _ in range(5000)
+        ]
+
+        self.assertEqual(
+            normalize_meanings(values),
+            [remove_parenthesis_content(value) for value in values],
+        )
+
+        self.assertEqual(
+            normalize_meaning("  Secure (SD (card)) Digital (a ) ) "),
+            "Secure Digital )",
+        )
+        self.assertEqual(
+            normalize_meaning(
+                '<a href="/wiki/SD">Secure</a> Digital<sup>(1)</sup> <b>', html=True
+            ),
+            "Secure Digital",
+        )
+        self.assertEqual(normalize_meaning("A < B (c)", html=True), "A < B")
+
 
 if __name__ == "__main__":
     unittest.main()
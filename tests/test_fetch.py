@@ -0,0 +1,172 @@
+import os
+import time
+import unittest
+import tempfile
+
+from pathlib import Path
+from functools import partial
+from unittest import mock
+
+from pycronyms.page_fixtures import PageFixtures
+from pycronyms.providers.wikipedia import COMPUTER_SCIENCE_TITLE, IT_TITLE
+from pycronyms.handlers import HandlerJSON
+from pycronyms.language import Language
+from pycronyms.category import Category
+from pycronyms import statistics
+from pycronyms.metrics import Metrics
+from pycronyms.cli import pycronyms_fetch
+from pycronyms.cli.pycronyms_fetch import fetch, run_output_tasks
+
+PAGES_HTML = {
+    COMPUTER_SCIENCE_TITLE: """<ul>
+<li><a href="/wiki/CPU">CPU</a>—Central Processing Unit</li>
+</ul>""",
+    IT_TITLE: """<table><tbody><tr>
+<td><a href="/wiki/RAM">RAM</a></td>
+<td>Random Access Memory</td>
+</tr></tbody></table>""",
+}
+
+
+class TestFetch(unittest.TestCase):
+    """Controller for the fetch output stage"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.dirpath = Path(self.tmp_dir.name)
+
+        self.fixtures = PageFixtures(self.dirpath / "fixtures")
+        for revision_id, (title, content) in enumerate(PAGES_HTML.items()):
+            self.fixtures.record(title, content, revision_id)
+
+        # The build directory is relative to the working directory
+        self.cwd = os.getcwd()
+        os.chdir(self.dirpath)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def test_fetch(self):
+        """Test that every output file is written by the concurrent output stage"""
+
+        output_dirpath = self.dirpath / "output"
+
+        fetch(output_dirpath, replay_dir=self.fixtures.dirpath)
+
+        self.assertEqual(
+            {path.name for path in output_dirpath.iterdir()},
+            {
+                "acronyms.json",
+                "acronyms.json.idx",
+                "acronyms.csv",
+                "acronyms.snapshot",
+                "shards",
+                "provider_acronyms.json",
+                "statistics.csv",
+                "acronyms_graph.png",
+                "acronyms_graph.png.sha256",
+                "README.md",
+                "metrics.json",
+            },
+        )
+        self.assertFalse(Path(".pycronyms_build").exists())
+
+        acronyms = HandlerJSON.read(output_dirpath / "acronyms.json")
+        self.assertIn("RAM", acronyms[Language.ENGLISH][Category.COMPUTER_SCIENCE])
+
+        png = (output_dirpath / "acronyms_graph.png").read_bytes()
+        self.assertTrue(png.startswith(b"\x89PNG"))
+
+        # Same statistics, the chart is not rendered again
+        with mock.patch.object(statistics, "plot_series") as plot_series:
+            fetch(output_dirpath, replay_dir=self.fixtures.dirpath)
+
+        plot_series.assert_not_called()
+        self.assertEqual((output_dirpath / "acronyms_graph.png").read_bytes(), png)
+
+        # The source revisions are only written for the next incremental fetch
+        self.assertFalse((output_dirpath / "sources.json").exists())
+
+        fetch(output_dirpath, replay_dir=self.fixtures.dirpath, incremental=True)
+        self.assertTrue((output_dirpath / "sources.json").exists())
+
+    def test_fetch_incremental_unchanged(self):
+        """Test that an incremental fetch without changes still updates the statistics history and the metrics"""
+
+        output_dirpath = self.dirpath / "output"
+
+        fetch(output_dirpath, replay_dir=self.fixtures.dirpath, incremental=True)
+
+        content = (output_dirpath / "acronyms.json").read_bytes()
+        rows = (output_dirpath / "statistics.csv").read_text().splitlines()
+        (output_dirpath / "metrics.json").unlink()
+
+        with (
+            mock.patch.object(
+                statistics, "get_current_date", return_value="2100-01-01"
+            ),
+            mock.patch.object(statistics, "plot_series") as plot_series,
+        ):
+            fetch(output_dirpath, replay_dir=self.fixtures.dirpath, incremental=True)
+
+        self.assertEqual((output_dirpath / "acronyms.json").read_bytes(), content)
+
+        new_rows = (output_dirpath / "statistics.csv").read_text().splitlines()
+        self.assertEqual(new_rows[:-1], rows)
+        self.assertTrue(new_rows[-1].startswith("2100-01-01,"))
+
+        # The history has a new date
+        plot_series.assert_called_once()
+        self.assertTrue((output_dirpath / "metrics.json").exists())
+        self.assertFalse(Path(".pycronyms_build").exists())
+
+    def test_fetch_error(self):
+        """Test that nothing persists when an output task fails"""
+
+        output_dirpath = self.dirpath / "output"
+
+        with mock.patch.object(
+            pycronyms_fetch, "write_acronyms_shards", side_effect=OSError("full")
+        ):
+            with self.assertRaises(SystemExit):
+                fetch(output_dirpath, replay_dir=self.fixtures.dirpath)
+
+        self.assertEqual(list(output_dirpath.iterdir()), [])
+        self.assertFalse(Path(".pycronyms_build").exists())
+
+    def test_run_output_tasks(self):
+        """Test that a failed task cancels the pending ones and waits for the running ones"""
+
+        finished = []
+
+        def slow():
+            time.sleep(0.1)
+            finished.append("slow")
+
+        def fail():
+            raise ValueError("fail")
+
+        with self.assertRaises(ValueError):
+            run_output_tasks([slow, fail])
+
+        # The running task has finished before the error is raised
+        self.assertEqual(finished, ["slow"])
+
+        metrics = Metrics()
+        filepath = self.dirpath / "process.txt"
+
+        run_output_tasks(
+            [slow, slow], {"process": partial(filepath.write_text, "ok")}, metrics
+        )
+        self.assertEqual(len(finished), 3)
+        self.assertEqual(filepath.read_text(), "ok")
+        self.assertGreater(metrics.get("process"), 0)
+
+        with self.assertRaises(OSError):
+            run_output_tasks([slow], {"process": partial(open, self.dirpath)})
+        self.assertEqual(len(finished), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
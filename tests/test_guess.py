@@ -0,0 +1,104 @@
+import io
+import unittest
+
+from contextlib import redirect_stdout
+from unittest import mock
+
+from pycronyms.acronyms import Acronyms, create_acronyms
+from pycronyms.acronym import Acronym
+from pycronyms.language import Language
+from pycronyms.category import Category
+from pycronyms.exceptions import PycronymsError
+from pycronyms.indexes import IndexFuzzy
+from pycronyms.handlers import HandlerJSON, HandlerSnapshot
+from pycronyms.cli import pycronyms_guess
+from pycronyms.cli.pycronyms_guess import get_metadatas, EMBEDDED_ACRONYMS_DIR
+from pycronyms.cli._common import SHARDS_DIRNAME
+
+TEST_ACRONYMS = {
+    "HTTP": "Hyper Text Transfer Protocol",
+    "HTML": "Hyper Text Markup Language",
+    "TCP": "Transmission Control Protocol",
+}
+
+
+class TestGuess(unittest.TestCase):
+    """Controller for the guess game"""
+
+    def setUp(self):
+        self.acronyms = create_acronyms()
+
+        for name, meaning in TEST_ACRONYMS.items():
+            self.acronyms[Language.ENGLISH][Category.COMPUTER_SCIENCE][name] = Acronym(
+                name=name, meaning=meaning
+            )
+
+    def test_get_metadatas(self):
+        """Test that a fetched acronym name is played"""
+
+        name, meanings, language, category = get_metadatas(
+            self.acronyms, Language.ENGLISH, Category.COMPUTER_SCIENCE, "http"
+        )
+
+        self.assertEqual(name, "HTTP")
+        self.assertEqual(meanings, {"Hyper Text Transfer Protocol"})
+        self.assertEqual(language, Language.ENGLISH)
+        self.assertEqual(category, Category.COMPUTER_SCIENCE)
+
+    def test_get_metadatas_missing(self):
+        """Test that a missing acronym name fails after printing the closest ones"""
+
+        index = IndexFuzzy(self.acronyms)
+
+        with mock.patch.object(pycronyms_guess, "IndexFuzzy") as index_fuzzy:
+            stdout = io.StringIO()
+
+            with redirect_stdout(stdout), self.assertRaises(PycronymsError):
+                get_metadatas(
+                    self.acronyms,
+                    Language.ENGLISH,
+                    Category.COMPUTER_SCIENCE,
+                    "HTPP",
+                    index,
+                )
+
+        # The given index is reused
+        index_fuzzy.assert_not_called()
+        self.assertEqual(
+            stdout.getvalue().splitlines()[1:],
+            ["- HTTP", "- HTML", "- TCP", ""],
+        )
+
+        stdout = io.StringIO()
+
+        with redirect_stdout(stdout), self.assertRaises(PycronymsError):
+            get_metadatas(
+                self.acronyms, Language.ENGLISH, Category.COMPUTER_SCIENCE, "XYZW"
+            )
+
+        self.assertEqual(stdout.getvalue(), "")
+
+    def test_embedded_outputs(self):
+        """Test that the embedded snapshot and shards have the acronyms of the embedded JSON file"""
+
+        def meanings(acronyms: Acronyms) -> dict:
+            return {
+                (language, category, name): (acronym.meaning, acronym.get_meanings())
+                for language, lv in acronyms.items()
+                for category, cv in lv.items()
+                for name, acronym in cv.items()
+            }
+
+        expected = meanings(HandlerJSON.read(EMBEDDED_ACRONYMS_DIR / "acronyms.json"))
+
+        with HandlerSnapshot.open(
+            EMBEDDED_ACRONYMS_DIR / "acronyms.snapshot"
+        ) as snapshot:
+            self.assertEqual(meanings(snapshot), expected)
+
+        shards = HandlerJSON.read_shards(EMBEDDED_ACRONYMS_DIR / SHARDS_DIRNAME)
+        self.assertEqual(meanings(shards), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,362 @@
+import os
+import mmap
+import unittest
+import tempfile
+
+import orjson
+
+from pathlib import Path
+from unittest import mock
+
+from pycronyms.handlers import HandlerJSON, HandlerCSV, HandlerSnapshot, JSONIndex
+from pycronyms.handlers.json import read_json_file
+from pycronyms.handlers import snapshot as snapshot_module
+from pycronyms.handlers import json as json_module
+from pycronyms.acronyms import (
+    GENERATOR_KEY,
+    GENERATOR_VALUE,
+    create_acronyms,
+    dict_from_acronyms,
+    acronyms_from_dict,
+)
+from pycronyms.acronym import Acronym
+from pycronyms.exceptions import HandlerError, MissingAcronymError
+from pycronyms.language import Language
+from pycronyms.category import Category
+
+
+def create_test_acronyms():
+    acronyms = create_acronyms()
+
+    sd = Acronym(name="SD", meaning="Secure Digital", provider="test")
+    sd.add_extra(Acronym(name="SD", meaning="Single Density", provider="test"))
+
+    acronyms[Language.ENGLISH][Category.COMPUTER_SCIENCE]["SD"] = sd
+    acronyms[Language.FRENCH][Category.COMMON]["TGV"] = Acronym(
+        name="TGV", meaning="Train à Grande Vitesse", provider="test"
+    )
+
+    return acronyms
+
+
+class TestHandlers(unittest.TestCase):
+    """Controller for the acronyms handlers"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.dirpath = Path(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_json_round_trip(self):
+        """Test that a generated JSON file is read back without validation"""
+
+        acronyms = create_test_acronyms()
+        filepath = self.dirpath / "acronyms.json"
+
+        HandlerJSON.write(filepath, acronyms)
+        self.assertIn(GENERATOR_KEY, read_json_file(filepath))
+
+        read_acronyms = HandlerJSON.read(filepath)
+        self.assertEqual(
+            dict_from_acronyms(read_acronyms), dict_from_acronyms(acronyms)
+        )
+
+        sd = read_acronyms[Language.ENGLISH][Category.COMPUTER_SCIENCE]["SD"]
+        self.assertEqual(sd.get_meanings(), {"Secure Digital", "Single Density"})
+
+    def test_json_streaming_format(self):
+        """Test that the streamed JSON is the same as serializing the whole dictionnary"""
+
+        acronyms = create_test_acronyms()
+        # Empty containers must not be written
+        acronyms[Language.FRENCH][Category.COMPUTER_SCIENCE]
+        acronyms[Language.GERMAN][Category.COMMON]
+
+        for name in ("HW", "CPU", "API", "ZIP", "BIOS"):
+            acronyms[Language.ENGLISH][Category.COMPUTER_SCIENCE][name] = (
+                Acronym.construct_trusted(name, f"{name} meaning", "test")
+            )
+
+        for data in (acronyms, create_acronyms()):
+            filepath = self.dirpath / "acronyms.json"
+            d = {GENERATOR_KEY: GENERATOR_VALUE} | dict_from_acronyms(data)
+            expected = orjson.dumps(d, option=orjson.OPT_INDENT_2)
+
+            # A single chunk per category, then several ones
+            for amount in (json_module.ACRONYMS_PER_CHUNK, 2):
+                with mock.patch.object(json_module, "ACRONYMS_PER_CHUNK", amount):
+                    HandlerJSON.write(filepath, data)
+
+                self.assertEqual(filepath.read_bytes(), expected)
+
+    def test_json_untrusted(self):
+        """Test that a JSON dict without the generator marker is validated"""
+
+        d = {"en": {"common": {"HW": {"meaning": "Hello zorld", "provider": "test"}}}}
+
+        with self.assertRaises(ValueError):
+            acronyms_from_dict(d)
+
+    def test_csv_round_trip(self):
+        """Test that a CSV file is read back with the right languages and categories"""
+
+        acronyms = create_test_acronyms()
+        filepath = self.dirpath / "acronyms.csv"
+
+        HandlerCSV.write(filepath, acronyms)
+        read_acronyms = HandlerCSV.read(filepath)
+
+        self.assertEqual(
+            dict_from_acronyms(read_acronyms), dict_from_acronyms(acronyms)
+        )
+
+        tgv = read_acronyms[Language.FRENCH][Category.COMMON]["TGV"]
+        self.assertEqual(tgv.meaning, "Train à Grande Vitesse")
+
+    def test_csv_errors(self):
+        """Test that malformed CSV files raise handler errors"""
+
+        filepath = self.dirpath / "acronyms.csv"
+
+        for content in (
+            "",
+            "name,meaning\n",
+            "name,language,category,provider,meaning\nSD,xx,common,test,Secure Digital\n",
+        ):
+            filepath.write_text(content)
+
+            with self.assertRaises(HandlerError):
+                HandlerCSV.read(filepath)
+
+        with self.assertRaises(HandlerError):
+            HandlerCSV.read(self.dirpath / "missing.csv")
+
+    def test_snapshot_round_trip(self):
+        """Test that a snapshot file is read back with every meaning"""
+
+        acronyms = create_test_acronyms()
+        filepath = self.dirpath / "acronyms.snapshot"
+
+        HandlerSnapshot.write(filepath, acronyms)
+        read_acronyms = HandlerSnapshot.read(filepath)
+
+        self.assertEqual(
+            dict_from_acronyms(read_acronyms), dict_from_acronyms(acronyms)
+        )
+
+    def test_snapshot_lookup(self):
+        """Test that the acronyms of an opened snapshot are read on demand"""
+
+        acronyms = create_test_acronyms()
+        names = ["HW", "CPU", "API", "ZIP", "BIOS"]
+        for name in names:
+            acronyms[Language.ENGLISH][Category.COMPUTER_SCIENCE][name] = (
+                Acronym.construct_trusted(name, name, "test")
+            )
+
+        filepath = self.dirpath / "acronyms.snapshot"
+        HandlerSnapshot.write(filepath, acronyms)
+
+        with HandlerSnapshot.open(filepath) as snapshot:
+            self.assertEqual(set(snapshot), {Language.ENGLISH, Language.FRENCH})
+
+            cv = snapshot[Language.ENGLISH][Category.COMPUTER_SCIENCE]
+            self.assertEqual(list(cv), sorted(names + ["SD"]))
+
+            for name in names:
+                self.assertIn(name, cv)
+                self.assertEqual(cv[name].meaning, name)
+
+            self.assertNotIn("AAA", cv)
+            self.assertNotIn("ZZZ", cv)
+
+            sd = snapshot.get_acronym("SD", Language.ENGLISH, Category.COMPUTER_SCIENCE)
+            self.assertEqual(sd.get_meanings(), {"Secure Digital", "Single Density"})
+
+            with self.assertRaises(MissingAcronymError):
+                snapshot.get_acronym("TGV", Language.ENGLISH, Category.COMMON)
+
+            del cv["SD"]
+            self.assertNotIn("SD", cv)
+            self.assertEqual(len(cv), len(names))
+
+    def test_snapshot_errors(self):
+        """Test that invalid snapshot files raise handler errors"""
+
+        filepath = self.dirpath / "acronyms.snapshot"
+
+        # A single group whose table is out of the file
+        truncated = snapshot_module.HEADER.pack(
+            snapshot_module.MAGIC, snapshot_module.VERSION, 1, 0, 1 << 20, 0, 0, 0, 0
+        )
+
+        mapped = []
+        real_mmap = mmap.mmap
+
+        def tracked_mmap(*args, **kwargs) -> mmap.mmap:
+            mm = real_mmap(*args, **kwargs)
+            mapped.append(mm)
+
+            return mm
+
+        for content in (b"PYCRSNAP", b"NOTASNAP" + bytes(64), truncated, b""):
+            filepath.write_bytes(content)
+
+            with mock.patch.object(snapshot_module.mmap, "mmap", tracked_mmap):
+                with self.assertRaises(HandlerError):
+                    HandlerSnapshot.open(filepath)
+
+        # The mapped files are closed on every error
+        self.assertEqual(len(mapped), 3)
+        self.assertTrue(all(mm.closed for mm in mapped))
+
+        with self.assertRaises(HandlerError):
+            HandlerSnapshot.open(self.dirpath / "missing.snapshot")
+
+    def test_shards_round_trip(self):
+        """Test that the shards are read back, only the requested ones"""
+
+        acronyms = create_test_acronyms()
+        # Empty containers must not be written
+        acronyms[Language.GERMAN][Category.COMMON]
+
+        manifest = HandlerJSON.write_shards(self.dirpath, acronyms)
+
+        self.assertEqual(manifest["total"], 2)
+        self.assertEqual(manifest, HandlerJSON.read_manifest(self.dirpath))
+        self.assertEqual(manifest["shards"]["fr"]["common"]["path"], "fr/common.json")
+        self.assertFalse((self.dirpath / "de").exists())
+
+        read_acronyms = HandlerJSON.read_shards(self.dirpath)
+        self.assertEqual(
+            dict_from_acronyms(read_acronyms), dict_from_acronyms(acronyms)
+        )
+
+        # A shard is a generated acronyms JSON file
+        shard = HandlerJSON.read(self.dirpath / "fr" / "common.json")
+        self.assertEqual(set(shard), {Language.FRENCH})
+
+        # The other shards are never opened
+        (self.dirpath / "en" / "computer_science.json").unlink()
+
+        read_acronyms = HandlerJSON.read_shards(
+            self.dirpath, Language.FRENCH, Category.COMMON
+        )
+        self.assertEqual(set(read_acronyms), {Language.FRENCH})
+        self.assertIn("TGV", read_acronyms[Language.FRENCH][Category.COMMON])
+
+        read_acronyms = HandlerJSON.read_shards(
+            self.dirpath, Language.GERMAN, Category.COMMON
+        )
+        self.assertEqual(len(read_acronyms), 0)
+
+    def test_shards_errors(self):
+        """Test that a missing manifest or a modified shard raise handler errors"""
+
+        with self.assertRaises(HandlerError):
+            HandlerJSON.read_shards(self.dirpath)
+
+        HandlerJSON.write_shards(self.dirpath, create_test_acronyms())
+
+        filepath = self.dirpath / "fr" / "common.json"
+        filepath.write_bytes(filepath.read_bytes().replace(b"Train", b"Tram"))
+
+        with self.assertRaises(HandlerError):
+            HandlerJSON.read_shards(self.dirpath, Language.FRENCH, Category.COMMON)
+
+        # The other shards are still readable
+        HandlerJSON.read_shards(self.dirpath, Language.ENGLISH)
+
+    def test_json_index(self):
+        """Test that the indexed acronyms are decoded from their byte range only"""
+
+        acronyms = create_test_acronyms()
+        # A JSON escaped name looking like the end of a name
+        names = ["HW", "CPU", 'A"PI": \\', "ZIP", "BIOS"]
+        for name in names:
+            acronyms[Language.ENGLISH][Category.COMPUTER_SCIENCE][name] = (
+                Acronym.construct_trusted(name, f"{name} meaning", "test")
+            )
+
+        filepath = self.dirpath / "acronyms.json"
+        index_filepath = self.dirpath / "acronyms.json.idx"
+
+        # Several chunks per category
+        with mock.patch.object(json_module, "ACRONYMS_PER_CHUNK", 2):
+            HandlerJSON.write(filepath, acronyms, index_filepath)
+        # The index does not change the JSON file
+        self.assertEqual(
+            dict_from_acronyms(HandlerJSON.read(filepath)),
+            dict_from_acronyms(acronyms),
+        )
+
+        content = filepath.read_bytes()
+
+        with JSONIndex(filepath) as index:
+            self.assertEqual(len(index), len(names) + 2)
+
+            for name in names:
+                start, end = index.find(
+                    name, Language.ENGLISH, Category.COMPUTER_SCIENCE
+                )
+                self.assertEqual(
+                    orjson.loads(content[start:end]),
+                    {"meaning": f"{name} meaning", "provider": "test"},
+                )
+
+            sd = index.get_acronym("SD", Language.ENGLISH, Category.COMPUTER_SCIENCE)
+            self.assertEqual(sd.get_meanings(), {"Secure Digital", "Single Density"})
+
+            tgv = index.get_acronym("TGV", Language.FRENCH, Category.COMMON)
+            self.assertEqual(tgv.meaning, "Train à Grande Vitesse")
+
+            self.assertIsNone(
+                index.find("TGV", Language.FRENCH, Category.COMPUTER_SCIENCE)
+            )
+            self.assertIsNone(index.find("AAA", Language.ENGLISH, Category.COMMON))
+            self.assertIsNone(index.find("ZZZ", Language.GERMAN, Category.COMMON))
+
+            with self.assertRaises(MissingAcronymError):
+                index.get_acronym("TGV", Language.ENGLISH, Category.COMMON)
+
+    def test_json_index_errors(self):
+        """Test that a missing, invalid or stale index raise handler errors"""
+
+        filepath = self.dirpath / "acronyms.json"
+        index_filepath = self.dirpath / "acronyms.json.idx"
+
+        with self.assertRaises(HandlerError):
+            JSONIndex(filepath)
+
+        HandlerJSON.write(filepath, create_test_acronyms(), index_filepath)
+
+        content = filepath.read_bytes()
+        stat = filepath.stat()
+
+        # Same content with another modification time, like a copy
+        os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        JSONIndex(filepath).close()
+
+        # Same size, another content
+        filepath.write_bytes(content.replace(b"Secure", b"secure"))
+        os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+
+        with self.assertRaises(HandlerError):
+            JSONIndex(filepath)
+
+        filepath.write_bytes(content + b"\n")
+
+        with self.assertRaises(HandlerError):
+            JSONIndex(filepath)
+
+        for content in (b"", b"NOTANIDX" + bytes(64)):
+            index_filepath.write_bytes(content)
+
+            with self.assertRaises(HandlerError):
+                JSONIndex(filepath)
+
+
+if __name__ == "__main__":
+    unittest.main()
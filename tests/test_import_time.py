@@ -0,0 +1,67 @@
+import sys
+import unittest
+import subprocess
+
+from typing import List, Set, Tuple
+
+# Modules that must only be imported when they are actually used
+HEAVY_MODULES = ("pandas", "matplotlib", "numpy", "requests")
+
+
+def imported_modules(args: List[str]) -> Tuple[Set[str], str]:
+    """Run a Python process with `-X importtime` and returns the imported modules and its output.
+    The import times themselves are measured by `benchmarks/import_time.py`.
+
+    Args:
+        args (List[str]): The Python arguments.
+
+    Returns:
+        Tuple[Set[str], str]: The module names and the standard output.
+    """
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    modules = {
+        line.split("|")[-1].strip()
+        for line in process.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+    return modules, process.stdout
+
+
+class TestImportTime(unittest.TestCase):
+    """Controller for the imported modules"""
+
+    def assertNoHeavyModules(self, modules: Set[str]):
+        for module in modules:
+            self.assertNotIn(module.split(".")[0], HEAVY_MODULES)
+
+    def test_import_pycronyms(self):
+        """Test that importing the library does not load the heavy dependencies"""
+
+        modules, _ = imported_modules(["-c", "import pycronyms"])
+
+        self.assertIn("pycronyms", modules)
+        self.assertNoHeavyModules(modules)
+
+    def test_guess_help(self):
+        """Test that the guess CLI help does not load the fetching dependencies"""
+
+        modules, stdout = imported_modules(
+            ["-m", "pycronyms.cli.pycronyms", "guess", "--help"]
+        )
+
+        # The CLI has actually run
+        self.assertIn("usage:", stdout)
+        self.assertIn("--name", stdout)
+        self.assertNoHeavyModules(modules)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import unittest
+
+from pycronyms.indexes import IndexPrefix, IndexInverted, IndexFuzzy
+from pycronyms._common import levenshtein_distance
+from pycronyms.acronyms import create_acronyms
+from pycronyms.acronym import Acronym
+from pycronyms.language import Language
+from pycronyms.category import Category
+
+TEST_ACRONYMS = {
+    (Language.ENGLISH, Category.COMPUTER_SCIENCE): {
+        "TCP": "Transmission Control Protocol",
+        "TCL": "Tool Command Language",
+        "UDP": "User Datagram Protocol",
+        "HTTP": "Hyper Text Transfer Protocol",
+        "HTML": "Hyper Text Markup Language",
+        "CPU": "Central Processing Unit",
+    },
+    (Language.FRENCH, Category.COMPUTER_SCIENCE): {
+        "TC": "Temps Commun",
+        "UC": "Unité Centrale",
+    },
+    (Language.FRENCH, Category.COMMON): {
+        "TGV": "Train à Grande Vitesse",
+    },
+}
+
+
+def create_test_acronyms():
+    acronyms = create_acronyms()
+
+    for (language, category), entries in TEST_ACRONYMS.items():
+        for name, meaning in entries.items():
+            acronyms[language][category][name] = Acronym(
+                name=name, meaning=meaning, provider="test"
+            )
+
+    acronyms[Language.ENGLISH][Category.COMPUTER_SCIENCE]["CPU"].add_extra(
+        Acronym(name="CPU", meaning="Central Protocol Unit", provider="test")
+    )
+
+    return acronyms
+
+
+class TestIndexes(unittest.TestCase):
+    """Controller for the acronyms indexes"""
+
+    def setUp(self):
+        self.acronyms = create_test_acronyms()
+
+    def test_prefix(self):
+        """Test the prefix queries across languages and categories"""
+
+        index = IndexPrefix(self.acronyms)
+        self.assertEqual(len(index), 9)
+
+        results = [
+            (language, acronym.name) for language, _, acronym in index.search("tc")
+        ]
+        self.assertEqual(
+            results,
+            [
+                (Language.FRENCH, "TC"),
+                (Language.ENGLISH, "TCL"),
+                (Language.ENGLISH, "TCP"),
+            ],
+        )
+
+        self.assertEqual(len(list(index.search("T", limit=2))), 2)
+        self.assertEqual(list(index.search("ZZ")), [])
+        self.assertEqual(len(list(index.search(""))), 9)
+
+    def test_inverted(self):
+        """Test the AND/OR word queries over meanings and extras"""
+
+        index = IndexInverted(self.acronyms)
+        self.assertEqual(len(index), 10)
+
+        def names(results):
+            return sorted(acronym.name for _, _, acronym in results)
+
+        self.assertEqual(
+            names(index.search_all(["protocol"])), ["CPU", "HTTP", "TCP", "UDP"]
+        )
+        self.assertEqual(
+            names(index.search_all(["Transfer PROTOCOL"])),
+            ["HTTP"],
+        )
+        self.assertEqual(names(index.search_all(["protocol", "unknown"])), [])
+        self.assertEqual(
+            names(index.search_any(["language", "centrale"])), ["HTML", "TCL", "UC"]
+        )
+        self.assertEqual(
+            names(index.search_any(["commun", "centrale"], language=Language.FRENCH)),
+            ["TC", "UC"],
+        )
+        self.assertEqual(
+            names(index.search_any(["protocol"], category=Category.COMMON)), []
+        )
+
+    def test_fuzzy(self):
+        """Test the typo tolerant acronym names lookup"""
+
+        self.assertEqual(levenshtein_distance("HTPP", "HTTP"), 1)
+        self.assertEqual(levenshtein_distance("", "TCP"), 3)
+        self.assertEqual(levenshtein_distance("TCP", "TCP"), 0)
+
+        index = IndexFuzzy(self.acronyms)
+        self.assertEqual(len(index), 9)
+
+        self.assertEqual(index.search("htpp", k=1), [("HTTP", 1)])
+        self.assertEqual(
+            index.search("TCX"),
+            [("TC", 1), ("TCL", 1), ("TCP", 1), ("TGV", 2), ("UC", 2)],
+        )
+        self.assertEqual(index.search("TCX", k=2), [("TC", 1), ("TCL", 1)])
+        self.assertEqual(
+            index.search("TCX", language=Language.FRENCH),
+            [("TC", 1), ("TGV", 2), ("UC", 2)],
+        )
+        self.assertEqual(index.search("TCX", category=Category.COMMON), [("TGV", 2)])
+        self.assertEqual(index.search("TCX", max_distance=0), [])
+
+        # Same results as scoring every name
+        names = [name for entries in TEST_ACRONYMS.values() for name in entries]
+        for query in ("T", "HTM", "CPUU", "XYZ", "UDC"):
+            expected = sorted(
+                (levenshtein_distance(query, name), name)
+                for name in set(names)
+                if levenshtein_distance(query, name) <= 2
+            )[:3]
+
+            self.assertEqual(
+                index.search(query, k=3), [(name, d) for d, name in expected]
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import tempfile
+
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+
+from pycronyms.metrics import Metrics, DURATION, CANDIDATES
+from pycronyms.language import Language
+from pycronyms.category import Category
+
+
+class TestMetrics(unittest.TestCase):
+    """Controller for the fetch metrics"""
+
+    def test_add(self):
+        """Test that the values are summed per provider, language and category"""
+
+        metrics = Metrics()
+
+        def add(_):
+            for language in Language:
+                metrics.add(CANDIDATES, 1, "provider", language, Category.COMMON)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(add, range(100)))
+
+        self.assertEqual(
+            metrics.get(CANDIDATES, "provider", Language.FRENCH, Category.COMMON), 100
+        )
+
+        d = metrics.to_dict()
+        self.assertEqual(d["providers"]["provider"][CANDIDATES], 100 * len(Language))
+        self.assertEqual(d["languages"]["en"]["common"][CANDIDATES], 100)
+
+    def test_timer(self):
+        """Test that a timer records the duration of its block, even on error"""
+
+        metrics = Metrics()
+
+        with self.assertRaises(ValueError):
+            with metrics.timer("stage"):
+                raise ValueError
+
+        with metrics.timer(DURATION, "provider"):
+            pass
+
+        self.assertGreater(metrics.get("stage"), 0.0)
+        self.assertIn("stage", metrics.to_dict()["pipeline"])
+        self.assertIn(DURATION, metrics.to_dict()["providers"]["provider"])
+
+    def test_disabled(self):
+        """Test that disabled metrics record nothing"""
+
+        metrics = Metrics(enabled=False)
+
+        metrics.add(CANDIDATES, 1, "provider")
+        with metrics.timer("stage"):
+            pass
+
+        self.assertEqual(metrics.get(CANDIDATES, "provider"), 0)
+        self.assertEqual(
+            metrics.to_dict(),
+            {"pipeline": {}, "providers": {}, "languages": {}, "units": {}},
+        )
+
+    def test_write(self):
+        """Test the JSON export"""
+
+        metrics = Metrics()
+        metrics.add(CANDIDATES, 2, "provider", Language.ENGLISH, Category.COMMON)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = Path(tmp_dir) / "metrics.json"
+            metrics.write(filepath)
+
+            self.assertEqual(orjson.loads(filepath.read_bytes()), metrics.to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import os
+import unittest
+import tempfile
+
+import orjson
+
+from pathlib import Path
+
+from pycronyms.page_cache import PageCache
+from pycronyms.providers import Wikipedia
+from pycronyms.language import Language
+from pycronyms.category import Category
+
+PAGE_HTML = """<ul>
+<li><a href="/wiki/CPU">CPU</a>—Central Processing Unit</li>
+</ul>"""
+
+
+class FakePage:
+    def __init__(self, revision_id: int):
+        self.revision_id = revision_id
+        self.html_calls = 0
+
+    def html(self) -> str:
+        self.html_calls += 1
+
+        return PAGE_HTML
+
+
+class FakeWikipedia(Wikipedia):
+    """Wikipedia provider serving fake pages instead of requesting the API."""
+
+    def __init__(self, page: FakePage, page_cache: PageCache):
+        super().__init__(page_cache)
+
+        self.page = page
+
+    def _fetch_page(self, title: str) -> FakePage:
+        return self.page
+
+
+class TestPageCache(unittest.TestCase):
+    """Controller for the persistent pages cache"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.dirpath = Path(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_revision(self):
+        """Test that a cached page is only used with the same revision"""
+
+        cache = PageCache(self.dirpath)
+
+        self.assertIsNone(cache.get("Page", 1))
+
+        cache.put("Page", "content", 1)
+        self.assertEqual(cache.get("Page", 1), "content")
+        self.assertEqual(cache.get("Page"), "content")
+        self.assertIsNone(cache.get("Page", 2))
+
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+        # The cache persists across instances
+        self.assertEqual(PageCache(self.dirpath).get("Page", 1), "content")
+
+    def test_evict(self):
+        """Test that old entries, then least recently accessed entries are evicted"""
+
+        cache = PageCache(self.dirpath, max_age=60, max_size=None)
+
+        cache.put("Old", "content", 1)
+        cache.put("New", "content", 1)
+
+        old_metadata = next(
+            filepath
+            for filepath in self.dirpath.glob("*.json")
+            if b'"Old"' in filepath.read_bytes()
+        )
+        old_metadata.write_bytes(
+            old_metadata.read_bytes().replace(
+                b'"accessed_at":', b'"accessed_at":1,"_":'
+            )
+        )
+
+        self.assertEqual(cache.evict(), 1)
+        self.assertIsNone(cache.get("Old"))
+        self.assertEqual(cache.get("New"), "content")
+
+        cache = PageCache(self.dirpath, max_age=None, max_size=10)
+        cache.put("Other", "content", 1)
+        cache.get("New")
+
+        # Both entries are 7 bytes, only the most recent one fits
+        self.assertEqual(cache.evict(), 1)
+        self.assertEqual(cache.get("New"), "content")
+        self.assertIsNone(cache.get("Other"))
+
+        self.assertEqual(len(os.listdir(self.dirpath)), 2)
+
+    def test_wikipedia(self):
+        """Test that the Wikipedia provider only downloads changed pages"""
+
+        cache = PageCache(self.dirpath)
+        page = FakePage(1)
+
+        for _ in range(2):
+            wikipedia = FakeWikipedia(page, cache)
+            acronyms = wikipedia.fetch_acronyms(
+                Language.ENGLISH, Category.COMPUTER_SCIENCE
+            )
+
+            self.assertEqual({acronym.name for acronym in acronyms}, {"CPU"})
+            # Both computer science pages are downloaded only once
+            self.assertEqual(page.html_calls, 2)
+
+        page.revision_id = 2
+        FakeWikipedia(page, cache).fetch_acronyms(
+            Language.ENGLISH, Category.COMPUTER_SCIENCE
+        )
+        self.assertEqual(page.html_calls, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
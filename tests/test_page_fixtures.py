@@ -0,0 +1,99 @@
+import unittest
+import tempfile
+
+from pathlib import Path
+
+from pycronyms.page_fixtures import PageFixtures
+from pycronyms.providers import Wikipedia, WikipediaReplay
+from pycronyms.providers.wikipedia import COMPUTER_SCIENCE_TITLE, IT_TITLE
+from pycronyms.language import Language
+from pycronyms.category import Category
+from pycronyms.exceptions import FetchAcronymsError
+from pycronyms._common import sorted_recursive
+
+PAGES_HTML = {
+    COMPUTER_SCIENCE_TITLE: """<ul>
+<li><a href="/wiki/CPU">CPU</a>—Central Processing Unit</li>
+<li><a href="/wiki/RAM">RAM</a>—Random-Access Memory</li>
+</ul>""",
+    IT_TITLE: """<table><tbody><tr>
+<td><a href="/wiki/CPU">CPU</a></td>
+<td>Central Processor Unit</td>
+</tr></tbody></table>""",
+}
+
+
+class FakePage:
+    def __init__(self, title: str):
+        self.revision_id = len(title)
+        self.content = PAGES_HTML[title]
+
+    def html(self) -> str:
+        return self.content
+
+
+class FakeWikipedia(Wikipedia):
+    """Wikipedia provider serving fake pages instead of requesting the API."""
+
+    def _fetch_page(self, title: str) -> FakePage:
+        return FakePage(title)
+
+
+class TestPageFixtures(unittest.TestCase):
+    """Controller for the recorded pages"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.fixtures = PageFixtures(Path(self.tmp_dir.name) / "fixtures")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_record_load(self):
+        """Test that a recorded page is loaded back with its revision"""
+
+        self.fixtures.record("A/B title", "<p>content</p>", 42)
+
+        page = self.fixtures.load("A/B title")
+
+        self.assertEqual(page.html(), "<p>content</p>")
+        self.assertEqual(page.revision_id, 42)
+        self.assertEqual(self.fixtures.titles, ["A/B title"])
+
+        with self.assertRaises(FetchAcronymsError):
+            self.fixtures.load("Missing")
+
+    def test_replay(self):
+        """Test that replaying the recorded pages fetches the same acronyms"""
+
+        language, category = Language.ENGLISH, Category.COMPUTER_SCIENCE
+
+        recording = FakeWikipedia(recorder=self.fixtures)
+        recording.fetch_acronyms(language, category)
+
+        self.assertEqual(self.fixtures.titles, sorted(PAGES_HTML))
+
+        replay = WikipediaReplay(self.fixtures)
+        replay.fetch_acronyms(language, category)
+
+        self.assertEqual(
+            sorted_recursive(replay.acronyms_dict),
+            sorted_recursive(recording.acronyms_dict),
+        )
+        self.assertEqual(replay.amount, 3)
+        self.assertEqual(
+            replay.source_revision(language, category),
+            recording.source_revision(language, category),
+        )
+
+    def test_replay_missing(self):
+        """Test that replaying a page that has not been recorded fails"""
+
+        replay = WikipediaReplay(self.fixtures)
+
+        with self.assertRaises(FetchAcronymsError):
+            replay.fetch_acronyms(Language.ENGLISH, Category.COMPUTER_SCIENCE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,452 @@
+import asyncio
+import unittest
+
+from unittest import mock
+
+from typing import Set, Optional
+from time import sleep
+
+from pycronyms.pycronyms import Pycronyms
+from pycronyms.provider_helper import ProviderHelper
+from pycronyms.provider_async import ProviderAsync
+from pycronyms.acronym import Acronym
+from pycronyms.language import Language
+from pycronyms.category import Category
+from pycronyms.exceptions import FetchAcronymsError
+from pycronyms.changes import diff_acronyms
+from pycronyms.metrics import Metrics, DURATION, ACRONYMS, MERGED, EXTRAS
+from pycronyms._common import sorted_recursive
+from pycronyms.providers import Custom, custom
+
+FAKE_ACRONYMS = {
+    "first": {
+        (Language.ENGLISH, Category.COMPUTER_SCIENCE): [
+            ("CPU", "Central Processing Unit"),
+            ("RAM", "Random Access Memory"),
+            ("SD", "Secure Digital"),
+        ],
+        (Language.FRENCH, Category.COMMON): [
+            ("TGV", "Train à Grande Vitesse"),
+        ],
+    },
+    "second": {
+        (Language.ENGLISH, Category.COMPUTER_SCIENCE): [
+            ("SD", "Single Density"),
+            ("CPU", "Central Processing Unit"),
+        ],
+        (Language.FRENCH, Category.COMMON): [
+            ("TGV", "Très Grande Vitesse"),
+        ],
+    },
+}
+
+
+class FakeProvider(ProviderHelper):
+    """Offline provider returning the acronyms of `FAKE_ACRONYMS`."""
+
+    def __init__(
+        self,
+        name: str,
+        delay: float = 0.0,
+        failing: bool = False,
+        revision: Optional[str] = None,
+    ):
+        super().__init__()
+
+        self.name = name
+        self.delay = delay
+        self.failing = failing
+        self.revision = revision
+        self.calls = 0
+        self.revision_calls = 0
+
+    def source_revision(self, language: Language, category: Category) -> Optional[str]:
+        self.revision_calls += 1
+
+        return self.revision
+
+    def _fetch_acronyms(self, language: Language, category: Category) -> Set[Acronym]:
+        self.calls += 1
+
+        sleep(self.delay)
+
+        if self.failing is True:
+            raise FetchAcronymsError("Fake provider failure")
+
+        entries = FAKE_ACRONYMS[self.name].get((language, category), [])
+
+        return {
+            Acronym(name=name, meaning=meaning, provider=self.name)
+            for name, meaning in entries
+        }
+
+
+class FakeProviderAsync(ProviderAsync):
+    """Offline asyncio native provider returning the acronyms of `FAKE_ACRONYMS`."""
+
+    def __init__(self, name: str, delay: float = 0.0):
+        super().__init__()
+
+        self.name = name
+        self.delay = delay
+
+    async def _fetch_acronyms_async(
+        self, language: Language, category: Category
+    ) -> Set[Acronym]:
+        await asyncio.sleep(self.delay)
+
+        entries = FAKE_ACRONYMS[self.name].get((language, category), [])
+
+        return {
+            Acronym(name=name, meaning=meaning, provider=self.name)
+            for name, meaning in entries
+        }
+
+
+def create_pycronyms(
+    max_workers: Optional[int] = None, metrics: Optional[Metrics] = None
+) -> Pycronyms:
+    pycronyms = Pycronyms(max_workers=max_workers, metrics=metrics)
+    pycronyms.add_provider(FakeProvider("first", delay=0.01))
+    pycronyms.add_provider(FakeProvider("second", delay=0.01))
+    pycronyms.add_provider(FakeProvider("failing", failing=True))
+
+    return pycronyms
+
+
+class TestPycronyms(unittest.TestCase):
+    """Controller for the acronyms aggregator"""
+
+    def test_fetch_all(self):
+        """Test the serial fetch of every providers"""
+
+        pycronyms = create_pycronyms()
+        acronyms = pycronyms.fetch_all()
+
+        self.assertEqual(len(acronyms), 6)
+        self.assertEqual(pycronyms.amount, 6)
+
+        sd = pycronyms.get_acronym("SD", Language.ENGLISH, Category.COMPUTER_SCIENCE)
+        self.assertEqual(sd.get_meanings(), {"Secure Digital", "Single Density"})
+
+    def test_fetch_all_concurrent(self):
+        """Test that a concurrent fetch merges exactly like a serial one"""
+
+        serial = create_pycronyms()
+        serial.fetch_all()
+
+        concurrent = create_pycronyms(max_workers=4)
+        concurrent.fetch_all()
+
+        self.assertEqual(
+            sorted_recursive(concurrent.acronyms_dict),
+            sorted_recursive(serial.acronyms_dict),
+        )
+        self.assertEqual(
+            dict(concurrent.statistics.language), dict(serial.statistics.language)
+        )
+        self.assertEqual(concurrent.amount, serial.amount)
+
+    def test_fetch_all_concurrent_error(self):
+        """Test that the prefetched results are dropped when a concurrent fetch fails"""
+
+        pycronyms = create_pycronyms(max_workers=4)
+        broken = FakeProvider("first")
+        pycronyms.add_provider(broken)
+
+        with mock.patch.object(
+            broken, "_fetch_acronyms", side_effect=RuntimeError("unexpected")
+        ):
+            with self.assertRaises(FetchAcronymsError):
+                pycronyms.fetch_all()
+
+        # Nothing left over from the failed fetch is merged
+        tgv = pycronyms.fetch_acronyms(Language.FRENCH, Category.COMMON)
+        self.assertEqual(len(tgv), 2)
+        self.assertEqual(len(pycronyms.fetch_all()), 6)
+
+    def test_fetch_incremental(self):
+        """Test that only the providers whose source has changed are fetched again"""
+
+        previous = Pycronyms(track_sources=True)
+        previous.add_provider(FakeProvider("first", revision="1"))
+        previous.add_provider(FakeProvider("second", revision="1"))
+        previous.fetch_all()
+
+        first = FakeProvider("first", revision="1")
+        second = FakeProvider("second", revision="2")
+
+        pycronyms = Pycronyms()
+        pycronyms.add_provider(first)
+        pycronyms.add_provider(second)
+        pycronyms.reuse(previous.provider_acronyms, previous.sources)
+        pycronyms.fetch_all()
+
+        self.assertEqual(first.calls, 0)
+        self.assertEqual(second.calls, len(Language) * len(Category))
+        self.assertEqual(
+            sorted_recursive(pycronyms.acronyms_dict),
+            sorted_recursive(previous.acronyms_dict),
+        )
+        self.assertEqual(pycronyms.sources["second"]["en"]["computer_science"], "2")
+
+        changes = diff_acronyms(
+            previous.acronyms, pycronyms.acronyms, pycronyms.refreshed
+        )
+        self.assertEqual(len(changes), 0)
+
+        # Without the second provider, its meanings are removed
+        pycronyms = Pycronyms()
+        pycronyms.add_provider(FakeProvider("first", revision="1"))
+        pycronyms.reuse(previous.provider_acronyms, previous.sources)
+        pycronyms.fetch_all()
+
+        self.assertEqual(pycronyms.refreshed, set())
+
+        changes = diff_acronyms(previous.acronyms, pycronyms.acronyms)
+        self.assertEqual(changes.added, [])
+        self.assertEqual(changes.removed, [])
+        self.assertEqual(
+            changes.changed,
+            [
+                (Language.ENGLISH, Category.COMPUTER_SCIENCE, "SD"),
+                (Language.FRENCH, Category.COMMON, "TGV"),
+            ],
+        )
+
+    def test_fetch_incremental_shared_meanings(self):
+        """Test that a reused provider keeps the meanings it shares with another provider"""
+
+        previous = Pycronyms(track_sources=True)
+        previous.add_provider(FakeProvider("first", revision="1"))
+        previous.add_provider(FakeProvider("second", revision="1"))
+        previous.fetch_all()
+
+        # Merged with the meaning of the first provider only
+        cpu = previous.get_acronym("CPU", Language.ENGLISH, Category.COMPUTER_SCIENCE)
+        self.assertEqual(cpu.provider, "first")
+        self.assertEqual(
+            previous.provider_acronyms["second"]["en"]["computer_science"],
+            {"CPU": ["Central Processing Unit"], "SD": ["Single Density"]},
+        )
+
+        second = FakeProvider("second", revision="1")
+
+        # Without the first provider, the second one still has its own meanings
+        pycronyms = Pycronyms()
+        pycronyms.add_provider(second)
+        pycronyms.reuse(previous.provider_acronyms, previous.sources)
+        pycronyms.fetch_all()
+
+        self.assertEqual(second.calls, 0)
+        self.assertEqual(
+            pycronyms.provider_acronyms["second"],
+            previous.provider_acronyms["second"],
+        )
+
+        cpu = pycronyms.get_acronym("CPU", Language.ENGLISH, Category.COMPUTER_SCIENCE)
+        self.assertEqual(cpu.provider, "second")
+
+    def test_fetch_untracked_sources(self):
+        """Test that the source revisions are only requested when they are tracked"""
+
+        provider = FakeProvider("first", revision="1")
+
+        pycronyms = Pycronyms()
+        pycronyms.add_provider(provider)
+        pycronyms.fetch_all()
+
+        self.assertEqual(provider.revision_calls, 0)
+        self.assertIsNone(pycronyms.sources["first"]["en"]["computer_science"])
+
+        pycronyms = Pycronyms(track_sources=True)
+        pycronyms.add_provider(provider)
+        pycronyms.fetch_all()
+
+        self.assertEqual(provider.revision_calls, len(Language) * len(Category))
+        self.assertEqual(pycronyms.sources["first"]["en"]["computer_science"], "1")
+
+    def test_custom_source_revision(self):
+        """Test that the custom provider revision changes with its normalization code"""
+
+        provider = Custom()
+        revision = provider.source_revision(Language.FRENCH, Category.COMMON)
+
+        self.assertIsNotNone(revision)
+        self.assertEqual(
+            provider.source_revision(Language.FRENCH, Category.COMMON), revision
+        )
+        self.assertNotEqual(
+            provider.source_revision(Language.FRENCH, Category.COMPUTER_SCIENCE),
+            revision,
+        )
+
+        with mock.patch.object(custom, "modules_digest", return_value="0" * 64):
+            self.assertNotEqual(
+                provider.source_revision(Language.FRENCH, Category.COMMON), revision
+            )
+
+        # Never reused if the code can not be hashed
+        with mock.patch.object(custom, "modules_digest", return_value=None):
+            self.assertIsNone(
+                provider.source_revision(Language.FRENCH, Category.COMMON)
+            )
+
+    def test_invalidate(self):
+        """Test that an invalidated language and category is fetched again without duplicates"""
+
+        first = FakeProvider("first")
+        second = FakeProvider("second")
+
+        pycronyms = Pycronyms()
+        pycronyms.add_provider(first)
+        pycronyms.add_provider(second)
+        pycronyms.fetch_all()
+
+        expected = sorted_recursive(pycronyms.acronyms_dict)
+        calls = first.calls
+
+        # Cached
+        pycronyms.fetch_acronyms(Language.ENGLISH, Category.COMPUTER_SCIENCE)
+        self.assertEqual(first.calls, calls)
+
+        removed = pycronyms.invalidate(
+            Language.ENGLISH, Category.COMPUTER_SCIENCE, provider_name="first"
+        )
+        self.assertEqual(removed, 1)
+        self.assertEqual(pycronyms.amount, 2)
+        self.assertNotIn(
+            Category.COMPUTER_SCIENCE, pycronyms.acronyms.get(Language.ENGLISH, {})
+        )
+
+        pycronyms.fetch_all()
+
+        self.assertEqual(first.calls, calls + 1)
+        self.assertEqual(pycronyms.amount, 6)
+        self.assertEqual(sorted_recursive(pycronyms.acronyms_dict), expected)
+
+        info = pycronyms.cache_info["ProviderHelper.fetch_acronyms"]
+        self.assertEqual(info["size"], len(Language) * len(Category))
+        self.assertGreater(info["hits"], 0)
+
+    def test_fetch_keywords(self):
+        """Test that a provider fetch is cached when called with keyword arguments"""
+
+        provider = Custom()
+
+        acronyms = provider.fetch_acronyms(
+            language=Language.FRENCH, category=Category.COMMON
+        )
+        self.assertEqual({acronym.name for acronym in acronyms}, {"COM", "TGV"})
+
+        self.assertIs(
+            provider.fetch_acronyms(Language.FRENCH, category=Category.COMMON),
+            acronyms,
+        )
+
+        info = provider.cache_info["ProviderHelper.fetch_acronyms"]
+        self.assertEqual(info, {"hits": 1, "misses": 1, "size": 1})
+
+    def test_fetch_error_keeps_acronyms(self):
+        """Test that a failed fetch keeps the acronyms of the previous one"""
+
+        provider = FakeProvider("first")
+        provider.cache_max_size = 1
+
+        provider.fetch_acronyms(Language.ENGLISH, Category.COMPUTER_SCIENCE)
+        # Evicts the previous result from the cache
+        provider.fetch_acronyms(Language.FRENCH, Category.COMMON)
+        self.assertEqual(provider.amount, 4)
+
+        provider.failing = True
+
+        with self.assertRaises(FetchAcronymsError):
+            provider.fetch_acronyms(Language.ENGLISH, Category.COMPUTER_SCIENCE)
+
+        self.assertEqual(provider.amount, 4)
+        self.assertEqual(
+            set(provider.acronyms[Language.ENGLISH][Category.COMPUTER_SCIENCE]),
+            {"CPU", "RAM", "SD"},
+        )
+
+        # Fetched again, the result replaces the previous one
+        provider.failing = False
+        provider.fetch_acronyms(Language.ENGLISH, Category.COMPUTER_SCIENCE)
+        self.assertEqual(provider.amount, 4)
+
+    def test_metrics(self):
+        """Test the durations and the counters recorded during a fetch"""
+
+        metrics = Metrics()
+        pycronyms = create_pycronyms(max_workers=3, metrics=metrics)
+        pycronyms.fetch_all()
+
+        unit = (Language.ENGLISH, Category.COMPUTER_SCIENCE)
+
+        self.assertEqual(metrics.get(ACRONYMS, "first", *unit), 3)
+        self.assertEqual(metrics.get(ACRONYMS, "second", *unit), 2)
+        self.assertGreater(metrics.get(DURATION, "first", *unit), 0.0)
+        # A failing provider fetches nothing
+        self.assertEqual(metrics.get(ACRONYMS, "failing", *unit), 0)
+
+        self.assertEqual(metrics.get(MERGED, "aggregator", *unit), 3)
+        self.assertEqual(metrics.get(EXTRAS, "aggregator", *unit), 1)
+        self.assertGreater(metrics.get("fetch_all"), 0.0)
+
+        d = metrics.to_dict()
+        self.assertEqual(d["providers"]["first"][ACRONYMS], 4)
+        self.assertEqual(d["languages"]["fr"]["common"][ACRONYMS], 2)
+        self.assertEqual(d["units"]["second"]["en"]["computer_science"][ACRONYMS], 2)
+
+        # Disabled by default
+        pycronyms = create_pycronyms()
+        pycronyms.fetch_all()
+        self.assertEqual(pycronyms.metrics.to_dict()["providers"], {})
+
+    def test_provider_async_sync_adapter(self):
+        """Test that an asyncio native provider is usable synchronously"""
+
+        provider = FakeProviderAsync("first")
+        acronyms = provider.fetch_acronyms(Language.ENGLISH, Category.COMPUTER_SCIENCE)
+
+        self.assertEqual(len(acronyms), 3)
+
+
+class TestPycronymsAsync(unittest.IsolatedAsyncioTestCase):
+    """Controller for the asynchronous acronyms aggregator"""
+
+    async def test_fetch_all_async(self):
+        """Test that an asynchronous fetch merges like a serial one, with sync and async providers"""
+
+        serial = create_pycronyms()
+        serial.fetch_all()
+
+        pycronyms = Pycronyms()
+        pycronyms.add_provider(FakeProvider("first", delay=0.01))
+        pycronyms.add_provider(FakeProviderAsync("second", delay=0.01))
+        pycronyms.add_provider(FakeProvider("failing", failing=True))
+
+        acronyms = await pycronyms.fetch_all_async()
+
+        self.assertEqual(len(acronyms), 6)
+        self.assertEqual(
+            sorted_recursive(pycronyms.acronyms_dict),
+            sorted_recursive(serial.acronyms_dict),
+        )
+        self.assertEqual(pycronyms.amount, serial.amount)
+
+        # Fetched again, the acronyms replace the previous ones
+        await pycronyms.fetch_all_async()
+
+        self.assertEqual(
+            sorted_recursive(pycronyms.acronyms_dict),
+            sorted_recursive(serial.acronyms_dict),
+        )
+        self.assertEqual(pycronyms.amount, serial.amount)
+        self.assertEqual(
+            dict(pycronyms.statistics.language), dict(serial.statistics.language)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import gc
+import weakref
+import unittest
+
+from pycronyms.result_cache import (
+    ResultCache,
+    cached_method,
+    cache_key_arguments,
+    get_result_caches,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Squares:
+    cache_max_size = 2
+    cache_ttl = None
+
+    def __init__(self):
+        self.calls = 0
+
+    @cached_method
+    def square(self, value: int) -> int:
+        self.calls += 1
+
+        return value * value
+
+    @cached_method
+    def power(self, value: int, exponent: int = 2) -> int:
+        self.calls += 1
+
+        return value**exponent
+
+
+class TestResultCache(unittest.TestCase):
+    """Controller for the per instance results cache"""
+
+    def test_lru(self):
+        """Test that the least recently used entry is evicted"""
+
+        cache = ResultCache(max_size=2)
+
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), (True, 1))
+
+        cache.put("c", 3)
+        self.assertEqual(cache.get("b"), (False, None))
+        self.assertEqual(cache.get("a"), (True, 1))
+        self.assertEqual(cache.info(), {"hits": 2, "misses": 1, "size": 2})
+
+    def test_ttl(self):
+        """Test that an expired entry is never returned"""
+
+        clock = FakeClock()
+        cache = ResultCache(ttl=10, clock=clock)
+
+        cache.put("a", 1)
+        clock.now = 9.0
+        self.assertEqual(cache.get("a"), (True, 1))
+
+        clock.now = 10.0
+        self.assertEqual(cache.get("a"), (False, None))
+        self.assertEqual(len(cache), 0)
+
+    def test_invalidate(self):
+        """Test that the entries matching a predicate are removed"""
+
+        cache = ResultCache()
+
+        for key in [(1, "a"), (2, "a"), (3, "b")]:
+            cache.put(key, None)
+
+        self.assertEqual(cache.invalidate(lambda key: "a" in key), 2)
+        self.assertEqual(cache.get((3, "b")), (True, None))
+
+    def test_cached_method(self):
+        """Test that a cached method is bounded per instance and does not keep it alive"""
+
+        squares = Squares()
+
+        self.assertEqual([squares.square(v) for v in (2, 2, 3, 4, 2)], [4, 4, 9, 16, 4])
+        # The value 2 has been evicted by 3 and 4
+        self.assertEqual(squares.calls, 4)
+
+        other = Squares()
+        other.square(2)
+        self.assertEqual(other.calls, 1)
+
+        ref = weakref.ref(squares)
+        del squares
+        gc.collect()
+
+        self.assertIsNone(ref())
+
+    def test_cached_method_arguments(self):
+        """Test that positional, keyword and default arguments of a call share a cache key"""
+
+        squares = Squares()
+
+        self.assertEqual(squares.power(3), 9)
+        self.assertEqual(squares.power(3, 2), 9)
+        self.assertEqual(squares.power(value=3), 9)
+        self.assertEqual(squares.power(exponent=2, value=3), 9)
+        self.assertEqual(squares.calls, 1)
+
+        self.assertEqual(squares.power(3, exponent=3), 27)
+        self.assertEqual(squares.calls, 2)
+
+        cache = get_result_caches(squares)["Squares.power"]
+        self.assertEqual(
+            cache.invalidate(lambda key: cache_key_arguments(key)["exponent"] == 3), 1
+        )
+
+        with self.assertRaises(TypeError):
+            squares.power(3, unknown=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
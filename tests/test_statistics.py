@@ -0,0 +1,208 @@
+import unittest
+import tempfile
+
+from pathlib import Path
+from unittest import mock
+
+from pycronyms import statistics
+from pycronyms.language import Language
+from pycronyms.category import Category
+from pycronyms.statistics import Statistics
+from pycronyms.statistics_history import StatisticsHistory, read_last_line
+from pycronyms.statistics import (
+    PLOT_DPI,
+    PREVIEW_DPI,
+    create_plot_file,
+    plot_digest,
+    plot_digest_filepath,
+    read_plot_digest,
+)
+
+SERIES = {
+    "date": ["2025-11-07", "2025-11-08"],
+    "total": [1430, 1436],
+} | {language.value: [0, 0] for language in Language}
+SERIES |= {"en": [1428, 1432], "fr": [2, 4]}
+
+
+class TestStatisticsPlot(unittest.TestCase):
+    """Controller for the content-addressed statistics plot"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.dirpath = Path(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_digest(self):
+        """Test that the digest depends on the series and the resolution"""
+
+        digest = plot_digest(SERIES, PLOT_DPI)
+
+        self.assertEqual(digest, plot_digest(dict(reversed(SERIES.items())), PLOT_DPI))
+        self.assertNotEqual(digest, plot_digest(SERIES, PREVIEW_DPI))
+        self.assertNotEqual(digest, plot_digest(SERIES | {"fr": [2, 5]}, PLOT_DPI))
+
+    def test_reuse(self):
+        """Test that the previous plot is copied when its digest matches"""
+
+        previous_filepath = self.dirpath / "previous.png"
+        filepath = self.dirpath / "plot.png"
+
+        with mock.patch.object(statistics, "plot_series") as plot_series:
+            plot_series.side_effect = lambda _, path, __: path.write_bytes(b"png")
+
+            self.assertTrue(create_plot_file(SERIES, previous_filepath))
+            self.assertEqual(
+                read_plot_digest(previous_filepath), plot_digest(SERIES, PLOT_DPI)
+            )
+
+            self.assertFalse(create_plot_file(SERIES, filepath, previous_filepath))
+            self.assertEqual(filepath.read_bytes(), b"png")
+            self.assertEqual(
+                plot_digest_filepath(filepath).read_text(),
+                plot_digest(SERIES, PLOT_DPI),
+            )
+            self.assertEqual(plot_series.call_count, 1)
+
+            # A preview or new statistics are rendered again
+            self.assertTrue(
+                create_plot_file(SERIES, filepath, previous_filepath, PREVIEW_DPI)
+            )
+            self.assertTrue(
+                create_plot_file(SERIES | {"fr": [2, 5]}, filepath, previous_filepath)
+            )
+            self.assertEqual(plot_series.call_count, 3)
+
+        # A plot without its digest file is never reused
+        plot_digest_filepath(previous_filepath).unlink()
+        self.assertIsNone(read_plot_digest(previous_filepath))
+
+    def test_render(self):
+        """Test that a preview is rendered as a PNG file"""
+
+        filepath = self.dirpath / "plot.png"
+
+        create_plot_file(SERIES, filepath, dpi=PREVIEW_DPI)
+        self.assertTrue(filepath.read_bytes().startswith(b"\x89PNG"))
+
+
+class TestStatisticsHistory(unittest.TestCase):
+    """Controller for the append-only statistics history"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filepath = Path(self.tmp_dir.name) / "statistics.csv"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_append(self):
+        """Test that a row is appended unless it is the same as the last one"""
+
+        history = StatisticsHistory(self.filepath)
+
+        self.assertIsNone(history.last_row)
+        self.assertEqual(history.read(), {})
+
+        row = {"date": "2025-11-08", "total": 4, "en": 3, "fr": 1}
+
+        self.assertTrue(history.append(row))
+        self.assertFalse(history.append(row))
+        self.assertTrue(history.append(row | {"date": "2025-11-09"}))
+
+        self.assertEqual(
+            self.filepath.read_text(),
+            "date,total,en,fr\n2025-11-08,4,3,1\n2025-11-09,4,3,1\n",
+        )
+        self.assertEqual(history.last_row, ["2025-11-09", "4", "3", "1"])
+
+        # A new column rewrites the file, the previous rows have 0
+        history.append({"date": "2025-11-10", "total": 5, "en": 3, "fr": 1, "de": 1})
+
+        self.assertEqual(history.columns, ["date", "total", "en", "fr", "de"])
+        self.assertEqual(history.read()["de"], [0, 0, 1])
+
+    def test_read_cache(self):
+        """Test that the history is parsed once, then kept up to date by the appends"""
+
+        history = StatisticsHistory(self.filepath)
+        history.append({"date": "2025-11-08", "total": 1})
+
+        self.assertEqual(history.read(), {"date": ["2025-11-08"], "total": [1]})
+
+        # Changed by another writer, the cache is still used
+        self.filepath.write_text("date,total\n")
+        history.append({"date": "2025-11-09", "total": 2})
+
+        self.assertEqual(
+            history.read(), {"date": ["2025-11-08", "2025-11-09"], "total": [1, 2]}
+        )
+
+        history.clear_cache()
+        self.assertEqual(history.read(), {"date": ["2025-11-09"], "total": [2]})
+
+    def test_window(self):
+        """Test that a time window and a downsampled series can be read"""
+
+        history = StatisticsHistory(self.filepath)
+        for day in range(1, 11):
+            history.append({"date": f"2025-11-{day:02}", "total": day})
+
+        series = history.read(start="2025-11-03", end="2025-11-05")
+        self.assertEqual(series["total"], [3, 4, 5])
+
+        self.assertEqual(history.read(max_points=4)["total"], [1, 4, 7, 10])
+        self.assertEqual(history.read(max_points=1)["total"], [10])
+        self.assertEqual(history.read(start="2025-12-01")["total"], [])
+        self.assertEqual(len(history.read()["total"]), 10)
+
+    def test_read_last_line(self):
+        """Test that the last line is found across blocks and line endings"""
+
+        self.filepath.write_bytes(b"")
+        self.assertIsNone(read_last_line(self.filepath))
+
+        self.filepath.write_bytes(b"header")
+        self.assertEqual(read_last_line(self.filepath), b"header")
+
+        self.filepath.write_bytes(b"header\r\n" + b"x" * 10_000 + b"\r\n\n")
+        self.assertEqual(read_last_line(self.filepath), b"x" * 10_000)
+
+    def test_statistics(self):
+        """Test that the statistics are appended to a copy of the source history"""
+
+        source_filepath = self.filepath
+        destination_filepath = self.filepath.with_name("destination.csv")
+
+        source_filepath.write_text(
+            "date,total," + ",".join(l.value for l in Language) + "\n"
+            "2025-11-08,1,"
+            + ",".join("1" if l == Language.ENGLISH else "0" for l in Language)
+            + "\n"
+        )
+
+        s = Statistics(source_filepath, destination_filepath)
+        s.increase(Language.ENGLISH, Category.COMMON, 2)
+
+        series = s.series
+        self.assertEqual(series["total"], [1, 2])
+        self.assertEqual(series["date"][0], "2025-11-08")
+
+        s.append_to_csv()
+
+        self.assertEqual(StatisticsHistory(destination_filepath).read(), series)
+        # The source is never modified
+        self.assertEqual(len(source_filepath.read_text().splitlines()), 2)
+
+        # Same statistics, nothing is added
+        s.csv_source_path = destination_filepath
+        s.append_to_csv()
+
+        self.assertEqual(s.series, series)
+        self.assertEqual(len(destination_filepath.read_text().splitlines()), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,244 @@
+import time
+import unittest
+import threading
+
+from typing import List, Tuple, Dict
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+
+from pycronyms.providers import Wikipedia
+from pycronyms.providers.wikipedia import COMPUTER_SCIENCE_TITLE, IT_TITLE
+from pycronyms.providers.wikipedia_client import (
+    WikipediaClient,
+    TokenBucket,
+    retry_after_seconds,
+)
+from pycronyms.language import Language
+from pycronyms.category import Category
+from pycronyms.exceptions import FetchAcronymsError
+
+PAGES_HTML = {
+    COMPUTER_SCIENCE_TITLE: """<ul>
+<li><a href="/wiki/CPU">CPU</a>—Central Processing Unit</li>
+</ul>""",
+    IT_TITLE: """<table><tbody><tr>
+<td><a href="/wiki/RAM">RAM</a></td>
+<td>Random Access Memory</td>
+</tr></tbody></table>""",
+}
+
+REVISIONS = {title: i + 1 for i, title in enumerate(PAGES_HTML)}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """A MediaWiki API stub, answering the scripted responses first."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def send(self, status: int, data: dict, headers: Dict[str, str] = {}):
+        body = orjson.dumps(data)
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server: StubServer = self.server
+        params = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+
+        with server.lock:
+            server.connections.add(self.client_address)
+            server.params.append(params)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            scripted = server.scripted.pop(0) if server.scripted else None
+
+        time.sleep(server.delay)
+
+        if scripted is not None:
+            self.send(*scripted)
+        elif params["action"] == "query":
+            title = params["titles"]
+            self.send(
+                200,
+                {
+                    "query": {
+                        "pages": [
+                            {"title": title, "revisions": [{"revid": REVISIONS[title]}]}
+                        ]
+                    }
+                },
+            )
+        else:
+            title = params.get("page") or next(
+                t for t, r in REVISIONS.items() if str(r) == params["oldid"]
+            )
+            self.send(200, {"parse": {"title": title, "text": PAGES_HTML[title]}})
+
+        with server.lock:
+            server.in_flight -= 1
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+
+        self.lock = threading.Lock()
+        self.connections = set()
+        self.params: List[dict] = []
+        self.scripted: List[Tuple[int, dict, Dict[str, str]]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.delay = 0.0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/w/api.php"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+class TestWikipediaClient(unittest.TestCase):
+    """Controller for the Wikipedia API client, against a local stub server"""
+
+    def setUp(self):
+        self.server = StubServer()
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+        self.sleeps: List[float] = []
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def create_client(self, **kwargs) -> WikipediaClient:
+        kwargs = {"rate": 1000.0, "backoff_factor": 0.01, "sleep": self.sleep} | kwargs
+
+        return WikipediaClient(self.server.url, **kwargs)
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+
+    def test_provider(self):
+        """Test the Wikipedia provider with a client and a single pooled connection"""
+
+        client = self.create_client()
+        wikipedia = Wikipedia(client=client)
+
+        acronyms = wikipedia.fetch_acronyms(Language.ENGLISH, Category.COMPUTER_SCIENCE)
+
+        self.assertEqual({acronym.name for acronym in acronyms}, {"CPU", "RAM"})
+        # The page revisions, then the hash of the parsing code
+        revision = wikipedia.source_revision(
+            Language.ENGLISH, Category.COMPUTER_SCIENCE
+        )
+        self.assertEqual(revision.split(":")[:2], ["1", "2"])
+        self.assertEqual(len(revision.split(":")[2]), 64)
+        # A revision and a content per page, the connection is kept alive
+        self.assertEqual(client.requests, 4)
+        self.assertEqual(len(self.server.connections), 1)
+        self.assertEqual(self.server.params[0]["maxlag"], "5")
+
+    def test_retry(self):
+        """Test that the throttled and failed requests are retried, honoring Retry-After"""
+
+        self.server.scripted = [
+            (429, {}, {"Retry-After": "3"}),
+            (503, {}, {}),
+            (200, {"error": {"code": "maxlag"}}, {"Retry-After": "1"}),
+        ]
+
+        client = self.create_client()
+
+        self.assertEqual(client.revision_id(IT_TITLE), 2)
+        self.assertEqual(client.retries, 3)
+        self.assertEqual(self.sleeps[0], 3.0)
+        self.assertLessEqual(self.sleeps[1], 0.02)
+        self.assertEqual(self.sleeps[2], 1.0)
+
+    def test_retry_exhausted(self):
+        """Test that a request fails after every retry, and that other errors are not retried"""
+
+        self.server.scripted = [(500, {}, {})] * 3
+
+        client = self.create_client(max_retries=2)
+
+        with self.assertRaises(FetchAcronymsError):
+            client.revision_id(IT_TITLE)
+        self.assertEqual(client.requests, 3)
+
+        # Exponential backoff, with jitter
+        self.assertLessEqual(self.sleeps[0], 0.01)
+        self.assertGreater(self.sleeps[1], 0.01 - 1e-9)
+
+        self.server.scripted = [(404, {}, {}), (200, {"error": {"code": "bad"}}, {})]
+
+        for _ in range(2):
+            with self.assertRaises(FetchAcronymsError):
+                client.revision_id(IT_TITLE)
+        self.assertEqual(client.requests, 5)
+
+    def test_max_concurrency(self):
+        """Test that the requests in flight are bounded"""
+
+        self.server.delay = 0.05
+        client = WikipediaClient(self.server.url, max_concurrency=2, rate=1000.0)
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            list(executor.map(lambda _: client.revision_id(IT_TITLE), range(6)))
+
+        self.assertEqual(self.server.max_in_flight, 2)
+        self.assertLessEqual(len(self.server.connections), 2)
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Controller for the token bucket rate limiter"""
+
+    def test_acquire(self):
+        """Test that the burst is immediate, then the rate is respected"""
+
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, burst=2, clock=clock, sleep=clock.sleep)
+
+        self.assertEqual([bucket.acquire() for _ in range(2)], [0.0, 0.0])
+        self.assertAlmostEqual(bucket.acquire(), 0.5)
+        self.assertAlmostEqual(bucket.acquire(), 0.5)
+        self.assertAlmostEqual(clock.now, 1.0)
+
+        clock.now += 10.0
+        self.assertEqual([bucket.acquire() for _ in range(2)], [0.0, 0.0])
+
+    def test_retry_after(self):
+        """Test the Retry-After header parsing"""
+
+        self.assertEqual(retry_after_seconds("120"), 120.0)
+        self.assertEqual(retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+        self.assertIsNone(retry_after_seconds(None))
+        self.assertIsNone(retry_after_seconds("soon"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+import unittest
+
+from pycronyms.providers.wikipedia_parser import (
+    iter_acronym_pairs,
+    WikipediaAcronymsParser,
+)
+
+LIST_HTML = """<div class="mw-parser-output"><h2>A</h2>
+<ul>
+<li><a href="/wiki/AAA" title="AAA">AAA</a>—Anti-Aircraft Artillery</li>
+<li><a href="/wiki/ACL" title="ACL">ACL</a>—<a href="/wiki/Access_control_list" title="Access control list">Access Control List</a><sup id="cite_ref-1" class="reference"><a href="#cite_note-1">&#91;1&#93;</a></sup></li>
+<li><a href="/wiki/ADC" title="ADC">ADC</a>—Analog-to-Digital Converter</li><li><a href="/wiki/A&amp;B">A&amp;B</a>—A &amp; B</li>
+<li>See also <a href="/wiki/ABC">ABC</a>—Nothing</li>
+<li><a href="/wiki/API" title="API">API</a>—Application Programming Interface
+<ul>
+<li><a href="/wiki/REST" title="REST">REST</a>—Representational State Transfer</li>
+</ul>
+</li>
+<!-- <li><a href="/wiki/OLD">OLD</a>—Commented Out</li> -->
+<li><a href="/wiki/B">B</a> has no separator</li>
+</ul>
+</div>"""
+
+TABLE_HTML = """<table class="wikitable sortable">
+<tbody><tr>
+<th>Acronym</th>
+<th>Expansion</th>
+</tr>
+<tr>
+<td><a href="/wiki/HTML" title="HTML">HTML</a>
+</td>
+<td>Hypertext Markup Language
+</td>
+<td>A comment
+</td></tr>
+<tr>
+<td>XML
+</td>
+<td>Not a link
+</td></tr>
+<tr>
+<td><a href="/wiki/IP" title="IP">IP</a>
+</td>
+<td><a href="/wiki/Internet_Protocol">Internet</a> Protocol<sup>[2]</sup>
+</td></tr>
+</tbody></table>"""
+
+# Rows rendered like Wikipedia, then rows that are not simple
+SIMPLE_ROW_HTML = """<tr>
+<td><a href="/wiki/HTTP" title="HTTP">HTTP</a>
+</td>
+<td>Hypertext Transfer Protocol
+</td></tr>"""
+
+OTHER_ROWS_HTML = """<tr class="row">
+<td style="x"><b><a href="/wiki/B">B&amp;C</a></b>
+</td>
+<th>B  &amp;\tC
+</th></tr>
+<tr>
+<td><a href="/wiki/DS" title="DS">DS</a>
+</td>
+<td>Double  Space
+</td></tr>
+<tr>
+<td><a href="/wiki/ML" title="ML">ML</a>
+</td>
+<td>Multi
+Line\xa0Meaning
+</td></tr>
+<tr>
+<td><a href="/wiki/E" title="E">E</a>
+</td>
+<td>
+</td></tr>
+<tr><td><!-- A comment --><a href="/wiki/TW">Two Words</a></td><td>Compact</td></tr>"""
+
+
+class TestWikipediaParser(unittest.TestCase):
+    """Controller for the Wikipedia HTML parser"""
+
+    def test_list_items(self):
+        """Test the pairs extracted from list items"""
+
+        pairs = list(iter_acronym_pairs((LIST_HTML,), tables=False))
+
+        self.assertEqual(
+            pairs,
+            [
+                ("AAA", "Anti-Aircraft Artillery"),
+                ("ACL", "Access Control List"),
+                ("ADC", "Analog-to-Digital Converter"),
+                ("A&B", "A & B"),
+                ("API", "Application Programming Interface"),
+                ("REST", "Representational State Transfer"),
+            ],
+        )
+
+    def test_table_rows(self):
+        """Test the pairs extracted from table rows"""
+
+        pairs = list(iter_acronym_pairs((TABLE_HTML,), lists=False))
+
+        self.assertEqual(
+            pairs,
+            [("HTML", "Hypertext Markup Language"), ("IP", "Internet Protocol")],
+        )
+
+    def test_table_rows_fast_path(self):
+        """Test that the table rows matched by regexes are the ones of the tokenizer"""
+
+        simple_table = f"<table>{SIMPLE_ROW_HTML * 3}</table>"
+        other_table = f"<table>{SIMPLE_ROW_HTML}{OTHER_ROWS_HTML}</table>"
+        spaced_table = f"<table>{SIMPLE_ROW_HTML.replace(' ', '  ')}</table>"
+
+        for html in (
+            simple_table,
+            other_table,
+            spaced_table,
+            TABLE_HTML,
+            simple_table + other_table,
+        ):
+            parser = WikipediaAcronymsParser(lists=False)
+            parser.feed(html)
+            parser.close()
+            expected = parser.pop_pairs()
+
+            for size in (1, 7, len(html)):
+                chunks = (html[i : i + size] for i in range(0, len(html), size))
+
+                self.assertEqual(
+                    list(iter_acronym_pairs(chunks, lists=False)), expected
+                )
+
+        self.assertEqual(
+            list(iter_acronym_pairs((other_table,), lists=False)),
+            [
+                ("HTTP", "Hypertext Transfer Protocol"),
+                ("B&C", "B & C"),
+                ("DS", "Double Space"),
+                ("ML", "Multi Line Meaning"),
+                ("Two Words", "Compact"),
+            ],
+        )
+
+    def test_chunks(self):
+        """Test that the pairs do not depend on how the HTML is split"""
+
+        html = LIST_HTML + TABLE_HTML
+        expected = list(iter_acronym_pairs((html,)))
+
+        for size in (1, 7, 64, 1000):
+            chunks = (html[i : i + size] for i in range(0, len(html), size))
+
+            self.assertEqual(list(iter_acronym_pairs(chunks)), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()